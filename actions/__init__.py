@@ -2,5 +2,10 @@
 Ações específicas que o agente consegue executar.
 Separadas por domínio:
 - system_actions: arquivos, pastas, apps
+- file_actions: busca e análise de arquivos (recursivas)
 - browser_actions: web, YouTube etc.
-"""
\ No newline at end of file
+- communication_actions: mensagens para o usuário
+
+Os módulos são carregados sob demanda pelo executor,
+a partir da coluna "handler" de core/command_registry.py.
+"""
@@ -1,7 +1,46 @@
 """
-browser_actions.py
-Aqui ficam ações ligadas ao navegador:
-- abrir_url(url)
-- pesquisar_no_youtube(termo)
-Hoje essas ações estão stubadas em executor.py
-"""
\ No newline at end of file
+⚡ SolAgent v1.2 - Browser Actions (Ações do Navegador)
+=====================================================
+
+Ações ligadas ao navegador: abrir páginas, YouTube e Google.
+Carregado sob demanda pelo Executor (ver core/command_registry.py):
+o módulo só é importado quando um dos seus comandos é usado.
+
+Assinatura dos handlers:
+- comando sem parâmetro: handler(log, safe_mode)
+- comando com parâmetro: handler(parametro, log, safe_mode)
+
+Autores: Mario, GitHub Copilot & Sol (ela mesma ajudou a se criar!)
+Versão: 1.2 (Audio Revolution) - Tríade Criativa
+Data: 28/10/2025
+"""
+
+import urllib.parse
+
+from core import side_effects
+
+# 🌐 FUNÇÕES DE NAVEGAÇÃO WEB
+
+def abrir_navegador(log, safe_mode: bool) -> None:
+    """🌐 Abre o navegador padrão do sistema"""
+    log.log("🌐 Abrindo navegador padrão...")
+    return side_effects.open_url("about:blank", log, safe_mode)
+
+def abrir_url(url: str, log, safe_mode: bool) -> None:
+    """🔗 Abre uma URL específica no navegador"""
+    log.log(f"🔗 Abrindo URL: {url}")
+    return side_effects.open_url(url, log, safe_mode)
+
+def pesquisar_no_youtube(termo: str, log, safe_mode: bool) -> None:
+    """🎥 Pesquisa um termo no YouTube"""
+    termo_encoded = urllib.parse.quote(termo)
+    search_url = f"https://www.youtube.com/results?search_query={termo_encoded}"
+    log.log(f"🎥 Pesquisando no YouTube: {termo}")
+    return side_effects.open_url(search_url, log, safe_mode)
+
+def pesquisar_google(termo: str, log, safe_mode: bool) -> None:
+    """🔍 Pesquisa um termo no Google"""
+    termo_encoded = urllib.parse.quote(termo)
+    search_url = f"https://www.google.com/search?q={termo_encoded}"
+    log.log(f"🔍 Pesquisando no Google: {termo}")
+    return side_effects.open_url(search_url, log, safe_mode)
@@ -0,0 +1,23 @@
+"""
+⚡ SolAgent v1.2 - Communication Actions (Ações de Comunicação)
+=============================================================
+
+Ações que só conversam com o usuário (sem efeitos no sistema).
+Carregado sob demanda pelo Executor (ver core/command_registry.py):
+o módulo só é importado quando um dos seus comandos é usado.
+
+Assinatura dos handlers:
+- comando sem parâmetro: handler(log, safe_mode)
+- comando com parâmetro: handler(parametro, log, safe_mode)
+
+Autores: Mario, GitHub Copilot & Sol (ela mesma ajudou a se criar!)
+Versão: 1.2 (Audio Revolution) - Tríade Criativa
+Data: 28/10/2025
+"""
+
+# 💬 FUNÇÕES DE COMUNICAÇÃO
+
+def falar_para_usuario(mensagem: str, log, safe_mode: bool = True) -> None:
+    """💬 Comunica diretamente com o usuário"""
+    log.log(f"💬 Respondendo ao usuário: {mensagem}")
+    print(f"🌟 Sol: {mensagem}")
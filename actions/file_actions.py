@@ -0,0 +1,444 @@
+"""
+⚡ SolAgent v1.2 - File Actions (Ações de Arquivos)
+=================================================
+
+Ações de busca e análise de arquivos em pastas inteiras
+(recursivas - além do listar_arquivos de uma pasta só).
+Carregado sob demanda pelo Executor (ver core/command_registry.py):
+o módulo só é importado quando um dos seus comandos é usado.
+
+Assinatura dos handlers:
+- comando sem parâmetro: handler(log, safe_mode)
+- comando com parâmetro: handler(parametro, log, safe_mode)
+
+Autores: Mario, GitHub Copilot & Sol (ela mesma ajudou a se criar!)
+Versão: 1.2 (Audio Revolution) - Tríade Criativa
+Data: 28/10/2025
+"""
+
+import hashlib
+import heapq
+import mmap
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from datetime import datetime
+
+from actions.system_actions import formatar_tamanho
+from core import file_index, watchdog
+
+# 📊 Quantos itens entram no "top" de tamanho_pasta
+TOP_N = 5
+
+# 🧵 Threads lendo pastas ao mesmo tempo (tarefa de E/S, não de CPU)
+DISK_WORKERS = 8
+
+# 🔒 Tempo de leitura da estimativa do modo seguro
+ESTIMATE_BUDGET_SECONDS = 2.0
+
+# 🧬 Duplicados: bytes lidos do início e do fim na 2ª etapa
+PARTIAL_HASH_BYTES = 64 * 1024
+
+# 🧬 Abaixo disso o hash roda no próprio processo (criar o pool custa mais)
+PROCESS_POOL_MIN_FILES = 64
+
+# 🧬 Grupos de duplicados (e arquivos por grupo) mostrados na resposta
+MAX_DUPLICATE_GROUPS = 10
+MAX_FILES_PER_GROUP = 5
+
+# 🔍 FUNÇÕES DE BUSCA
+
+def buscar_arquivo(termo: str, log, safe_mode: bool) -> None:
+    """
+    🔍 Procura arquivos pelo nome nas pastas indexadas
+
+    Só consulta o índice (core/file_index.py), então também roda no modo seguro.
+    """
+    termo = termo.strip()
+    log.log(f"🔍 Buscando arquivos: {termo}")
+    if not termo:
+        print("🌟 Sol: Me diga o nome (ou parte do nome) do arquivo")
+        return False
+
+    try:
+        indice = file_index.get_index(log=log)
+        inicio = time.perf_counter()
+        resultados = indice.search(termo)
+        log.debug(f"🔍 Busca por '{termo}' em {(time.perf_counter() - inicio) * 1000:.1f} ms")
+    except Exception as e:
+        log.error(f"❌ Erro ao buscar arquivos: {str(e)}")
+        print("🌟 Sol: Não consegui consultar o índice de arquivos")
+        return False
+
+    if not resultados:
+        if not indice.roots:
+            print("🌟 Sol: Nenhuma pasta está indexada - configure \"file_index_roots\" no config.json")
+            return False
+        if indice.refreshing or indice.last_refresh is None:
+            print(f"🌟 Sol: Não achei '{termo}' ainda - estou terminando de indexar suas pastas")
+        else:
+            print(f"🌟 Sol: Não encontrei arquivos com '{termo}' no nome")
+        return
+
+    print(f"🌟 Sol: Encontrei {len(resultados)} arquivo(s) com '{termo}':")
+    for resultado in resultados:
+        data = datetime.fromtimestamp(resultado["mtime"]).strftime("%d/%m/%Y") if resultado["mtime"] else "?"
+        print(f"  📄 {resultado['path']} ({formatar_tamanho(resultado['size'] or 0)}, {data})")
+    if indice.refreshing:
+        print("  ⏳ Ainda estou indexando - pode haver mais resultados daqui a pouco")
+
+# 💽 FUNÇÕES DE USO DE DISCO
+
+def tamanho_pasta(caminho: str, log, safe_mode: bool) -> None:
+    """
+    💽 Mostra o tamanho total de uma pasta e o que mais ocupa espaço
+
+    No modo seguro faz só uma estimativa rápida (leitura limitada no tempo).
+    """
+    caminho = caminho.strip() or "."
+    log.log(f"💽 Calculando tamanho de: {caminho}")
+    if not os.path.isdir(caminho):
+        print(f"🌟 Sol: O caminho {caminho} não existe ou não é uma pasta")
+        return False
+
+    cancelamento = watchdog.cancel_event()
+    try:
+        resultado = medir_pasta(caminho, deadline=ESTIMATE_BUDGET_SECONDS if safe_mode else None,
+                                cancel_event=cancelamento)
+    except KeyboardInterrupt:
+        log.warning("🚫 Cálculo de tamanho cancelado pelo usuário")
+        print("🌟 Sol: Cálculo cancelado")
+        return False
+    except Exception as e:
+        log.error(f"❌ Erro ao calcular tamanho: {str(e)}")
+        return False
+
+    if cancelamento is not None and cancelamento.is_set():
+        log.warning(f"🚫 Cálculo de tamanho interrompido após {resultado['dirs']} pastas")
+        return False
+
+    log.debug(f"💽 {resultado['dirs']} pastas lidas em {resultado['duration']:.1f}s "
+              f"({resultado['skipped_dirs']} não lidas, {resultado['errors']} erros)")
+
+    if resultado["partial"]:
+        print(f"🌟 Sol: (Modo seguro) Estimativa rápida: {caminho} ocupa pelo menos "
+              f"{formatar_tamanho(resultado['total'])} - {resultado['skipped_dirs']} pastas ficaram sem leitura")
+    else:
+        print(f"🌟 Sol: {caminho} ocupa {formatar_tamanho(resultado['total'])} "
+              f"({resultado['files']} arquivos em {resultado['dirs']} pastas)")
+
+    if resultado["top_folders"]:
+        print("  📁 Maiores pastas:")
+        for pasta, tamanho in resultado["top_folders"]:
+            print(f"     {formatar_tamanho(tamanho):>10}  {os.path.basename(pasta)}")
+    if resultado["top_files"]:
+        print("  📄 Maiores arquivos:")
+        for arquivo, tamanho in resultado["top_files"]:
+            print(f"     {formatar_tamanho(tamanho):>10}  {os.path.relpath(arquivo, caminho)}")
+
+def medir_pasta(caminho: str, top_n: int = TOP_N, workers: int = DISK_WORKERS,
+                deadline: float = None, cancel_event=None) -> dict:
+    """
+    📏 Soma o tamanho de uma árvore de pastas com várias threads
+
+    Cada pasta é uma tarefa: a thread lê a pasta com os.scandir e devolve
+    o tamanho dos arquivos, os maiores deles e as subpastas, que viram
+    novas tarefas. O total é agrupado pela subpasta direta de `caminho`.
+
+    Args:
+        deadline (float): Segundos de leitura; depois disso as pastas
+            restantes não são lidas e o resultado sai marcado como parcial
+        cancel_event (threading.Event): Se sinalizado, para como no deadline
+
+    Returns:
+        dict: total, files, dirs, top_folders, top_files, skipped_dirs,
+              errors, partial, duration
+    """
+    inicio = time.perf_counter()
+    limite = inicio + deadline if deadline is not None else None
+
+    por_pasta = {}          # subpasta direta -> bytes
+    maiores_arquivos = []   # heap mínimo limitado a top_n: (tamanho, caminho)
+    resultado = {"total": 0, "files": 0, "dirs": 0, "skipped_dirs": 0, "errors": 0}
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sol-du") as pool:
+        pendentes = {pool.submit(_ler_pasta, caminho, top_n): None}
+        while pendentes:
+            prontos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in prontos:
+                grupo = pendentes.pop(futuro)
+                total, n_arquivos, maiores, subpastas, erros = futuro.result()
+
+                resultado["total"] += total
+                resultado["files"] += n_arquivos
+                resultado["dirs"] += 1
+                resultado["errors"] += erros
+                if grupo is not None:
+                    por_pasta[grupo] += total
+
+                for item in maiores:
+                    if len(maiores_arquivos) < top_n:
+                        heapq.heappush(maiores_arquivos, item)
+                    elif item > maiores_arquivos[0]:
+                        heapq.heapreplace(maiores_arquivos, item)
+
+                if ((limite is not None and time.perf_counter() > limite)
+                        or (cancel_event is not None and cancel_event.is_set())):
+                    resultado["skipped_dirs"] += len(subpastas)
+                    continue
+                for subpasta in subpastas:
+                    chave = grupo if grupo is not None else subpasta
+                    por_pasta.setdefault(chave, 0)
+                    pendentes[pool.submit(_ler_pasta, subpasta, top_n)] = chave
+
+    resultado["top_folders"] = heapq.nlargest(top_n, por_pasta.items(), key=lambda item: item[1])
+    resultado["top_files"] = [(arquivo, tamanho) for tamanho, arquivo in sorted(maiores_arquivos, reverse=True)]
+    resultado["partial"] = resultado["skipped_dirs"] > 0
+    resultado["duration"] = time.perf_counter() - inicio
+    return resultado
+
+def _ler_pasta(caminho: str, top_n: int):
+    """📂 Uma pasta (sem recursão): total, nº de arquivos, maiores, subpastas, erros"""
+    total = 0
+    n_arquivos = 0
+    maiores = []
+    subpastas = []
+    erros = 0
+    try:
+        with os.scandir(caminho) as entradas:
+            for entrada in entradas:
+                try:
+                    # Links e junções não são seguidos (evita contar duas vezes e ciclos)
+                    if entrada.is_symlink() or (hasattr(entrada, "is_junction") and entrada.is_junction()):
+                        continue
+                    if entrada.is_dir(follow_symlinks=False):
+                        subpastas.append(entrada.path)
+                        continue
+                    tamanho = entrada.stat(follow_symlinks=False).st_size
+                except OSError:
+                    erros += 1
+                    continue
+                total += tamanho
+                n_arquivos += 1
+                if len(maiores) < top_n:
+                    heapq.heappush(maiores, (tamanho, entrada.path))
+                elif tamanho > maiores[0][0]:
+                    heapq.heapreplace(maiores, (tamanho, entrada.path))
+    except OSError:
+        erros += 1
+    return total, n_arquivos, maiores, subpastas, erros
+
+# 🧬 FUNÇÕES DE DUPLICADOS
+
+def encontrar_duplicados(caminho: str, log, safe_mode: bool) -> None:
+    """
+    🧬 Procura arquivos duplicados (mesmo conteúdo) dentro de uma pasta
+
+    Só mostra o que encontrou - nenhum arquivo é apagado, em nenhum modo.
+    """
+    caminho = caminho.strip() or "."
+    log.log(f"🧬 Procurando duplicados em: {caminho}")
+    if not os.path.isdir(caminho):
+        print(f"🌟 Sol: O caminho {caminho} não existe ou não é uma pasta")
+        return False
+
+    cancelamento = watchdog.cancel_event()
+    try:
+        resultado = achar_duplicados(caminho, cancel_event=cancelamento)
+    except KeyboardInterrupt:
+        log.warning("🚫 Busca de duplicados cancelada pelo usuário")
+        print("🌟 Sol: Busca de duplicados cancelada")
+        return False
+    except Exception as e:
+        log.error(f"❌ Erro ao procurar duplicados: {str(e)}")
+        return False
+
+    if resultado["cancelled"]:
+        log.warning(f"🚫 Busca de duplicados interrompida após {resultado['duration']:.1f}s")
+        return False
+
+    etapas = resultado["stages"]
+    log.debug(f"🧬 {etapas['files']} arquivos -> {etapas['same_size']} com tamanho repetido -> "
+              f"{etapas['same_partial']} com início/fim iguais -> {etapas['duplicates']} duplicados "
+              f"({resultado['duration']:.1f}s)")
+
+    grupos = resultado["groups"]
+    if not grupos:
+        print(f"🌟 Sol: Nenhum arquivo duplicado em {caminho} ({etapas['files']} arquivos verificados)")
+        return
+
+    print(f"🌟 Sol: Encontrei {len(grupos)} grupo(s) de arquivos iguais em {caminho} - "
+          f"dá para liberar {formatar_tamanho(resultado['wasted'])}:")
+    for tamanho, arquivos in grupos[:MAX_DUPLICATE_GROUPS]:
+        print(f"  🧬 {len(arquivos)} cópias de {formatar_tamanho(tamanho)}:")
+        for arquivo in sorted(arquivos)[:MAX_FILES_PER_GROUP]:
+            print(f"     📄 {os.path.relpath(arquivo, caminho)}")
+        if len(arquivos) > MAX_FILES_PER_GROUP:
+            print(f"     ... e mais {len(arquivos) - MAX_FILES_PER_GROUP} cópias")
+    if len(grupos) > MAX_DUPLICATE_GROUPS:
+        print(f"  📦 ... e mais {len(grupos) - MAX_DUPLICATE_GROUPS} grupos")
+    if safe_mode:
+        print("  🔒 (Modo seguro) Nada foi apagado - só estou mostrando o que encontrei")
+
+def achar_duplicados(caminho: str, cancel_event=None) -> dict:
+    """
+    🧬 Pipeline em etapas - cada uma só recebe os candidatos da anterior
+
+    1. Agrupa por tamanho (só metadados, nenhum byte lido); hardlinks
+       para o mesmo arquivo contam uma vez só
+    2. Hash dos primeiros e últimos 64 KB (arquivos pequenos terminam aqui)
+    3. Hash completo via mmap só do que ainda colide
+
+    Os hashes das etapas 2 e 3 rodam em um pool de processos.
+
+    Args:
+        cancel_event (threading.Event): Se sinalizado, para entre pastas,
+            entre etapas e entre hashes (o pool é desligado na hora)
+
+    Returns:
+        dict: groups [(tamanho, [arquivos])] do maior desperdício para o
+              menor, wasted (bytes), stages (contagens), duration,
+              cancelled (True = interrompido, grupos incompletos)
+    """
+    inicio = time.perf_counter()
+    grupos = []
+    candidatos = []
+    parciais = []
+    n_arquivos = 0
+
+    def resultado(cancelado: bool) -> dict:
+        return {
+            "groups": grupos,
+            "wasted": sum(tamanho * (len(arquivos) - 1) for tamanho, arquivos in grupos),
+            "stages": {
+                "files": n_arquivos,
+                "same_size": len(candidatos),
+                "same_partial": sum(len(arquivos) for _, arquivos in parciais or []),
+                "duplicates": sum(len(arquivos) for _, arquivos in grupos),
+            },
+            "duration": time.perf_counter() - inicio,
+            "cancelled": cancelado,
+        }
+
+    # 1️⃣ Tamanho
+    por_tamanho = {}
+    vistos = set()
+    for info, arquivo in _arquivos_recursivo(caminho, cancel_event):
+        n_arquivos += 1
+        # Hardlink: mesmo (dispositivo, inode) = mesmo arquivo, não é duplicado
+        if info.st_nlink > 1:
+            chave = (info.st_dev, info.st_ino)
+            if chave in vistos:
+                continue
+            vistos.add(chave)
+        if info.st_size > 0:
+            por_tamanho.setdefault(info.st_size, []).append(arquivo)
+    if _cancelado(cancel_event):
+        return resultado(True)
+    candidatos = [(tamanho, arquivo) for tamanho, arquivos in por_tamanho.items()
+                  if len(arquivos) > 1 for arquivo in arquivos]
+
+    # 2️⃣ Início + fim
+    parciais = _agrupar_por_hash(candidatos, _hash_parcial, cancel_event)
+    if parciais is None:
+        return resultado(True)
+    pequenos = [grupo for grupo in parciais if grupo[0] <= 2 * PARTIAL_HASH_BYTES]
+    restantes = [(tamanho, arquivo) for tamanho, arquivos in parciais
+                 if tamanho > 2 * PARTIAL_HASH_BYTES for arquivo in arquivos]
+
+    # 3️⃣ Conteúdo completo
+    completos = _agrupar_por_hash(restantes, _hash_completo, cancel_event)
+    if completos is None:
+        return resultado(True)
+    grupos = pequenos + completos
+    grupos.sort(key=lambda grupo: grupo[0] * (len(grupo[1]) - 1), reverse=True)
+    return resultado(False)
+
+def _cancelado(cancel_event) -> bool:
+    return cancel_event is not None and cancel_event.is_set()
+
+def _agrupar_por_hash(candidatos: list, funcao_hash, cancel_event=None):
+    """
+    🔀 [(tamanho, arquivo)] -> [(tamanho, [arquivos])] com 2+ arquivos de mesmo hash
+
+    Retorna None se cancel_event foi sinalizado no meio - os blocos do
+    pool que ainda não começaram são descartados.
+    """
+    if not candidatos:
+        return []
+
+    arquivos = [arquivo for _, arquivo in candidatos]
+    hashes = []
+    if len(arquivos) >= PROCESS_POOL_MIN_FILES:
+        pool = ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+        cancelado = False
+        try:
+            for digest in pool.map(funcao_hash, arquivos, chunksize=16):
+                if _cancelado(cancel_event):
+                    cancelado = True
+                    return None
+                hashes.append(digest)
+        finally:
+            # Cancelado: não espera os blocos que restam (nem os que já rodam)
+            pool.shutdown(wait=not cancelado, cancel_futures=cancelado)
+    else:
+        for arquivo in arquivos:
+            if _cancelado(cancel_event):
+                return None
+            hashes.append(funcao_hash(arquivo))
+
+    grupos = {}
+    for (tamanho, arquivo), digest in zip(candidatos, hashes):
+        if digest is not None:  # arquivo ilegível fica de fora
+            grupos.setdefault((tamanho, digest), []).append(arquivo)
+    return [(tamanho, lista) for (tamanho, _), lista in grupos.items() if len(lista) > 1]
+
+def _hash_parcial(arquivo: str):
+    """🧬 Hash dos primeiros e últimos PARTIAL_HASH_BYTES (o arquivo todo se for pequeno)"""
+    try:
+        digest = hashlib.blake2b(digest_size=16)
+        with open(arquivo, "rb") as f:
+            digest.update(f.read(PARTIAL_HASH_BYTES))
+            tamanho = os.fstat(f.fileno()).st_size
+            if tamanho > PARTIAL_HASH_BYTES:
+                f.seek(max(PARTIAL_HASH_BYTES, tamanho - PARTIAL_HASH_BYTES))
+                digest.update(f.read(PARTIAL_HASH_BYTES))
+        return digest.hexdigest()
+    except OSError:
+        return None
+
+def _hash_completo(arquivo: str):
+    """🧬 Hash do conteúdo inteiro via mmap (sem copiar o arquivo para a memória do processo)"""
+    try:
+        digest = hashlib.blake2b(digest_size=16)
+        with open(arquivo, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            bloco = 1024 * 1024
+            # memoryview: fatia sem cópia (mapa[a:b] criaria um bytes por bloco)
+            with memoryview(mapa) as vista:
+                for inicio in range(0, len(vista), bloco):
+                    digest.update(vista[inicio:inicio + bloco])
+        return digest.hexdigest()
+    except (OSError, ValueError):
+        return None
+
+def _arquivos_recursivo(caminho: str, cancel_event=None):
+    """🚶 Gera (stat, arquivo) de toda a árvore, sem seguir links (para se cancelado)"""
+    pilha = [caminho]
+    while pilha:
+        if _cancelado(cancel_event):
+            return
+        pasta = pilha.pop()
+        try:
+            with os.scandir(pasta) as entradas:
+                for entrada in entradas:
+                    try:
+                        if entrada.is_symlink() or (hasattr(entrada, "is_junction") and entrada.is_junction()):
+                            continue
+                        if entrada.is_dir(follow_symlinks=False):
+                            pilha.append(entrada.path)
+                        elif entrada.is_file(follow_symlinks=False):
+                            yield entrada.stat(follow_symlinks=False), entrada.path
+                    except OSError:
+                        continue
+        except OSError:
+            continue
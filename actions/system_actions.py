@@ -1,8 +1,315 @@
 """
-system_actions.py
-Aqui vão morar funções como:
-- abrir_explorador()
-- criar_pasta(caminho)
-- abrir_programa('Canva', etc)
-No momento essas funções estão stubadas dentro de executor.py
-"""
\ No newline at end of file
+⚡ SolAgent v1.2 - System Actions (Ações do Sistema)
+==================================================
+
+Ações ligadas ao sistema local: arquivos, pastas, programas e informações.
+Carregado sob demanda pelo Executor (ver core/command_registry.py):
+o módulo só é importado quando um dos seus comandos é usado.
+
+Assinatura dos handlers:
+- comando sem parâmetro: handler(log, safe_mode)
+- comando com parâmetro: handler(parametro, log, safe_mode)
+
+Autores: Mario, GitHub Copilot & Sol (ela mesma ajudou a se criar!)
+Versão: 1.2 (Audio Revolution) - Tríade Criativa
+Data: 28/10/2025
+"""
+
+import heapq
+import os
+from datetime import datetime
+
+from core import metrics_sampler, side_effects, watchdog
+
+# 📏 Limite de saída de executar_comando (acima disso o processo é encerrado)
+MAX_COMMAND_OUTPUT_BYTES = 256 * 1024
+
+# 📈 Janela da tendência em mostrar_status_sistema
+STATUS_TREND_SECONDS = 300
+
+# 📋 Itens por página de listar_arquivos
+ITENS_POR_PAGINA = 10
+
+# 💻 FUNÇÕES DO SISTEMA LOCAL
+
+def abrir_explorador(log, safe_mode: bool) -> None:
+    """📁 Abre o gerenciador de arquivos (Explorer no Windows, xdg-open no Linux)"""
+    log.log("📁 Abrindo explorador de arquivos...")
+    try:
+        side_effects.get_launcher(log, safe_mode).open_file_manager()
+        log.log("✅ Explorador aberto com sucesso")
+    except Exception as e:
+        log.error(f"❌ Erro ao abrir explorador: {str(e)}")
+        return False
+
+def criar_pasta(pasta: str, log, safe_mode: bool) -> None:
+    """📂 Cria uma nova pasta no sistema"""
+    log.log(f"📂 Criando pasta em: {pasta}")
+    try:
+        side_effects.make_dirs(pasta, safe_mode)
+        log.log(f"✅ Pasta criada com sucesso: {pasta}")
+    except Exception as e:
+        log.error(f"❌ Erro ao criar pasta: {str(e)}")
+        return False
+
+def abrir_programa(programa: str, log, safe_mode: bool) -> None:
+    """
+    🚀 Abre um programa/aplicativo
+    
+    Nomes comuns ("calculadora", "bloco", "terminal") são mapeados para o
+    programa de cada sistema em core/launcher.py; o programa é executado
+    direto, sem shell. Um arquivo existente abre com o programa padrão.
+    """
+    log.log(f"🚀 Abrindo programa: {programa}")
+    try:
+        abridor = side_effects.get_launcher(log, safe_mode)
+        try:
+            abridor.launch(programa)
+        except FileNotFoundError:
+            if not os.path.exists(programa.strip('"')):
+                log.error(f"❌ Programa não encontrado: {programa}")
+                print(f"🌟 Sol: Não encontrei o programa '{programa}' neste computador")
+                return False
+            abridor.open(programa.strip('"'))
+        log.log(f"✅ Programa {programa} aberto com sucesso")
+    except Exception as e:
+        log.error(f"❌ Erro ao abrir programa {programa}: {str(e)}")
+        return False
+
+def listar_arquivos(caminho: str, log, safe_mode: bool) -> None:
+    """
+    📋 Lista arquivos de um diretório, uma página por vez
+
+    Opções depois do caminho: "C:\\x|pagina=3|ordem=tamanho"
+    (ordem: nome, tamanho ou data). Pastas enormes são lidas em streaming
+    com os.scandir - só a janela da página fica em memória.
+    """
+    caminho, pagina, ordem = _parse_opcoes_listagem(caminho)
+    log.log(f"📋 Listando arquivos em: {caminho} (página {pagina}, ordem: {ordem})")
+    # Só leitura: roda igual nos dois modos (o modo seguro não altera nada aqui)
+    try:
+        if os.path.isdir(caminho):
+            total = [0]
+
+            def contar(entradas):
+                for entrada in entradas:
+                    total[0] += 1
+                    yield entrada
+
+            # 🏔️ Heap limitado ao fim da página: memória O(pagina * itens)
+            chave, decrescente = _ORDENACOES[ordem]
+            janela = pagina * ITENS_POR_PAGINA
+            selecionar = heapq.nlargest if decrescente else heapq.nsmallest
+            topo = selecionar(janela, contar(_iter_entradas(caminho)), key=chave)
+            itens = topo[janela - ITENS_POR_PAGINA:]
+
+            paginas = max(1, -(-total[0] // ITENS_POR_PAGINA))
+            print(f"🌟 Sol: Encontrei {total[0]} itens em {caminho} (página {pagina} de {paginas}):")
+            for entrada in itens:
+                if _eh_pasta(entrada):
+                    print(f"  📁 {entrada.name}")
+                else:
+                    print(f"  📄 {entrada.name} ({formatar_tamanho(_tamanho(entrada))})")
+            if not itens:
+                print("  📭 Nenhum item nesta página")
+            if pagina < paginas:
+                print(f"  📦 Próxima página: listar_arquivos:{caminho}|pagina={pagina + 1}|ordem={ordem}")
+        elif os.path.exists(caminho):
+            print(f"🌟 Sol: {caminho} não é uma pasta")
+            return False
+        else:
+            print(f"🌟 Sol: O caminho {caminho} não existe")
+            return False
+    except Exception as e:
+        log.error(f"❌ Erro ao listar arquivos: {str(e)}")
+        return False
+
+def _parse_opcoes_listagem(argumento: str):
+    """✂️ "C:\\x|pagina=3|ordem=data" -> ("C:\\x", 3, "data")"""
+    caminho, *opcoes = argumento.split("|")
+    pagina, ordem = 1, "nome"
+    for opcao in opcoes:
+        nome, _, valor = opcao.partition("=")
+        nome, valor = nome.strip().lower(), valor.strip().lower()
+        if nome == "pagina" and valor.isdigit():
+            pagina = max(1, int(valor))
+        elif nome == "ordem" and valor in _ORDENACOES:
+            ordem = valor
+    return caminho.strip() or ".", pagina, ordem
+
+def _iter_entradas(caminho: str):
+    """🚶 Gera os DirEntry da pasta sem montar a lista inteira"""
+    with os.scandir(caminho) as entradas:
+        yield from entradas
+
+def _eh_pasta(entrada) -> bool:
+    # DirEntry guarda o tipo lido junto com o nome: sem stat extra
+    try:
+        return entrada.is_dir()
+    except OSError:
+        return False
+
+def _tamanho(entrada) -> int:
+    try:
+        return entrada.stat().st_size
+    except OSError:
+        return 0
+
+def _data_modificacao(entrada) -> float:
+    try:
+        return entrada.stat().st_mtime
+    except OSError:
+        return 0.0
+
+def formatar_tamanho(tamanho: float) -> str:
+    """📏 1536 -> "1.5 KB" (usado também pelas ações de arquivos)"""
+    for unidade in ("B", "KB", "MB", "GB"):
+        if tamanho < 1024:
+            return f"{tamanho:.0f} {unidade}" if unidade == "B" else f"{tamanho:.1f} {unidade}"
+        tamanho /= 1024
+    return f"{tamanho:.1f} TB"
+
+# 🔀 ordem -> (chave, decrescente). Pastas vêm antes dos arquivos na ordem por nome.
+_ORDENACOES = {
+    "nome": (lambda e: (not _eh_pasta(e), e.name.casefold()), False),
+    "tamanho": (_tamanho, True),
+    "data": (_data_modificacao, True),
+}
+
+# 📊 FUNÇÕES DE INFORMAÇÕES DO SISTEMA
+
+def obter_data_atual(log, safe_mode: bool) -> None:
+    """📅 Obtém e exibe a data atual"""
+    hoje = datetime.now().strftime("%d/%m/%Y")
+    log.log(f"📅 Data atual detectada: {hoje}")
+    print(f"🌟 Sol: Hoje é {hoje}")
+
+def obter_hora_atual(log, safe_mode: bool) -> None:
+    """⏰ Obtém e exibe a hora atual"""
+    agora = datetime.now().strftime("%H:%M:%S")
+    log.log(f"⏰ Hora atual detectada: {agora}")
+    print(f"🌟 Sol: Agora são {agora}")
+
+def mostrar_status_sistema(log, safe_mode: bool) -> None:
+    """📊 Mostra informações do sistema: valores atuais e tendência recente"""
+    log.log("📊 Coletando informações do sistema...")
+    try:
+        # Amostras coletadas em segundo plano pelo monitor (core/metrics_sampler.py)
+        foto = metrics_sampler.get_sampler(log=log).snapshot(window_seconds=STATUS_TREND_SECONDS)
+        sistema = foto["system"]
+        atual = foto["current"]
+        minutos = STATUS_TREND_SECONDS // 60
+        
+        print("🌟 Sol: Aqui estão as informações do seu sistema:")
+        print(f"  💻 Sistema: {sistema['system']} {sistema['release']}")
+        print(f"  🔧 Processador: {sistema['processor']} ({sistema['cpu_count']} núcleos)")
+        print(f"  📅 Data/Hora: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
+        
+        if metrics_sampler.PSUTIL_AVAILABLE:
+            memoria = foto["memory"]
+            print(f"  ⚙️ CPU: {atual['cpu']:.0f}% agora{_tendencia(foto, 'cpu', minutos)}")
+            print(f"  🧠 Memória: {round(memoria.total / (1024**3), 1)}GB total, "
+                  f"{round(memoria.available / (1024**3), 1)}GB disponível "
+                  f"({atual['memory']:.0f}% em uso){_tendencia(foto, 'memory', minutos)}")
+        
+        disco = foto["disk"]
+        if disco:
+            print(f"  💾 Disco {foto['disk_path']}: {round(disco.total / (1024**3), 1)}GB total, "
+                  f"{round(disco.free / (1024**3), 1)}GB livre")
+        
+        if foto["top_processes"]:
+            processos = ", ".join(f"{p['name']} ({p['cpu']:.0f}% CPU, {p['memory_mb']:.0f} MB)"
+                                  for p in foto["top_processes"][:3])
+            print(f"  🏃 Processos mais ativos: {processos}")
+        
+        if not metrics_sampler.PSUTIL_AVAILABLE:
+            print("  📝 Para informações detalhadas de CPU/memória, instale: pip install psutil")
+        
+    except Exception as e:
+        log.error(f"❌ Erro ao obter status do sistema: {str(e)}")
+        print("🌟 Sol: Não consegui obter todas as informações do sistema")
+        return False
+
+def _tendencia(foto: dict, campo: str, minutos: int) -> str:
+    """📈 " | últimos 5 min: média 18%, mín 5%, máx 60%" (vazio sem histórico)"""
+    tendencia = foto["trends"].get(campo)
+    if not tendencia or tendencia["samples"] < 2:
+        return ""
+    return (f" | últimos {minutos} min: média {tendencia['mean']:.0f}%, "
+            f"mín {tendencia['min']:.0f}%, máx {tendencia['max']:.0f}%")
+
+def executar_comando(comando: str, log, safe_mode: bool) -> None:
+    """
+    ⚙️ Executa comandos seguros do sistema Windows
+    
+    A saída aparece linha a linha enquanto o comando roda (Ctrl+C cancela).
+    Cada comando tem seu próprio timeout; saídas gigantes são truncadas.
+    Retorna False em caso de falha (o resultado não vai para o cache).
+    """
+    log.log(f"⚙️ Comando solicitado: {comando}")
+    
+    # 🛡️ LISTA DE COMANDOS SEGUROS PERMITIDOS (comando, timeout em segundos)
+    comandos_seguros = {
+        "ipconfig": ("ipconfig", 10),
+        "date": ("date /t", 5),
+        "time": ("time /t", 5),
+        "dir": ("dir", 10),
+        "whoami": ("whoami", 5),
+        "hostname": ("hostname", 5),
+        "systeminfo": ("systeminfo | findstr /C:\"OS Name\" /C:\"Total Physical Memory\"", 60),
+        "tasklist": ("tasklist", 30)
+    }
+    
+    chave = comando.strip().lower()
+    if chave in comandos_seguros:
+        linha_comando, timeout = comandos_seguros[chave]
+        if not safe_mode:
+            print(f"🌟 Sol: Resultado do comando '{comando}':")
+        
+        def mostrar_linha(linha: str) -> None:
+            print(f"  {linha}")
+            log.debug(f"⚙️ [{comando}] {linha}")
+        
+        try:
+            resultado = side_effects.run_command(
+                linha_comando,
+                safe_mode,
+                on_line=mostrar_linha,
+                timeout=timeout,
+                max_output_bytes=MAX_COMMAND_OUTPUT_BYTES,
+                cancel_event=watchdog.cancel_event()
+            )
+            log.log(f"⚙️ Comando '{comando}' terminou em {resultado['duration']:.1f}s (código {resultado['returncode']})")
+            
+            if resultado["stderr"]:
+                log.warning(f"⚠️ Avisos do comando: {resultado['stderr']}")
+            if resultado["cancelled"]:
+                log.warning(f"🚫 Comando '{comando}' interrompido")
+                return False
+            if resultado["timed_out"]:
+                log.error("⏰ Comando demorou muito para executar")
+                print("🌟 Sol: O comando demorou muito para responder")
+                return False
+            if resultado["returncode"] != 0:
+                # Ex.: 127 (comando não encontrado), "date /t" fora do Windows
+                log.error(f"❌ Comando '{comando}' falhou com código {resultado['returncode']}")
+                print(f"🌟 Sol: O comando '{comando}' falhou (código {resultado['returncode']})")
+                return False
+            if resultado["truncated"]:
+                log.warning(f"⚠️ Saída do comando '{comando}' truncada")
+                print("🌟 Sol: A saída era grande demais, mostrei só o começo")
+                return False
+        except KeyboardInterrupt:
+            log.warning(f"🚫 Comando '{comando}' cancelado pelo usuário")
+            print("🌟 Sol: Comando cancelado")
+            return False
+        except Exception as e:
+            log.error(f"❌ Erro ao executar comando: {str(e)}")
+            print("🌟 Sol: Houve um erro ao executar o comando")
+            return False
+    else:
+        log.warning(f"⚠️ Comando não permitido ou desconhecido: {comando}")
+        comandos_disponiveis = ", ".join(comandos_seguros.keys())
+        print(f"🌟 Sol: Comando '{comando}' não é permitido por segurança")
+        print(f"     Comandos disponíveis: {comandos_disponiveis}")
+        return False
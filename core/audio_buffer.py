@@ -0,0 +1,192 @@
+"""
+⚡ SolAgent v1.2 - Audio Buffer (Memória da Gravação)
+====================================================
+
+Buffer float32 pré-alocado onde o callback do microfone grava.
+Cada bloco do sounddevice vira UMA cópia de fatia NumPy - nada de
+um objeto Python por amostra (nem alocação) dentro do callback de
+tempo real.
+
+Funcionalidades:
+- Pré-alocado uma vez para o limite inteiro (max_seconds - ex.: 30s a
+  16 kHz = 1,9 MB) e reaproveitado entre gravações
+- Limite configurável de duração (max_seconds)
+- Cheio: vira buffer circular e guarda os últimos max_seconds
+- Um produtor (callback), leitores sem lock: o índice de escrita
+  só avança depois que as amostras estão no array
+- view() sem cópia; read_since() para quem lê durante a gravação
+
+Autores: Mario, GitHub Copilot & Sol (ela mesma ajudou a se criar!)
+Versão: 1.2 (Audio Revolution) - Tríade Criativa
+Data: 28/10/2025
+"""
+
+from typing import Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class CaptureBuffer:
+    """
+    🎙️ BUFFER DE CAPTURA (um produtor, leitores sem lock)
+
+    O callback do áudio é o único que chama write(). Leitores usam
+    samples_written (total já gravado) e view()/read_since().
+
+    Ordem de publicação: amostras copiadas -> índice de escrita
+    avançado. Um leitor que lê o índice primeiro e o array depois sempre
+    enxerga amostras completas.
+
+    O array nunca é trocado: crescer dentro do callback (alocar + copiar
+    a gravação inteira) causaria overruns justamente nas gravações longas.
+    """
+
+    def __init__(self, sample_rate: int, max_seconds: float):
+        self.sample_rate = sample_rate
+        self.max_samples = max(1, int(sample_rate * max_seconds))
+        self._data = np.empty(self.max_samples, dtype=np.float32)
+        self._data.fill(0.0)  # toca todas as páginas agora, não no primeiro write
+        self._written = 0
+
+    @property
+    def samples_written(self) -> int:
+        """📏 Total de amostras já gravadas (inclui as sobrescritas no modo circular)"""
+        return self._written
+
+    @property
+    def size(self) -> int:
+        """📏 Amostras guardadas agora (no máximo max_samples)"""
+        return min(self._written, self.max_samples)
+
+    @property
+    def seconds(self) -> float:
+        return self.size / self.sample_rate
+
+    @property
+    def full(self) -> bool:
+        """⏱️ Já gravou max_seconds (daqui em diante sobrescreve o começo)"""
+        return self._written >= self.max_samples
+
+    @property
+    def nbytes(self) -> int:
+        """💾 Memória alocada"""
+        return self._data.nbytes
+
+    def clear(self) -> None:
+        """🧹 Nova gravação (mantém a memória já alocada)"""
+        self._written = 0
+
+    def write(self, block) -> None:
+        """
+        ✍️ Grava um bloco (só o produtor chama)
+
+        block: array 1-D float32 - ex.: indata[:, 0] do sounddevice
+        """
+        n = len(block)
+        if n == 0:
+            return
+        if n > self.max_samples:
+            block = block[-self.max_samples:]
+            self._written += n - self.max_samples
+            n = self.max_samples
+
+        start = self._written
+        end = start + n
+        data = self._data
+        if end <= self.max_samples:
+            data[start:end] = block
+        else:
+            # 🔁 Circular: parte no fim do array, parte no começo
+            position = start % self.max_samples
+            first = min(n, self.max_samples - position)
+            data[position:position + first] = block[:first]
+            data[:n - first] = block[first:]
+        self._written = end
+
+    def view(self):
+        """
+        👀 Amostras guardadas em ordem cronológica
+
+        Sem cópia enquanto não deu a volta; depois do limite junta as
+        duas partes do buffer circular (cópia).
+        """
+        written = self._written
+        data = self._data
+        if written <= self.max_samples:
+            return data[:written]
+        position = written % self.max_samples
+        return np.concatenate((data[position:], data[:position]))
+
+    def read_since(self, position: int) -> Tuple["np.ndarray", int]:
+        """
+        📖 Amostras gravadas desde `position` (contagem de samples_written)
+
+        Returns:
+            tuple: (amostras novas em ordem, nova posição) - o que já foi
+                   sobrescrito no modo circular é pulado
+        """
+        written = self._written
+        data = self._data
+        position = max(position, written - self.max_samples, 0)
+        if position >= written:
+            return data[:0], written
+        if written <= self.max_samples:
+            return data[position:written], written
+        start = position % self.max_samples
+        end = written % self.max_samples
+        if start < end:
+            return data[start:end], written
+        return np.concatenate((data[start:], data[:end])), written
+
+# 🎯 EXEMPLO DE USO E TESTE
+if __name__ == "__main__":
+    import sys
+    import time
+
+    print("🎙️ SolAgent Audio Buffer v1.2 - Testando...")
+    if not NUMPY_AVAILABLE:
+        print("⚠️ numpy não instalado - nada a testar")
+        sys.exit(0)
+
+    buffer = CaptureBuffer(sample_rate=10, max_seconds=3)
+    memoria = buffer._data
+    for inicio in range(0, 30, 5):
+        buffer.write(np.arange(inicio, inicio + 5, dtype=np.float32))
+        if inicio == 10:
+            assert buffer.view().tolist() == list(range(15)) and not buffer.full
+    assert buffer.full and buffer.size == 30
+    assert buffer.view().tolist() == list(range(30))
+
+    assert buffer._data is memoria  # nenhuma realocação durante a gravação
+    buffer.write(np.arange(30, 40, dtype=np.float32))
+    assert buffer.view().tolist() == list(range(10, 40)), buffer.view()
+    novos, posicao = buffer.read_since(35)
+    assert novos.tolist() == [35, 36, 37, 38, 39] and posicao == 40
+    assert buffer.read_since(0)[0].tolist() == list(range(10, 40))
+
+    # ⏱️ Callback: lista de floats x cópia de fatia (blocos de 1024 a 16 kHz)
+    bloco = np.random.randn(1024, 1).astype(np.float32)
+    segundos = 30
+    blocos = segundos * 16000 // 1024
+
+    lista = []
+    inicio = time.perf_counter()
+    for _ in range(blocos):
+        lista.extend(bloco[:, 0])
+    por_bloco_lista = (time.perf_counter() - inicio) / blocos * 1e6
+    memoria_lista = sys.getsizeof(lista) + len(lista) * sys.getsizeof(lista[0])
+
+    buffer = CaptureBuffer(16000, max_seconds=60)
+    inicio = time.perf_counter()
+    for _ in range(blocos):
+        buffer.write(bloco[:, 0])
+    por_bloco_buffer = (time.perf_counter() - inicio) / blocos * 1e6
+
+    print(f"  ⏱️ Por bloco: lista {por_bloco_lista:.1f} µs | buffer {por_bloco_buffer:.1f} µs")
+    print(f"  💾 Por segundo gravado: lista {memoria_lista / segundos / 1024:.0f} KB | "
+          f"buffer {buffer.nbytes / segundos / 1024:.0f} KB (alocado)")
+    print("\n✅ Teste concluído!")
@@ -7,9 +7,19 @@ Transforma fala em texto para o brain processar.
 
 Funcionalidades:
 - Push-to-Talk (segure tecla, fale, solte)
+- Modo mãos livres (toque a tecla, fale - uma pausa encerra)
 - Whisper OpenAI local (offline após download)
+- Modelo carregado em segundo plano: a Sol abre na hora, a voz liga
+  quando o Whisper fica pronto (fala gravada antes disso fica na fila)
+- Áudio entregue ao Whisper direto da memória (sem WAV temporário/ffmpeg)
+- Captura em buffer float32 pré-alocado (core/audio_buffer.py), com
+  duração máxima configurável (max_recording_seconds)
 - Detecção automática de microfone
 - Filtros de ruído básicos
+- VAD (core/vad.py): corta o silêncio e descarta clipes sem fala
+  antes do Whisper
+- Transcrição incremental opcional (core/stream_transcriber.py): texto
+  parcial ao vivo e só o final decodificado ao soltar a tecla
 - Fallback para texto se não tiver microfone
 
 Autores: Mario, GitHub Copilot & Sol (ela mesma ajudou a se criar!)
@@ -17,26 +27,26 @@ Versão: 1.2 (Audio Revolution) - Tríade Criativa
 Data: 28/10/2025
 """
 
-import os
+import importlib.util
 import threading
 import time
-import tempfile
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from typing import Optional
 
+from core import tracer, vad
+from core.audio_buffer import CaptureBuffer
+from core.stream_transcriber import StreamingTranscriber
+
 # Bibliotecas de áudio - com fallback gracioso
 try:
     import sounddevice as sd
-    import soundfile as sf
     import numpy as np
     AUDIO_AVAILABLE = True
 except ImportError:
     AUDIO_AVAILABLE = False
 
-try:
-    import whisper
-    WHISPER_AVAILABLE = True
-except ImportError:
-    WHISPER_AVAILABLE = False
+# Whisper (e o torch) só são importados na thread de carregamento do modelo
+WHISPER_AVAILABLE = importlib.util.find_spec("whisper") is not None
 
 try:
     import keyboard
@@ -44,6 +54,45 @@ try:
 except ImportError:
     KEYBOARD_AVAILABLE = False
 
+# 🎚️ Formato que o Whisper espera: float32 mono a 16 kHz
+SAMPLE_RATE = 16000
+
+# 🎚️ Pico do áudio depois da normalização
+TARGET_PEAK = 0.9
+
+# 🔇 Abaixo deste pico o áudio é silêncio (não é amplificado)
+SILENCE_PEAK = 1e-4
+
+# ⏱️ Clipes mais curtos são completados com silêncio
+MIN_AUDIO_SECONDS = 1.0
+
+# ⏱️ Duração máxima padrão de uma gravação (depois guarda só os últimos segundos)
+MAX_RECORDING_SECONDS = 30
+
+# 🎙️ Amostras por bloco do callback do microfone
+BLOCK_SIZE = 1024
+
+def prepare_audio(audio, sample_rate: int = SAMPLE_RATE):
+    """
+    🎚️ Prepara a gravação para o Whisper, sem passar pelo disco
+
+    - float32 mono contíguo (não copia se a gravação já estiver assim)
+    - remove o nível DC e normaliza o pico - in place, no próprio array
+    - clipes curtos são completados com silêncio (só eles são copiados)
+    """
+    audio = np.ascontiguousarray(audio, dtype=np.float32)
+    if audio.ndim != 1:
+        audio = audio.reshape(-1)
+    if audio.size:
+        audio -= audio.mean()
+        peak = max(float(audio.max()), -float(audio.min()))
+        if peak > SILENCE_PEAK:
+            audio *= TARGET_PEAK / peak
+    minimum = int(MIN_AUDIO_SECONDS * sample_rate)
+    if audio.size < minimum:
+        audio = np.pad(audio, (0, minimum - audio.size))
+    return audio
+
 class AudioInput:
     """
     🎤 SISTEMA DE ENTRADA POR VOZ PROFISSIONAL
@@ -60,14 +109,27 @@ class AudioInput:
         self.config = config
         self.log = log
         self.whisper_model = None
+        self.model_ready = None  # Future com o modelo (carregado em segundo plano)
+        self.load_stage = None
+        self.load_started = None
         self.recording = False
-        self.audio_data = []
-        self.sample_rate = 16000  # Whisper funciona melhor com 16kHz
+        self.capture = None  # CaptureBuffer, criado na primeira gravação e reaproveitado
+        self.sample_rate = SAMPLE_RATE  # Whisper funciona melhor com 16kHz
+        self.callback_max_us = 0.0  # Callback mais lento da última gravação
+        self.callback_total_us = 0.0
+        self.callback_blocks = 0
+        self.on_recording_start = None  # Callback opcional (ex.: pré-aquecer conexão da IA)
+        self.last_release_to_text_ms = None  # Tecla solta -> texto pronto (última gravação)
         
         # 🔧 CONFIGURAÇÕES
         self.push_to_talk_key = config.get("push_to_talk_key", "space")
         self.audio_enabled = config.get("audio_input_enabled", True)
         self.whisper_model_size = config.get("whisper_model", "tiny")  # tiny, base, small
+        self.max_recording_seconds = config.get("max_recording_seconds", MAX_RECORDING_SECONDS)
+        self.vad_enabled = config.get("vad_enabled", True)
+        self.hands_free = config.get("hands_free", False)
+        self.hands_free_silence_ms = config.get("hands_free_silence_ms", vad.HANDS_FREE_SILENCE_MS)
+        self.streaming = config.get("streaming_transcription", False)
         
         self._initialize_components()
     
@@ -80,7 +142,7 @@ class AudioInput:
             return
             
         if not AUDIO_AVAILABLE:
-            self.log.warning("⚠️ Bibliotecas de áudio não instaladas. Use: pip install sounddevice soundfile numpy")
+            self.log.warning("⚠️ Bibliotecas de áudio não instaladas. Use: pip install sounddevice numpy")
             return
             
         if not WHISPER_AVAILABLE:
@@ -91,15 +153,6 @@ class AudioInput:
             self.log.warning("⚠️ Biblioteca keyboard não instalada. Use: pip install keyboard")
             return
         
-        # 🎯 Inicializa Whisper
-        try:
-            self.log.log(f"🧠 Carregando modelo Whisper '{self.whisper_model_size}'...")
-            self.whisper_model = whisper.load_model(self.whisper_model_size)
-            self.log.log("✅ Whisper carregado com sucesso")
-        except Exception as e:
-            self.log.error(f"❌ Erro ao carregar Whisper: {str(e)}")
-            return
-        
         # 🎤 Testa microfone
         try:
             devices = sd.query_devices()
@@ -114,19 +167,105 @@ class AudioInput:
             self.log.error(f"❌ Erro ao verificar dispositivos de áudio: {str(e)}")
             return
         
+        # 🧠 Whisper carrega em segundo plano (import do torch + modelo)
+        self._start_model_loading()
+        
         self.log.log("🎉 Sistema de voz inicializado com sucesso!")
-        self.log.log(f"💡 Pressione e segure '{self.push_to_talk_key.upper()}' para falar")
+        self.log.log(f"💡 {self.key_hint()}")
+
+    def key_hint(self) -> str:
+        """💡 Como ativar a gravação (push-to-talk ou mãos livres)"""
+        key = self.push_to_talk_key.upper()
+        if self.hands_free:
+            return f"Toque '{key}' e fale (uma pausa encerra)"
+        return f"Pressione e segure '{key}' para falar"
+    
+    def _start_model_loading(self) -> None:
+        """🧠 Dispara o carregamento do Whisper em uma thread (resultado em model_ready)"""
+        self.model_ready = Future()
+        self.load_stage = "iniciando"
+        self.load_started = time.perf_counter()
+        threading.Thread(target=self._load_model, name="sol-whisper-load", daemon=True).start()
+    
+    def _load_model(self) -> None:
+        """🧵 Thread de carregamento: importa o Whisper e carrega o modelo"""
+        try:
+            with tracer.span("whisper_load", "audio", model=self.whisper_model_size):
+                self.load_stage = "importando torch/whisper"
+                import whisper
+                self.load_stage = f"carregando modelo '{self.whisper_model_size}'"
+                model = whisper.load_model(self.whisper_model_size)
+        except Exception as e:
+            self.load_stage = "falhou"
+            self.log.error(f"❌ Erro ao carregar Whisper: {str(e)}")
+            self.model_ready.set_exception(e)
+            return
+        
+        self.whisper_model = model
+        self.load_stage = "pronto"
+        self.model_ready.set_result(model)
+        self.log.log(f"✅ Whisper carregado em {time.perf_counter() - self.load_started:.1f}s - voz pronta")
 
     def is_available(self) -> bool:
-        """🔍 Verifica se o sistema de voz está operacional"""
+        """
+        🔍 Verifica se o sistema de voz está operacional
+        
+        True também enquanto o Whisper carrega: a gravação já funciona e
+        a fala fica na fila até o modelo ficar pronto.
+        """
         return (
             self.audio_enabled and 
             AUDIO_AVAILABLE and 
             WHISPER_AVAILABLE and 
             KEYBOARD_AVAILABLE and
-            self.whisper_model is not None
+            self.model_ready is not None and
+            not (self.model_ready.done() and self.model_ready.exception() is not None)
         )
     
+    def is_ready(self) -> bool:
+        """✅ Whisper carregado (transcrição sem espera)"""
+        return self.whisper_model is not None
+    
+    def status_text(self) -> str:
+        """📊 Situação da entrada por voz para o banner de status"""
+        if not self.is_available():
+            return "❌ Indisponível"
+        if self.is_ready():
+            return "✅ Disponível"
+        elapsed = time.perf_counter() - self.load_started
+        return f"⏳ Carregando Whisper ({self.load_stage}, {elapsed:.0f}s) - o texto já funciona"
+    
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """⏳ Espera o Whisper carregar; False se falhou ou o tempo acabou"""
+        if self.model_ready is None:
+            return False
+        try:
+            self.model_ready.result(timeout=timeout)
+            return True
+        except Exception:
+            return False
+    
+    def _wait_for_model(self):
+        """
+        ⏳ Modelo para transcrever - se ainda carrega, a gravação espera na fila
+        
+        Raises:
+            Exception: o erro do carregamento, se ele falhou
+        """
+        if self.whisper_model is not None:
+            return self.whisper_model
+        
+        print("⏳ Whisper ainda carregando - sua fala está na fila e será transcrita em seguida")
+        try:
+            while True:
+                try:
+                    return self.model_ready.result(timeout=0.5)
+                except FutureTimeoutError:
+                    elapsed = time.perf_counter() - self.load_started
+                    print(f"\r   ⏳ {self.load_stage}... {elapsed:.0f}s", end="", flush=True)
+        finally:
+            print()
+    
     def listen_for_command(self, timeout: int = 30) -> Optional[str]:
         """
         🎯 FUNÇÃO PRINCIPAL: Escuta comando por push-to-talk
@@ -141,7 +280,8 @@ class AudioInput:
             1. Mostra instruções na tela
             2. Aguarda usuário pressionar push-to-talk
             3. Grava enquanto tecla estiver pressionada
-            4. Processa com Whisper quando soltar
+               (mãos livres: até uma pausa depois da fala)
+            4. Corta o silêncio (VAD) e processa com Whisper
             5. Retorna texto transcrito
         """
         
@@ -149,7 +289,7 @@ class AudioInput:
             self.log.debug("🎤 Sistema de voz indisponível, usando entrada de texto")
             return None
         
-        print(f"\n🎤 Pressione e segure '{self.push_to_talk_key.upper()}' para falar (ou digite texto):")
+        print(f"\n🎤 {self.key_hint()} (ou digite texto):")
         print("   ⏳ Aguardando entrada de voz...")
         
         start_time = time.time()
@@ -180,72 +320,179 @@ class AudioInput:
         """
         🔴 GRAVAÇÃO E TRANSCRIÇÃO
         
-        Grava áudio enquanto tecla estiver pressionada,
-        depois processa com Whisper local.
+        Grava áudio enquanto tecla estiver pressionada (ou até uma
+        pausa, no modo mãos livres), corta o silêncio e processa com
+        Whisper local.
         """
         
-        print("🔴 Gravando... (solte a tecla para processar)")
-        self.audio_data = []
-        
-        # 📹 Thread de gravação
-        recording_thread = threading.Thread(target=self._record_audio)
-        recording_thread.start()
+        if self.hands_free:
+            print("🔴 Gravando... (uma pausa encerra - ou toque a tecla de novo)")
+        else:
+            print("🔴 Gravando... (solte a tecla para processar)")
+        if self.capture is None:
+            self.capture = CaptureBuffer(self.sample_rate, self.max_recording_seconds)
+        self.capture.clear()
         
-        # ⏳ Aguarda usuário soltar a tecla
-        while keyboard.is_pressed(self.push_to_talk_key):
-            time.sleep(0.05)
+        if self.on_recording_start:
+            try:
+                self.on_recording_start()
+            except Exception as e:
+                self.log.debug(f"Callback de início de gravação falhou: {str(e)}")
         
-        # 🛑 Para gravação
-        self.recording = False
-        recording_thread.join(timeout=2)
+        with tracer.span("audio_capture", "audio") as span:
+            # 📹 Thread de gravação
+            self.recording = True
+            recording_thread = threading.Thread(target=self._record_audio)
+            recording_thread.start()
+            
+            # 📡 Transcreve enquanto grava (só com o modelo já carregado)
+            streamer = None
+            if self.streaming and self.is_ready():
+                streamer = StreamingTranscriber(self.capture, self._decode, self.sample_rate, self.config,
+                                                on_partial=self._show_partial, log=self.log)
+                streamer.start()
+            
+            # ⏳ Aguarda usuário soltar a tecla (ou a pausa no modo mãos livres)
+            if self.hands_free:
+                self._wait_for_silence()
+            else:
+                self._wait_for_release()
+            
+            # 🛑 Para gravação
+            released_at = time.perf_counter()
+            self.recording = False
+            recording_thread.join(timeout=2)
+            span.set(samples=self.capture.samples_written, callback_max_us=round(self.callback_max_us, 1))
         
-        if not self.audio_data:
+        if not self.capture.size:
+            if streamer:
+                streamer.finish()
             print("⚠️ Não foi possível capturar áudio")
             return None
         
-        print("🎯 Processando com Whisper...")
+        if self.callback_blocks:
+            self.log.debug(f"🎙️ Callback: média {self.callback_total_us / self.callback_blocks:.1f} µs, "
+                           f"máx {self.callback_max_us:.1f} µs | buffer {self.capture.nbytes // 1024} KB "
+                           f"({self.capture.seconds:.1f}s gravados)")
+        
+        # ✂️ Só a fala vai para o Whisper
+        audio = self.capture.view()
+        if self.vad_enabled and not streamer:  # o streamer aplica o VAD em cada janela
+            with tracer.span("vad_trim", "audio", seconds=len(audio) / self.sample_rate) as span:
+                speech = vad.trim(audio, self.sample_rate, self.config)
+                span.set(kept=0 if speech is None else len(speech) / self.sample_rate)
+            if speech is None:
+                print("🔇 Nenhuma fala detectada")
+                return None
+            self.log.debug(f"✂️ VAD: {len(audio) / self.sample_rate:.1f}s -> {len(speech) / self.sample_rate:.1f}s")
+            audio = speech
+        
+        if streamer:
+            if streamer.partial_text:
+                print()  # termina a linha do texto parcial
+            print("🎯 Finalizando transcrição...")
+        else:
+            print("🎯 Processando com Whisper...")
         
-        # 💾 Salva temporariamente
         try:
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-                sf.write(tmp_file.name, np.array(self.audio_data), self.sample_rate)
-                
-                # 🧠 Transcreve com Whisper
-                result = self.whisper_model.transcribe(
-                    tmp_file.name,
-                    language='pt',  # Força português
-                    fp16=False,     # Compatibilidade CPU
-                    verbose=False   # Sem logs desnecessários
-                )
-                
-                # 🧹 Limpa arquivo temporário
-                os.unlink(tmp_file.name)
-                
-                texto = result['text'].strip()
-                if texto:
-                    print(f"✅ Reconhecado: '{texto}'")
-                    self.log.log(f"🎤 Comando por voz: {texto}")
-                    return texto
-                else:
-                    print("⚠️ Nenhum texto reconhecido")
-                    return None
-                    
+            # 🧠 Transcreve direto da memória (sem WAV temporário nem ffmpeg)
+            texto = streamer.finish() if streamer else self.transcribe(audio)
         except Exception as e:
             self.log.error(f"❌ Erro na transcrição: {str(e)}")
             print("❌ Erro ao processar áudio")
             return None
+        finally:
+            self.last_release_to_text_ms = (time.perf_counter() - released_at) * 1000
+            self.log.debug(f"⏱️ Tecla solta -> texto em {self.last_release_to_text_ms:.0f} ms")
+        
+        if texto:
+            print(f"✅ Reconhecado: '{texto}'")
+            self.log.log(f"🎤 Comando por voz: {texto}")
+            return texto
+        else:
+            print("⚠️ Nenhum texto reconhecido")
+            return None
+    
+    def _wait_for_release(self) -> None:
+        """⏳ Push-to-talk: grava até a tecla ser solta"""
+        warned_full = False
+        while keyboard.is_pressed(self.push_to_talk_key) and self.recording:
+            if self.capture.full and not warned_full:
+                warned_full = True
+                print(f"⚠️ Limite de {self.max_recording_seconds:g}s - ficam só os últimos segundos")
+            time.sleep(0.05)
+    
+    def _wait_for_silence(self) -> None:
+        """
+        🤫 Mãos livres: grava até hands_free_silence_ms de silêncio depois da fala
+        
+        Também para no limite de duração ou se a tecla for tocada de novo.
+        """
+        endpointer = vad.Endpointer(self.sample_rate, self.hands_free_silence_ms, self.config)
+        position = 0
+        key_released = False
+        while self.recording:
+            samples, position = self.capture.read_since(position)
+            if endpointer.feed(samples):
+                return
+            if self.capture.full:
+                print(f"⚠️ Limite de {self.max_recording_seconds:g}s atingido")
+                return
+            if not keyboard.is_pressed(self.push_to_talk_key):
+                key_released = True
+            elif key_released:
+                return
+            time.sleep(0.05)
+    
+    def transcribe(self, audio) -> str:
+        """
+        🧠 Transcreve um array float32 a 16 kHz com o Whisper
+        
+        O array é normalizado in place (ver prepare_audio) e entregue ao
+        modelo como está - o Whisper só chama o ffmpeg quando recebe um
+        caminho de arquivo.
+        """
+        return self._decode(audio)['text'].strip()
+    
+    def _decode(self, audio, prompt: Optional[str] = None, word_timestamps: bool = False) -> dict:
+        """🧠 model.transcribe com as opções da Sol (resultado completo, com segmentos)"""
+        model = self._wait_for_model()
+        audio = prepare_audio(audio, self.sample_rate)
+        with tracer.span("whisper_transcribe", "audio", model=self.whisper_model_size,
+                         seconds=audio.size / self.sample_rate):
+            return model.transcribe(
+                audio,
+                language='pt',  # Força português
+                fp16=False,     # Compatibilidade CPU
+                verbose=False,  # Sem logs desnecessários
+                initial_prompt=prompt,  # Texto já confirmado (transcrição incremental)
+                word_timestamps=word_timestamps
+            )
+    
+    def _show_partial(self, text: str) -> None:
+        """📝 Texto parcial ao vivo (mesma linha, reescrita a cada passada)"""
+        print(f"\r   📝 {text[-90:]}", end="", flush=True)
     
     def _record_audio(self) -> None:
         """🎙️ Thread de gravação de áudio em tempo real"""
         
-        self.recording = True
-        self.audio_data = []
+        self.callback_max_us = 0.0
+        self.callback_total_us = 0.0
+        self.callback_blocks = 0
+        capture = self.capture
+        clock = time.perf_counter
         
-        def audio_callback(indata, frames, time, status):
+        def audio_callback(indata, frames, time_info, status):
             if status:
                 self.log.warning(f"⚠️ Status de áudio: {status}")
             if self.recording:
-                self.audio_data.extend(indata[:, 0])  # Canal mono
+                start = clock()
+                capture.write(indata[:, 0])  # Canal mono - uma cópia de fatia por bloco
+                elapsed = (clock() - start) * 1e6
+                self.callback_total_us += elapsed
+                self.callback_blocks += 1
+                if elapsed > self.callback_max_us:
+                    self.callback_max_us = elapsed
         
         try:
             with sd.InputStream(
@@ -253,7 +500,7 @@ class AudioInput:
                 channels=1,
                 samplerate=self.sample_rate,
                 dtype=np.float32,
-                blocksize=1024
+                blocksize=BLOCK_SIZE
             ):
                 while self.recording:
                     time.sleep(0.1)
@@ -310,7 +557,9 @@ class AudioInput:
             return False
         
         # Teste 3: Whisper
-        if self.whisper_model:
+        if not self.is_ready():
+            print(f"  {self.status_text()}")
+        if self.wait_until_ready():
             print(f"  ✅ Modelo Whisper '{self.whisper_model_size}' carregado")
         else:
             print("  ❌ Modelo Whisper não carregado")
@@ -339,8 +588,43 @@ if __name__ == "__main__":
     
     log_teste = LogTeste()
     
-    # Teste básico
+    if AUDIO_AVAILABLE:
+        # 🎚️ Preparação in place: sem cópia para gravações longas
+        gravacao = (np.sin(np.linspace(0, 2000, 3 * SAMPLE_RATE)) * 0.1 + 0.05).astype(np.float32)
+        preparado = prepare_audio(gravacao)
+        assert preparado is gravacao and abs(float(np.abs(preparado).max()) - TARGET_PEAK) < 1e-3
+        assert prepare_audio(np.zeros(100, dtype=np.float32)).size == int(MIN_AUDIO_SECONDS * SAMPLE_RATE)
+    
+    # Teste básico - o construtor não espera o modelo: volta na hora
+    inicio = time.perf_counter()
     audio = AudioInput(config_teste, log_teste)
+    print(f"  ⏱️ AudioInput pronto em {(time.perf_counter() - inicio) * 1000:.0f} ms")
+    print(f"  🎤 {audio.status_text()}")
+    
+    if audio.wait_until_ready():
+        # ⏱️ Antes x depois: WAV temporário + ffmpeg vs. array em memória
+        import os
+        import tempfile
+        import wave
+        
+        fala = (np.random.randn(5 * SAMPLE_RATE) * 0.05).astype(np.float32)
+        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
+            caminho = tmp_file.name
+        try:
+            inicio = time.perf_counter()
+            with wave.open(caminho, "wb") as wav:
+                wav.setnchannels(1)
+                wav.setsampwidth(2)
+                wav.setframerate(SAMPLE_RATE)
+                wav.writeframes((fala * 32767).astype(np.int16).tobytes())
+            audio.whisper_model.transcribe(caminho, language='pt', fp16=False, verbose=False)
+            via_arquivo = time.perf_counter() - inicio
+        finally:
+            os.unlink(caminho)
+        inicio = time.perf_counter()
+        audio.transcribe(fala.copy())
+        em_memoria = time.perf_counter() - inicio
+        print(f"  ⏱️ 5s de áudio: arquivo+ffmpeg {via_arquivo * 1000:.0f} ms | memória {em_memoria * 1000:.0f} ms")
     
     # Diagnóstico
     if audio.test_audio_system():
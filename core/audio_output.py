@@ -24,6 +24,8 @@ import time
 from typing import Optional, Dict
 import hashlib
 
+from core import launcher, tracer
+
 # TTS Engines - com fallback gracioso
 try:
     import requests
@@ -238,28 +240,31 @@ class AudioOutput:
         text = text.strip()
         self.log.log(f"🗣️ Sol falando: {text}")
         
-        # 🎯 Cache check
-        cache_key = self._get_cache_key(text)
-        if cache_key in self.audio_cache:
-            return self._play_audio_file(self.audio_cache[cache_key])
-        
-        # 🎵 Gera e reproduz áudio
-        success = False
-        
-        if self.tts_engine == "elevenlabs":
-            success = self._speak_elevenlabs(text, cache_key)
-        elif self.tts_engine == "azure":
-            success = self._speak_azure(text, cache_key)
-        elif self.tts_engine == "sapi":
-            success = self._speak_sapi(text)
-        elif self.tts_engine == "pyttsx3":
-            success = self._speak_pyttsx3(text)
-        
-        if not success:
-            self.log.warning("⚠️ Falha no TTS, tentando fallback")
-            return self._speak_fallback(text)
-        
-        return True
+        with tracer.span("tts_speak", "audio", engine=self.tts_engine, chars=len(text)) as span:
+            # 🎯 Cache check
+            cache_key = self._get_cache_key(text)
+            if cache_key in self.audio_cache:
+                span.set(cached=True)
+                return self._play_audio_file(self.audio_cache[cache_key])
+            
+            # 🎵 Gera e reproduz áudio
+            success = False
+            
+            if self.tts_engine == "elevenlabs":
+                success = self._speak_elevenlabs(text, cache_key)
+            elif self.tts_engine == "azure":
+                success = self._speak_azure(text, cache_key)
+            elif self.tts_engine == "sapi":
+                success = self._speak_sapi(text)
+            elif self.tts_engine == "pyttsx3":
+                success = self._speak_pyttsx3(text)
+            
+            if not success:
+                self.log.warning("⚠️ Falha no TTS, tentando fallback")
+                span.set(fallback=True)
+                return self._speak_fallback(text)
+            
+            return True
     
     def _speak_elevenlabs(self, text: str, cache_key: str) -> bool:
         """🎵 TTS com ElevenLabs (Premium)"""
@@ -401,9 +406,8 @@ class AudioOutput:
                 
                 return True
             else:
-                # Fallback: usa comando do sistema (Windows)
-                os.system(f'start /wait "" "{file_path}"')
-                return True
+                # Fallback: player do sistema, executado direto (sem shell)
+                return launcher.get_launcher(self.log).play_audio(file_path)
                 
         except Exception as e:
             self.log.error(f"❌ Erro ao reproduzir áudio: {str(e)}")
@@ -18,8 +18,32 @@ Data: 28/10/2025
 
 import json
 import os
+import threading
+import time
 
-def generate_plan(user_input: str, config: dict, log) -> dict:
+from core import command_registry, tracer
+from core.intent_matcher import IntentMatcher
+from core.plan_cache import PlanCache
+from core.plan_stream import IncrementalPlanParser
+
+OPENAI_MODEL = "gpt-3.5-turbo"
+
+# 🗃️ Cache de planos compartilhado pelo processo (criado no primeiro uso)
+_plan_cache = None
+
+# 🎯 Reconhecedor de intenções do modo demonstração (compilado no primeiro uso)
+_intent_matcher = None
+
+# 🔌 Cliente OpenAI compartilhado pelo processo (reconstruído só se a chave mudar)
+PREWARM_INTERVAL_SECONDS = 30
+_client_lock = threading.Lock()
+_openai_client = None
+_openai_client_key = None
+_last_prewarm = 0.0
+_prewarm_in_flight = False
+
+def generate_plan(user_input: str, config: dict, log,
+                  on_explanation=None, on_step=None) -> dict:
     """
     🎯 FUNÇÃO PRINCIPAL: Converte linguagem natural em plano de ação
     
@@ -27,6 +51,13 @@ def generate_plan(user_input: str, config: dict, log) -> dict:
         user_input (str): Comando do usuário em linguagem natural
         config (dict): Configurações carregadas do config.json
         log: Instância do logger para registrar eventos
+        on_explanation (callable): Opcional - recebe a explicação assim que
+            ela chega pelo streaming da IA (antes dos passos)
+        on_step (callable): Opcional - recebe cada passo válido assim que chega
+    
+    Os callbacks só são chamados no modo streaming da IA real. Cache e modo
+    demonstração retornam o plano direto - quem chama deve comparar o plano
+    final com o que já recebeu (a IA pode cair no fallback no fim).
     
     Returns:
         dict: Plano estruturado com explicação e passos executáveis
@@ -39,9 +70,18 @@ def generate_plan(user_input: str, config: dict, log) -> dict:
     has_openai_key = openai_key and openai_key != "COLE_SUA_CHAVE_AQUI"
     
     if has_openai_key:
+        # 🗃️ Comandos repetidos não precisam de nova chamada à IA
+        cache = _get_plan_cache(config, log)
+        with tracer.span("plan_cache_lookup", "brain") as span:
+            cached_plan = cache.get(user_input)
+            span.set(hit=cached_plan is not None)
+        if cached_plan is not None:
+            log.debug("🗃️ Plano encontrado no cache")
+            return cached_plan
+        
         try:
             log.debug("🧠 Usando IA real (OpenAI)")
-            return _generate_plan_with_ai(user_input, config, log)
+            return _generate_plan_with_ai(user_input, config, log, on_explanation, on_step)
         except Exception as e:
             log.error(f"❌ Erro na IA, usando fallback: {str(e)}")
             return _generate_plan_mock(user_input, log)
@@ -49,18 +89,20 @@ def generate_plan(user_input: str, config: dict, log) -> dict:
         log.debug("🤖 Chave OpenAI não configurada, usando modo demonstração")
         return _generate_plan_mock(user_input, log)
 
-def _generate_plan_with_ai(user_input: str, config: dict, log) -> dict:
+def _generate_plan_with_ai(user_input: str, config: dict, log,
+                           on_explanation=None, on_step=None) -> dict:
     """
     🧠 GERADOR COM IA REAL (OpenAI GPT)
     
     Conecta com a API da OpenAI para interpretação avançada de linguagem natural.
     Inclui prompt de segurança e formatação padronizada.
+    Com callbacks (e "streaming_enabled" ativo), consome a resposta em streaming.
     """
     try:
-        from openai import OpenAI
-        client = OpenAI(api_key=config["openai_api_key"])
+        client = _get_openai_client(config["openai_api_key"])
         
         # 🛡️ PROMPT DE SEGURANÇA E FORMATAÇÃO
+        # (a lista de comandos vem do registro oficial - nunca diverge do executor)
         system_prompt = """Você é a Sol, assistente pessoal inteligente e ética do SolAgent v1.1.
 
 🌟 SUA MISSÃO:
@@ -79,28 +121,13 @@ Transformar linguagem natural em comandos estruturados executáveis para Windows
   "passos": ["comando_exato", "comando_com_parametro:valor"]
 }
 
-⚡ COMANDOS OFICIAIS DISPONÍVEIS:
-
-🌐 NAVEGAÇÃO WEB:
-• abrir_navegador
-• abrir_url:URL_COMPLETA  
-• pesquisar_no_youtube:TERMO
-• pesquisar_google:TERMO
+Campo opcional "depends_on": {"3": [1, 2]} = o passo 3 só pode rodar depois
+dos passos 1 e 2 (números começam em 1). Passos sem dependência podem rodar
+em paralelo - use "depends_on" só quando a ordem realmente importar.
 
-💻 SISTEMA LOCAL:
-• abrir_explorador_arquivos
-• criar_pasta:CAMINHO_COMPLETO
-• abrir_programa:NOME_PROGRAMA
-• listar_arquivos:CAMINHO
-
-📊 INFORMAÇÕES:
-• obter_data_atual
-• obter_hora_atual
-• mostrar_status_sistema
-• executar_comando:COMANDO_SEGURO
+⚡ COMANDOS OFICIAIS DISPONÍVEIS:
 
-💬 COMUNICAÇÃO:
-• falar_para_usuario:MENSAGEM
+{comandos}
 
 🎯 EXEMPLOS DE EXCELÊNCIA:
 
@@ -122,20 +149,27 @@ Usuário: "você pode rastrear minha localização?"
 - Sempre explique o que vai fazer
 - Use linguagem amigável e profissional
 
-💡 SEJA ÚTIL, SEGURA E TRANSPARENTE!"""
+💡 SEJA ÚTIL, SEGURA E TRANSPARENTE!""".replace("{comandos}", command_registry.render_prompt_commands())
 
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_input}
+        ]
+        
         # 🚀 CHAMADA PARA A IA
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_input}
-            ],
-            max_tokens=500,
-            temperature=0.7
-        )
+        use_streaming = (on_explanation or on_step) and config.get("streaming_enabled", True)
+        if use_streaming:
+            ai_response = _stream_completion(client, messages, log, on_explanation, on_step)
+        else:
+            with tracer.span("openai_request", "brain", model=OPENAI_MODEL):
+                response = client.chat.completions.create(
+                    model=OPENAI_MODEL,
+                    messages=messages,
+                    max_tokens=500,
+                    temperature=0.7
+                )
+            ai_response = response.choices[0].message.content.strip()
         
-        ai_response = response.choices[0].message.content.strip()
         log.debug(f"🤖 Resposta da IA: {ai_response}")
         
         # 🔍 VALIDAÇÃO E FORMATAÇÃO PROFISSIONAL
@@ -143,6 +177,7 @@ Usuário: "você pode rastrear minha localização?"
             plan = json.loads(ai_response)
             if _validate_plan_structure(plan, log):
                 log.log("✅ Plano OpenAI validado com sucesso")
+                _get_plan_cache(config, log).put(user_input, plan)
                 return plan
             else:
                 log.warning("⚠️ Plano OpenAI com estrutura inválida, usando fallback")
@@ -158,6 +193,45 @@ Usuário: "você pode rastrear minha localização?"
         log.error(f"❌ Erro na chamada da IA: {str(e)}")
         return _generate_plan_mock(user_input, log)
 
+def _stream_completion(client, messages: list, log, on_explanation=None, on_step=None) -> str:
+    """
+    📡 Consome a resposta da IA em streaming
+    
+    O parser incremental emite a explicação e cada passo assim que fecham.
+    Passos fora da lista oficial não são emitidos (o plano completo ainda
+    passa pela validação normal depois).
+    """
+    def emit_step(step: str) -> None:
+        if on_step and command_registry.is_valid_step(step):
+            on_step(step)
+    
+    parser = IncrementalPlanParser(on_explanation=on_explanation, on_step=emit_step)
+    
+    with tracer.span("openai_stream", "brain", model=OPENAI_MODEL):
+        stream = client.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=messages,
+            max_tokens=500,
+            temperature=0.7,
+            stream=True
+        )
+        
+        first_token_at = None
+        start = time.perf_counter()
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                if first_token_at is None:
+                    first_token_at = time.perf_counter()
+                    tracer.instant("first_token", "brain")
+                    log.debug(f"📡 Primeiro token em {(first_token_at - start) * 1000:.0f} ms")
+                parser.feed(delta)
+    
+    log.debug(f"📡 Streaming concluído em {(time.perf_counter() - start) * 1000:.0f} ms")
+    return parser.text.strip()
+
 def _generate_plan_mock(user_input: str, log) -> dict:
     """
     🤖 GERADOR MOCK INTELIGENTE (Modo Demonstração)
@@ -165,86 +239,127 @@ def _generate_plan_mock(user_input: str, log) -> dict:
     Funciona offline com base em palavras-chave e padrões.
     Mantém a experiência fluida mesmo sem IA real.
     Inclui CTA para upgrade (conversão comercial).
+    
+    As regras ficam em core/mock_intents.json e são compiladas em um único
+    reconhecedor (ver core/intent_matcher.py) - o comando é varrido uma vez.
     """
     log.debug("🎭 Usando modo demonstração (sem IA)")
     
     # 🔍 ANÁLISE DE PALAVRAS-CHAVE
-    input_lower = user_input.lower()
-    
-    # ⏰ HORA
-    if any(word in input_lower for word in ["hora", "horas"]):
-        return {
-            "explicacao": "Vou mostrar o horário atual do sistema",
-            "passos": ["obter_hora_atual"]
-        }
-    
-    # 📅 DATA
-    elif any(word in input_lower for word in ["data", "dia", "hoje"]):
-        return {
-            "explicacao": "Vou mostrar a data atual do sistema",
-            "passos": ["obter_data_atual"]
-        }
-    
-    # 🎥 YOUTUBE
-    elif any(word in input_lower for word in ["youtube", "video", "música"]):
-        return {
-            "explicacao": "Vou abrir o YouTube e buscar conteúdo para você",
-            "passos": [
-                "abrir_navegador",
-                "abrir_url:https://www.youtube.com",
-                "pesquisar_no_youtube:lofi hip hop"
-            ]
-        }
-    
-    # 🔍 PESQUISA GOOGLE
-    elif any(word in input_lower for word in ["google", "pesquisar", "buscar"]):
-        return {
-            "explicacao": "Vou fazer uma pesquisa no Google",
-            "passos": [
-                "abrir_navegador", 
-                "pesquisar_google:" + user_input
-            ]
-        }
-    
-    # 📁 ARQUIVOS
-    elif any(word in input_lower for word in ["pasta", "arquivo", "explorador"]):
-        return {
-            "explicacao": "Vou abrir o explorador de arquivos",
-            "passos": ["abrir_explorador_arquivos"]
-        }
-    
-    # 💻 PROGRAMAS
-    elif any(word in input_lower for word in ["abrir", "programa", "app"]):
-        return {
-            "explicacao": "Vou abrir um programa para você",
-            "passos": ["abrir_programa:notepad"]
-        }
-    
-    # 📊 SISTEMA
-    elif any(word in input_lower for word in ["sistema", "computador", "pc", "informações"]):
-        return {
-            "explicacao": "Vou mostrar informações do seu sistema",
-            "passos": ["mostrar_status_sistema"]
-        }
-    
-    # ⚠️ SEGURANÇA - Rejeita pedidos sensíveis
-    elif any(word in input_lower for word in ["localização", "ip", "senha", "privacidade"]):
-        return {
-            "explicacao": "Por questões de segurança e privacidade, não posso acessar essas informações",
-            "passos": ["falar_para_usuario:Posso ajudar com navegação web, arquivos básicos e informações do sistema!"]
-        }
-    
-    # 🎯 PADRÃO + CTA COMERCIAL
-    else:
-        return {
-            "explicacao": "Modo demonstração ativo - funcionalidades limitadas",
-            "passos": [
-                "falar_para_usuario:Olá! Sou a Sol em modo demonstração. Configure sua chave OpenAI para funcionalidade completa com IA real! 🌟"
-            ]
-        }
+    matcher = _get_intent_matcher(log)
+    log.debug(f"🎯 Intenções encontradas: {matcher.match(user_input)}")
+    return matcher.best_plan(user_input)
+
+# 🔌 CONEXÃO COM A OPENAI
+
+def _get_openai_client(api_key: str):
+    """
+    🔌 Retorna o cliente OpenAI do processo
+    
+    O cliente mantém um pool HTTP com keep-alive, então comandos seguidos
+    reaproveitam a mesma conexão TLS. Só é recriado se a chave mudar.
+    """
+    global _openai_client, _openai_client_key, _last_prewarm
+    
+    with _client_lock:
+        if _openai_client is not None and _openai_client_key == api_key:
+            return _openai_client
+        
+        import httpx
+        from openai import OpenAI
+        
+        if _openai_client is not None:
+            try:
+                _openai_client.close()
+            except Exception:
+                pass
+        
+        http_client = httpx.Client(
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=120),
+            timeout=httpx.Timeout(30.0, connect=5.0)
+        )
+        _openai_client = OpenAI(api_key=api_key, http_client=http_client)
+        _openai_client_key = api_key
+        _last_prewarm = 0.0
+        return _openai_client
+
+def prewarm_connection(config: dict, log) -> None:
+    """
+    🔥 Abre a conexão com a OpenAI em segundo plano
+    
+    Chamado quando o prompt aparece ou o push-to-talk começa, para que a
+    latência do primeiro token não inclua DNS + handshake TLS.
+    Não bloqueia e ignora chamadas repetidas dentro do intervalo.
+    """
+    global _last_prewarm, _prewarm_in_flight
+    
+    openai_key = config.get("openai_api_key", "").strip()
+    if not openai_key or openai_key == "COLE_SUA_CHAVE_AQUI":
+        return
+    
+    with _client_lock:
+        if _prewarm_in_flight or time.time() - _last_prewarm < PREWARM_INTERVAL_SECONDS:
+            return
+        _prewarm_in_flight = True
+    
+    def _warm() -> None:
+        global _last_prewarm, _prewarm_in_flight
+        start = time.perf_counter()
+        try:
+            client = _get_openai_client(config["openai_api_key"])
+            client.models.retrieve(OPENAI_MODEL)
+            log.debug(f"🔥 Conexão OpenAI aquecida em {(time.perf_counter() - start) * 1000:.0f} ms")
+            with _client_lock:
+                _last_prewarm = time.time()
+        except Exception as e:
+            log.debug(f"🔥 Pré-aquecimento da OpenAI falhou: {str(e)}")
+        finally:
+            with _client_lock:
+                _prewarm_in_flight = False
+    
+    threading.Thread(target=_warm, daemon=True).start()
 
 # 🏆 FUNÇÕES AUXILIARES E VALIDAÇÃO PROFISSIONAL
 
+def _get_plan_cache(config: dict, log) -> PlanCache:
+    """
+    🗃️ Retorna o cache de planos do processo (criado no primeiro uso)
+    
+    Apenas planos da IA real são guardados: o modo demonstração
+    já é instantâneo e não deve "contaminar" o cache.
+    """
+    global _plan_cache
+    if _plan_cache is None:
+        _plan_cache = PlanCache(config, log)
+    return _plan_cache
+
+def _get_intent_matcher(log) -> IntentMatcher:
+    """
+    🎯 Retorna o reconhecedor de intenções do modo demonstração
+    
+    Se o arquivo de regras estiver ausente ou inválido, usa um
+    reconhecedor vazio (sempre cai no plano padrão).
+    """
+    global _intent_matcher
+    if _intent_matcher is None:
+        try:
+            _intent_matcher = IntentMatcher.from_file()
+            log.debug(f"🎯 {len(_intent_matcher.intents)} intenções carregadas")
+        except Exception as e:
+            log.error(f"❌ Erro ao carregar intenções do modo demonstração: {str(e)}")
+            _intent_matcher = IntentMatcher({})
+    return _intent_matcher
+
+def get_plan_cache_stats() -> dict:
+    """
+    📈 Estatísticas do cache de planos (para o relatório de histórico)
+    
+    Retorna dicionário vazio se o cache ainda não foi usado nesta sessão.
+    """
+    if _plan_cache is None:
+        return {}
+    return _plan_cache.get_stats()
+
 def _validate_plan_structure(plan: dict, log) -> bool:
     """
     ✅ Valida se o plano tem a estrutura correta e comandos válidos
@@ -266,61 +381,18 @@ def _validate_plan_structure(plan: dict, log) -> bool:
         log.warning("⚠️ 'passos' não é uma lista")
         return False
     
-    # Valida comandos contra lista oficial do executor
-    available_commands = _get_executor_commands()
+    if "depends_on" in plan and not isinstance(plan["depends_on"], dict):
+        log.warning("⚠️ 'depends_on' não é um dicionário, ignorando")
+        del plan["depends_on"]
+    
+    # Valida comandos contra o registro oficial (mesmo usado pelo executor)
     for passo in plan["passos"]:
-        if not _is_valid_command(passo, available_commands):
+        if not command_registry.is_valid_step(passo):
             log.warning(f"⚠️ Comando inválido no plano: '{passo}'")
             return False
     
     return True
 
-def _is_valid_command(command: str, available_commands: dict) -> bool:
-    """
-    � Verifica se um comando é válido segundo o executor
-    """
-    # Comandos simples (sem parâmetros)
-    if command in available_commands:
-        return True
-    
-    # Comandos com parâmetros (formato: "comando:parametro")
-    for cmd_pattern in available_commands.keys():
-        if ":" in cmd_pattern:
-            cmd_base = cmd_pattern.split(":")[0] + ":"
-            if command.startswith(cmd_base):
-                return True
-    
-    return False
-
-def _get_executor_commands() -> dict:
-    """
-    📋 Lista oficial de comandos sincronizada com executor_commercial.py
-    
-    CRÍTICO: Manter sempre atualizada com o executor!
-    """
-    return {
-        # Navegação Web
-        "abrir_navegador": "Abre o navegador padrão",
-        "abrir_url:URL": "Abre uma URL específica",
-        "pesquisar_no_youtube:TERMO": "Pesquisa no YouTube",
-        "pesquisar_google:TERMO": "Pesquisa no Google",
-        
-        # Sistema Local  
-        "abrir_explorador_arquivos": "Abre o Windows Explorer",
-        "criar_pasta:CAMINHO": "Cria uma nova pasta",
-        "abrir_programa:NOME": "Abre um programa/aplicativo",
-        "listar_arquivos:CAMINHO": "Lista arquivos de um diretório",
-        
-        # Informações
-        "obter_data_atual": "Mostra a data atual",
-        "obter_hora_atual": "Mostra a hora atual", 
-        "mostrar_status_sistema": "Informações detalhadas do PC",
-        "executar_comando:CMD": "Executa comando seguro do sistema",
-        
-        # Comunicação
-        "falar_para_usuario:MENSAGEM": "Envia mensagem ao usuário"
-    }
-
 def validate_plan(plan: dict) -> bool:
     """
     ✅ Validação simples de formato (mantido para compatibilidade)
@@ -336,8 +408,7 @@ def get_available_commands() -> list:
     """
     📋 Lista de comandos para documentação (formato simples)
     """
-    commands = _get_executor_commands()
-    return list(commands.keys())
+    return list(command_registry.get_command_descriptions().keys())
 
 # 🎯 EXEMPLO DE USO
 if __name__ == "__main__":
@@ -10,6 +10,7 @@ Funcionalidades:
 - Timestamps precisos
 - Análise de padrões de uso
 - Relatórios de eficiência
+- Taxa de sucesso e tempo de cada ação (registros do Executor)
 - Backup automático
 - Privacy-first (dados locais)
 
@@ -24,6 +25,9 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import hashlib
 
+# 📄 Quanto da saída de cada passo vai para o histórico (o final dela)
+MAX_HISTORY_OUTPUT_CHARS = 1000
+
 class CommandHistory:
     """
     📊 SISTEMA DE HISTÓRICO INTELIGENTE
@@ -75,16 +79,18 @@ class CommandHistory:
                         plan: Dict[str, Any], 
                         execution_result: str = "unknown",
                         input_method: str = "text",
-                        response_method: str = "text") -> None:
+                        response_method: str = "text",
+                        step_results: Optional[List[Dict[str, Any]]] = None) -> None:
         """
         💾 SALVA UMA INTERAÇÃO COMPLETA
         
         Args:
             user_input: Comando original do usuário
             plan: Plano gerado pelo brain
-            execution_result: success, cancelled, error
+            execution_result: success, partial, cancelled, error
             input_method: text, voice
             response_method: text, voice, both
+            step_results: Registros de resultado do Executor (um por passo)
         """
         
         if not self.history_enabled:
@@ -105,6 +111,19 @@ class CommandHistory:
                 "ai_mode": "openai" if self.config.get("openai_api_key", "").strip() not in ["", "COLE_SUA_CHAVE_AQUI"] else "mock"
             }
             
+            # ⚙️ Resultado de cada passo (status, tempo e o final da saída -
+            # ex.: as linhas que o executar_comando mostrou)
+            if step_results:
+                interaction["step_results"] = [{
+                    "command": r.get("command"),
+                    "status": r.get("status"),
+                    "duration": r.get("duration"),
+                    "cached": r.get("cached", False),
+                    "error": self._sanitize_text(r.get("error") or "") or None,
+                    "output": None if self.privacy_mode
+                              else (r.get("output") or "")[-MAX_HISTORY_OUTPUT_CHARS:] or None,
+                } for r in step_results]
+            
             # 🔒 Privacy mode - hashifica dados sensíveis
             if self.privacy_mode:
                 interaction["user_input_hash"] = self._hash_text(user_input)
@@ -198,6 +217,22 @@ class CommandHistory:
             self.log.error(f"❌ Erro ao analisar padrões: {str(e)}")
             return {}
     
+    def get_step_stats(self) -> List[Dict[str, Any]]:
+        """⚙️ Taxa de sucesso e tempo médio de cada ação (mais lentas primeiro)"""
+        
+        stats = []
+        for command, data in self._load_analytics().get("step_stats", {}).items():
+            timed_runs = data["runs"] - data.get("cached", 0)
+            stats.append({
+                "command": command,
+                "runs": data["runs"],
+                "success_rate": data["success"] / data["runs"] * 100 if data["runs"] else 0,
+                "avg_duration": data["total_duration"] / timed_runs if timed_runs > 0 else 0.0,
+                "max_duration": data["max_duration"],
+            })
+        stats.sort(key=lambda s: s["avg_duration"], reverse=True)
+        return stats
+    
     def generate_report(self) -> str:
         """📊 Gera relatório completo de uso"""
         
@@ -205,6 +240,7 @@ class CommandHistory:
             today_stats = self.get_today_stats()
             patterns = self.get_usage_patterns()
             recent_commands = self.get_recent_commands(5)
+            step_stats = self.get_step_stats()
             
             report = f"""
 📊 ═══ RELATÓRIO SOLAGENT v1.2 ═══
@@ -221,11 +257,22 @@ class CommandHistory:
   • Total de interações históricas: {patterns.get('total_interactions', 0)}
   • Método preferido: {self._get_preferred_method(patterns)}
 
+⚙️ AÇÕES (mais lentas primeiro):
+"""
+            
+            for stats in step_stats[:5]:
+                report += (f"  • {stats['command']}: {stats['success_rate']:.0f}% de sucesso em {stats['runs']} execuções, "
+                           f"média {stats['avg_duration'] * 1000:.0f} ms (máx. {stats['max_duration'] * 1000:.0f} ms)\n")
+            
+            if not step_stats:
+                report += "  (Nenhuma ação executada ainda)\n"
+            
+            report += """
 📋 COMANDOS RECENTES:
 """
             
             for cmd in recent_commands:
-                status_icon = "✅" if cmd["result"] == "success" else "❌" if cmd["result"] == "error" else "⏸️"
+                status_icon = {"success": "✅", "error": "❌", "partial": "⚠️"}.get(cmd["result"], "⏸️")
                 method_icon = "🎤" if cmd["method"] == "voice" else "✍️"
                 report += f"  {status_icon} {method_icon} {cmd['time']} - {cmd['input']}\n"
             
@@ -286,6 +333,22 @@ class CommandHistory:
             if interaction.get("execution_result") == "success":
                 daily_rates[today]["success"] += 1
             
+            # Taxa de sucesso e tempo por ação - só do modo real (a simulação
+            # do modo seguro usa estes tempos como estimativa)
+            step_stats = analytics.setdefault("step_stats", {})
+            real_results = [] if interaction.get("safe_mode", True) else interaction.get("step_results", [])
+            for result in real_results:
+                stats = step_stats.setdefault(result["command"], {
+                    "runs": 0, "success": 0, "cached": 0, "total_duration": 0.0, "max_duration": 0.0})
+                stats["runs"] += 1
+                if result["status"] == "success":
+                    stats["success"] += 1
+                if result["cached"]:
+                    stats["cached"] += 1  # cache não entra no tempo médio
+                else:
+                    stats["total_duration"] += result["duration"] or 0.0
+                    stats["max_duration"] = max(stats["max_duration"], result["duration"] or 0.0)
+            
             # Salva analytics atualizados
             with open(self.analytics_file, 'w', encoding='utf-8') as f:
                 json.dump(analytics, f, ensure_ascii=False, indent=2)
@@ -386,6 +449,18 @@ if __name__ == "__main__":
     for user_input, plan, result, method in test_interactions:
         history.save_interaction(user_input, plan, result, method, "text")
     
+    # Interação com os registros de resultado do Executor (modo real)
+    config_teste["safe_mode"] = False
+    history.save_interaction(
+        "hora e pasta", {"explicacao": "Hora e pasta", "passos": ["obter_hora_atual", "listar_arquivos:X:\\nada"]},
+        "partial", "text", "text",
+        [{"step": "obter_hora_atual", "command": "obter_hora_atual", "status": "success",
+          "duration": 0.002, "output": "🌟 Sol: Agora são 10:00\n", "error": None, "cached": False},
+         {"step": "listar_arquivos:X:\\nada", "command": "listar_arquivos", "status": "failed",
+          "duration": 0.015, "output": "", "error": "❌ Erro ao listar arquivos", "cached": False}]
+    )
+    assert any(s["command"] == "listar_arquivos" for s in history.get_step_stats())
+    
     # Mostra relatório
     print("\n" + history.generate_report())
     
@@ -0,0 +1,185 @@
+"""
+⚡ SolAgent v1.2 - Command Registry (Lista Oficial de Comandos)
+==============================================================
+
+Fonte única dos comandos que o Executor sabe executar.
+Brain e Executor importam daqui - as listas não podem mais divergir.
+
+Funcionalidades:
+- Tabela pré-calculada nome -> handler/aridade/descrição
+- Validação de passo com um split + uma consulta ao dicionário
+- Seção de comandos do prompt da IA gerada a partir da tabela
+- Formato "nome:PARAMETRO" para documentação/help
+
+Autores: Mario, GitHub Copilot & Sol (ela mesma ajudou a se criar!)
+Versão: 1.2 (Audio Revolution) - Tríade Criativa
+Data: 28/10/2025
+"""
+
+from typing import Dict, Optional, Tuple
+
+# ♻️ TTL "a sessão inteira" (ex.: hostname não muda enquanto a Sol roda)
+CACHE_SESSION = float("inf")
+
+# 🗂️ Categorias na ordem em que aparecem no prompt
+CATEGORIES = [
+    ("web", "🌐 NAVEGAÇÃO WEB"),
+    ("sistema", "💻 SISTEMA LOCAL"),
+    ("info", "📊 INFORMAÇÕES"),
+    ("comunicacao", "💬 COMUNICAÇÃO"),
+]
+
+# 📋 TABELA OFICIAL
+# arity 0 -> "comando"          arity 1 -> "comando:PARAMETRO"
+# handler -> "modulo:funcao" (importado só no primeiro uso pelo Executor)
+# resource/exclusive -> ordem na execução paralela: passos do mesmo recurso
+#   esperam o último passo exclusivo; um passo exclusivo espera todos os
+#   anteriores do recurso. Sem "resource" = barreira na execução paralela
+#   (espera tudo antes dele e tudo depois espera por ele), a não ser que
+#   o comando seja "pure".
+# pure -> sem efeitos no sistema (só informa): roda em paralelo com qualquer passo.
+# implied -> dispensável quando outro passo do mesmo recurso está no plano
+#   (abrir_url já abre o navegador sozinho). Usado pelo core/plan_optimizer.py.
+# spawns -> o passo abre um processo (navegador, programa, comando do sistema).
+# site -> a pesquisa já abre esse site (abrir_url da página inicial dele sobra).
+# cache_ttl -> segundos que o resultado pode ser reaproveitado (ações somente
+#   leitura); um dict define o TTL por parâmetro. Sem "cache_ttl" = sem cache.
+# timeout -> segundos até o watchdog interromper o passo (core/watchdog.py);
+#   sem "timeout" = step_timeout_seconds da configuração (padrão 30s).
+COMMANDS: Dict[str, Dict[str, object]] = {
+    # Navegação Web
+    "abrir_navegador": {"arity": 0, "param": None, "category": "web",
+                        "handler": "actions.browser_actions:abrir_navegador",
+                        "resource": "navegador", "exclusive": True, "implied": True, "spawns": True,
+                        "description": "Abre o navegador padrão"},
+    "abrir_url": {"arity": 1, "param": "URL_COMPLETA", "category": "web",
+                  "handler": "actions.browser_actions:abrir_url",
+                  "resource": "navegador", "exclusive": False, "spawns": True,
+                  "description": "Abre uma URL específica"},
+    "pesquisar_no_youtube": {"arity": 1, "param": "TERMO", "category": "web",
+                             "handler": "actions.browser_actions:pesquisar_no_youtube",
+                             "resource": "navegador", "exclusive": False, "spawns": True,
+                             "site": "youtube.com",
+                             "description": "Pesquisa no YouTube"},
+    "pesquisar_google": {"arity": 1, "param": "TERMO", "category": "web",
+                         "handler": "actions.browser_actions:pesquisar_google",
+                         "resource": "navegador", "exclusive": False, "spawns": True,
+                         "site": "google.com",
+                         "description": "Pesquisa no Google"},
+
+    # Sistema Local
+    "abrir_explorador_arquivos": {"arity": 0, "param": None, "category": "sistema",
+                                  "handler": "actions.system_actions:abrir_explorador",
+                                  "spawns": True,
+                                  "description": "Abre o explorador de arquivos"},
+    "criar_pasta": {"arity": 1, "param": "CAMINHO_COMPLETO", "category": "sistema",
+                    "handler": "actions.system_actions:criar_pasta",
+                    "resource": "arquivos", "exclusive": True,
+                    "description": "Cria uma nova pasta"},
+    "abrir_programa": {"arity": 1, "param": "NOME_PROGRAMA", "category": "sistema",
+                       "handler": "actions.system_actions:abrir_programa",
+                       "spawns": True,
+                       "description": "Abre um programa/aplicativo"},
+    "listar_arquivos": {"arity": 1, "param": "CAMINHO|pagina=N|ordem=nome/tamanho/data", "category": "sistema",
+                        "handler": "actions.system_actions:listar_arquivos",
+                        "resource": "arquivos", "exclusive": False,
+                        "description": "Lista arquivos de um diretório (10 por página)"},
+    "buscar_arquivo": {"arity": 1, "param": "TERMO", "category": "sistema",
+                       "handler": "actions.file_actions:buscar_arquivo",
+                       "resource": "arquivos", "exclusive": False,
+                       "description": "Procura arquivos pelo nome nas pastas indexadas"},
+    "tamanho_pasta": {"arity": 1, "param": "CAMINHO", "category": "sistema",
+                      "handler": "actions.file_actions:tamanho_pasta",
+                      "resource": "arquivos", "exclusive": False,
+                      "timeout": 300,
+                      "description": "Tamanho de uma pasta e o que mais ocupa espaço"},
+    "encontrar_duplicados": {"arity": 1, "param": "CAMINHO", "category": "sistema",
+                             "handler": "actions.file_actions:encontrar_duplicados",
+                             "resource": "arquivos", "exclusive": False,
+                             "timeout": 600,
+                             "description": "Procura arquivos duplicados (só informa, não apaga)"},
+
+    # Informações
+    "obter_data_atual": {"arity": 0, "param": None, "category": "info",
+                         "handler": "actions.system_actions:obter_data_atual",
+                         "pure": True,
+                         "description": "Mostra a data atual"},
+    "obter_hora_atual": {"arity": 0, "param": None, "category": "info",
+                         "handler": "actions.system_actions:obter_hora_atual",
+                         "pure": True,
+                         "description": "Mostra a hora atual"},
+    "mostrar_status_sistema": {"arity": 0, "param": None, "category": "info",
+                               "handler": "actions.system_actions:mostrar_status_sistema",
+                               "pure": True,
+                               "description": "Informações detalhadas do PC"},
+    "executar_comando": {"arity": 1, "param": "COMANDO_SEGURO", "category": "info",
+                         "handler": "actions.system_actions:executar_comando",
+                         "spawns": True, "timeout": 90,
+                         "cache_ttl": {"hostname": CACHE_SESSION, "whoami": CACHE_SESSION,
+                                       "systeminfo": 600, "ipconfig": 60},
+                         "description": "Executa comando seguro do sistema"},
+
+    # Comunicação
+    "falar_para_usuario": {"arity": 1, "param": "MENSAGEM", "category": "comunicacao",
+                           "handler": "actions.communication_actions:falar_para_usuario",
+                           "pure": True,
+                           "description": "Envia mensagem ao usuário"},
+}
+
+
+def parse_step(step: str) -> Tuple[str, Optional[str]]:
+    """
+    ✂️ Separa um passo em (comando, parâmetro)
+
+    "abrir_url:https://x.com" -> ("abrir_url", "https://x.com")
+    "obter_hora_atual"        -> ("obter_hora_atual", None)
+    """
+    verb, sep, arg = step.partition(":")
+    return verb, (arg if sep else None)
+
+
+def is_valid_step(step: str) -> bool:
+    """✅ O passo usa um comando oficial com o número certo de parâmetros?"""
+    if not isinstance(step, str):
+        return False
+    verb, arg = parse_step(step)
+    spec = COMMANDS.get(verb)
+    if spec is None:
+        return False
+    return (arg is not None) == (spec["arity"] == 1)
+
+
+def command_signature(name: str) -> str:
+    """🏷️ Forma documentada do comando ("abrir_url:URL_COMPLETA")"""
+    spec = COMMANDS[name]
+    return f"{name}:{spec['param']}" if spec["arity"] else name
+
+
+def get_command_descriptions() -> Dict[str, str]:
+    """📋 Dicionário assinatura -> descrição (para help e documentação)"""
+    return {command_signature(name): spec["description"] for name, spec in COMMANDS.items()}
+
+
+def render_prompt_commands() -> str:
+    """🧠 Seção "COMANDOS OFICIAIS" do prompt da IA, agrupada por categoria"""
+    sections = []
+    for category, title in CATEGORIES:
+        lines = [f"• {command_signature(name)}"
+                 for name, spec in COMMANDS.items() if spec["category"] == category]
+        if lines:
+            sections.append(f"{title}:\n" + "\n".join(lines))
+    return "\n\n".join(sections)
+
+# 🎯 EXEMPLO DE USO E TESTE
+if __name__ == "__main__":
+    print("📋 SolAgent Command Registry v1.2 - Testando...")
+
+    assert is_valid_step("obter_hora_atual")
+    assert is_valid_step("abrir_url:https://www.youtube.com")
+    assert is_valid_step("executar_comando:")
+    assert not is_valid_step("obter_hora_atual:agora")
+    assert not is_valid_step("abrir_url")
+    assert not is_valid_step("formatar_disco:C:")
+
+    print(render_prompt_commands())
+    print("\n✅ Teste concluído!")
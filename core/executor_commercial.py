@@ -17,13 +17,22 @@ Versão: 1.1 (Comercial) - Tríade Criativa
 Data: 28/10/2025
 """
 
-import os
-import webbrowser
-import subprocess
-import urllib.parse
-from datetime import datetime
+import importlib
+import re
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
-def execute_steps(steps: list, log, config: dict = None) -> None:
+from core import command_registry, side_effects, tracer, watchdog
+
+# 🔌 Handlers já carregados (comando -> função)
+_handler_cache = {}
+
+# 📦 Tamanho máximo da saída guardada em cada registro de resultado
+MAX_RESULT_OUTPUT_CHARS = 4000
+
+def execute_steps(steps: list, log, config: dict = None, depends_on: dict = None) -> list:
     """
     🚀 FUNÇÃO PRINCIPAL: Executa lista de comandos estruturados
     
@@ -31,17 +40,28 @@ def execute_steps(steps: list, log, config: dict = None) -> None:
         steps (list): Lista de comandos no formato ["comando", "comando:parametro"]
         log: Instância do logger para registro de ações
         config (dict): Configurações carregadas (safe_mode, etc.)
+        depends_on (dict): Opcional - dependências explícitas do plano,
+            {"3": [1, 2]} = passo 3 só roda depois dos passos 1 e 2
+    
+    Returns:
+        list: Um registro por passo, na ordem do plano (ver _run_step):
+              step, command, status, duration, output, error, cached, effects
     
     Fluxo:
         1. Verifica modo de operação (seguro vs execução real)
-        2. Executa cada passo sequencialmente  
-        3. Registra logs detalhados
-        4. Trata erros graciosamente
+        2. Executa os passos (em paralelo quando independentes, se ativado),
+           cada um vigiado pelo watchdog (tempo limite + cancelamento)
+        3. Registra logs detalhados, sempre na ordem do plano
+        4. Trata erros graciosamente - Ctrl+C/Esc cancelam só este plano
     """
     # 🔒 CONFIGURAÇÃO DE SEGURANÇA
     safe_mode = True
+    parallel = False
+    max_workers = 4
     if config:
         safe_mode = config.get("safe_mode", True)
+        parallel = config.get("parallel_execution", False)  # opt-in: ordem/saída mudam
+        max_workers = config.get("parallel_max_workers", 4)
     
     # 📢 ANÚNCIO DO MODO
     if safe_mode:
@@ -50,326 +70,433 @@ def execute_steps(steps: list, log, config: dict = None) -> None:
         log.log("⚡ MODO EXECUÇÃO REAL - ALTERANDO O SISTEMA")
         log.log("⚠️ CUIDADO: Ações serão executadas no Windows")
     
-    # 🎯 EXECUÇÃO PASSO A PASSO
-    for i, step in enumerate(steps, start=1):
-        log.log(f"📝 Passo {i}/{len(steps)}: {step}")
-        
-        try:
-            _execute_single_step(step, log, safe_mode)
-        except Exception as e:
-            log.error(f"❌ Erro ao executar passo '{step}': {str(e)}")
-            # Continua com próximo passo mesmo se houver erro
+    watchdog.reset()
+    router = _StepOutputRouter(sys.stdout)
+    sys.stdout = router
+    try:
+        with tracer.span("execute_steps", "executor", steps=len(steps), parallel=bool(parallel and len(steps) > 1)):
+            # ⚡ EXECUÇÃO PARALELA (passos independentes ao mesmo tempo)
+            if parallel and len(steps) > 1:
+                results = _execute_parallel(steps, log, safe_mode, depends_on, max_workers, router, config)
+            else:
+                # 🎯 EXECUÇÃO PASSO A PASSO
+                results = [_run_step(i, len(steps), step, log, safe_mode, router, config)
+                           for i, step in enumerate(steps, start=1)]
+    finally:
+        sys.stdout = router.original
+    
+    if watchdog.is_cancelled():
+        log.warning("🚫 Plano cancelado pelo usuário")
+    return results
 
-def _execute_single_step(step: str, log, safe_mode: bool) -> None:
+def _run_step(number: int, total: int, step: str, log, safe_mode: bool, router=None, config: dict = None) -> dict:
     """
-    🎯 EXECUTA UM ÚNICO COMANDO
+    📝 Executa um passo com log e tratamento de erro (não interrompe o plano)
     
-    Interpreta o comando e chama a função específica correspondente.
-    Todos os comandos respeitam o safe_mode.
+    O passo roda vigiado pelo watchdog: passou do tempo limite ou o plano
+    foi cancelado -> o passo é abandonado e os processos que ele abriu
+    são encerrados. Com o plano já cancelado o passo nem começa.
+    
+    Returns:
+        dict: Registro do resultado
+            - step/command: passo do plano e o comando dele
+            - status: "success", "failed" (handler retornou False),
+              "error" (exceção), "unknown" (comando fora do registro),
+              "timeout" (passou do tempo limite) ou "cancelled"
+            - duration: segundos
+            - output: o que o passo mostrou (sem as linhas do log)
+            - error: última mensagem de erro do passo (ou None)
+            - cached: resultado reaproveitado do cache
+            - effects: o que o passo alterou no sistema - ou, no modo
+              seguro, alteraria (ver core/side_effects.py)
     """
+    verb = command_registry.parse_step(step)[0] if isinstance(step, str) else str(step)
+    step_log = _StepLog(log)
+    status, cached = "error", False
+    if watchdog.is_cancelled():
+        log.warning(f"🚫 Passo {number}/{total} não executado (plano cancelado): {step}")
+        return {"step": step, "command": verb, "status": "cancelled", "duration": 0.0,
+                "output": "", "error": None, "cached": False, "effects": []}
     
-    # 🌐 NAVEGAÇÃO WEB
-    if step == "abrir_navegador":
-        _abrir_navegador(log, safe_mode)
-        
-    elif step.startswith("abrir_url:"):
-        url = step.replace("abrir_url:", "", 1)
-        _abrir_url(url, log, safe_mode)
-        
-    elif step.startswith("pesquisar_no_youtube:"):
-        termo = step.replace("pesquisar_no_youtube:", "", 1)
-        _pesquisar_youtube(termo, log, safe_mode)
-        
-    elif step.startswith("pesquisar_google:"):
-        termo = step.replace("pesquisar_google:", "", 1)
-        _pesquisar_google(termo, log, safe_mode)
+    log.log(f"📝 Passo {number}/{total}: {step}")
+    timeout = watchdog.step_timeout(verb, config)
+    if router:
+        router.record_start()
+        shared_output = router.share()
+    effects = []
+    start = time.perf_counter()
     
-    # 💻 SISTEMA LOCAL
-    elif step == "abrir_explorador_arquivos":
-        _abrir_explorador(log, safe_mode)
-        
-    elif step.startswith("criar_pasta:"):
-        pasta = step.replace("criar_pasta:", "", 1)
-        _criar_pasta(pasta, log, safe_mode)
-        
-    elif step.startswith("abrir_programa:"):
-        programa = step.replace("abrir_programa:", "", 1)
-        _abrir_programa(programa, log, safe_mode)
-        
-    elif step.startswith("listar_arquivos:"):
-        caminho = step.replace("listar_arquivos:", "", 1)
-        _listar_arquivos(caminho, log, safe_mode)
+    def run():
+        # A thread do watchdog escreve na mesma saída (buffer/gravação) do passo
+        if router:
+            router.adopt(shared_output)
+        side_effects.begin_step(effects)
+        return _execute_single_step(step, step_log, safe_mode)
+    
+    try:
+        with tracer.span(step, "executor", number=number) as span:
+            outcome, value = watchdog.run_guarded(run, timeout, name=verb)
+            if outcome == "done":
+                status, cached = value
+            else:
+                status = outcome
+                if outcome == "timeout":
+                    step_log.error(f"⏰ Passo '{step}' passou do tempo limite ({timeout:g}s)")
+                    print(f"🌟 Sol: ⏰ '{step}' demorou demais e foi interrompido")
+                else:
+                    log.warning(f"🚫 Passo '{step}' cancelado pelo usuário")
+                    print(f"🌟 Sol: 🚫 '{step}' cancelado")
+                if value:
+                    log.log(f"🛑 {value} processo(s) aberto(s) pelo passo encerrado(s)")
+            span.set(status=status)
+    except Exception as e:
+        step_log.error(f"❌ Erro ao executar passo '{step}': {str(e)}")
+        # Continua com próximo passo mesmo se houver erro
+    finally:
+        duration = time.perf_counter() - start
+        output = router.record_stop() if router else ""
+    
+    output = _strip_log_lines(output)
+    if len(output) > MAX_RESULT_OUTPUT_CHARS:
+        output = output[:MAX_RESULT_OUTPUT_CHARS] + "\n... (saída truncada)\n"
+    return {
+        "step": step,
+        "command": verb,
+        "status": status,
+        "duration": round(duration, 4),
+        "output": output,
+        "error": step_log.last_error,
+        "cached": cached,
+        "effects": list(effects),
+    }
+
+class _StepLog:
+    """
+    📝 Logger de um passo: repassa tudo ao logger da sessão e guarda
+    a última mensagem de erro para o registro de resultado
+    """
+    
+    def __init__(self, log):
+        self._log = log
+        self.last_error = None
+    
+    def error(self, msg) -> None:
+        self.last_error = str(msg)
+        self._log.error(msg)
+    
+    def __getattr__(self, name):
+        return getattr(self._log, name)
+
+# ⚡ EXECUÇÃO PARALELA
+
+class _StepOutputRouter:
+    """
+    🔀 Substitui sys.stdout durante a execução do plano
+    
+    - Execução paralela: cada thread de passo escreve no seu próprio buffer;
+      as demais threads continuam escrevendo direto no console. Assim a saída
+      de cada passo é mostrada inteira e na ordem do plano.
+    - Gravação: um passo pode "gravar" a própria saída (sem deixar de
+      mostrá-la) - para o registro de resultado e para o cache. Gravações
+      podem ser aninhadas (pilha por thread).
+    """
+    
+    def __init__(self, original):
+        self.original = original
+        self._local = threading.local()
+    
+    def begin(self) -> None:
+        self._local.buffer = []
+    
+    def end(self) -> str:
+        output = "".join(self._local.buffer)
+        self._local.buffer = None
+        return output
+    
+    def record_start(self) -> None:
+        if getattr(self._local, "recordings", None) is None:
+            self._local.recordings = []
+        self._local.recordings.append([])
     
-    # 📊 INFORMAÇÕES DO SISTEMA
-    elif step == "obter_data_atual":
-        _obter_data_atual(log, safe_mode)
+    def record_stop(self) -> str:
+        recordings = getattr(self._local, "recordings", None)
+        return "".join(recordings.pop()) if recordings else ""
+    
+    def share(self):
+        """🔗 Buffer e gravações desta thread, para outra thread adotar"""
+        return getattr(self._local, "buffer", None), list(getattr(self._local, "recordings", None) or [])
+    
+    def adopt(self, shared) -> None:
+        """🔗 Esta thread passa a escrever no buffer/gravações de share()"""
+        buffer, recordings = shared
+        self._local.buffer = buffer
+        self._local.recordings = list(recordings)  # pilha própria, mesmas gravações
+    
+    def write(self, text: str) -> int:
+        for recording in getattr(self._local, "recordings", None) or ():
+            recording.append(text)
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is not None:
+            buffer.append(text)
+            return len(text)
+        return self.original.write(text)
+    
+    def flush(self) -> None:
+        self.original.flush()
+
+def _build_dependency_graph(steps: list, depends_on: dict, log) -> list:
+    """
+    🕸️ Monta o grafo de dependências (índice -> conjunto de índices anteriores)
+    
+    Dependências implícitas vêm das colunas resource/exclusive do registro
+    (ex.: abrir_url espera abrir_navegador). Passo sem "resource" e sem
+    "pure" (efeitos desconhecidos: comandos, programas) é uma barreira:
+    espera todos os anteriores e todos os seguintes esperam por ele.
+    Dependências explícitas vêm do campo "depends_on" do plano; só valem
+    para passos anteriores.
+    """
+    deps = [set() for _ in steps]
+    last_exclusive = {}
+    shared_since = {}
+    last_barrier = None
+    since_barrier = []
+    
+    for idx, step in enumerate(steps):
+        verb, _ = command_registry.parse_step(step) if isinstance(step, str) else (None, None)
+        spec = command_registry.COMMANDS.get(verb, {})
+        resource = spec.get("resource")
+        
+        if spec.get("pure"):
+            continue  # só informa: não depende de nada nem segura ninguém
         
-    elif step == "obter_hora_atual":
-        _obter_hora_atual(log, safe_mode)
+        # 🚧 Barreira: mantém a ordem pedida pelo usuário
+        if resource is None:
+            deps[idx].update(since_barrier)
+            if last_barrier is not None:
+                deps[idx].add(last_barrier)
+            last_barrier = idx
+            since_barrier = []
+            continue
+        if last_barrier is not None:
+            deps[idx].add(last_barrier)
+        since_barrier.append(idx)
         
-    elif step == "mostrar_status_sistema":
-        _mostrar_status_sistema(log, safe_mode)
+        if resource in last_exclusive:
+            deps[idx].add(last_exclusive[resource])
         
-    elif step.startswith("executar_comando:"):
-        comando = step.replace("executar_comando:", "", 1)
-        _executar_comando_sistema(comando, log, safe_mode)
+        if spec.get("exclusive"):
+            deps[idx].update(shared_since.get(resource, []))
+            last_exclusive[resource] = idx
+            shared_since[resource] = []
+        else:
+            shared_since.setdefault(resource, []).append(idx)
+    
+    if isinstance(depends_on, dict):
+        for key, values in depends_on.items():
+            try:
+                idx = int(key) - 1
+                required = [int(v) - 1 for v in (values if isinstance(values, list) else [values])]
+            except (TypeError, ValueError):
+                log.warning(f"⚠️ Dependência inválida ignorada: {key} -> {values}")
+                continue
+            
+            for dep in required:
+                if 0 <= dep < idx < len(steps):
+                    deps[idx].add(dep)
+                else:
+                    log.warning(f"⚠️ Dependência inválida ignorada: passo {key} -> {dep + 1}")
     
-    # 💬 COMUNICAÇÃO
-    elif step.startswith("falar_para_usuario:"):
-        mensagem = step.replace("falar_para_usuario:", "", 1)
-        _falar_para_usuario(mensagem, log)
+    return deps
+
+def _execute_parallel(steps: list, log, safe_mode: bool, depends_on: dict, max_workers: int, router,
+                      config: dict = None) -> list:
+    """
+    ⚡ Executa passos independentes em um pool de threads limitado
     
+    Um passo é enviado ao pool assim que suas dependências terminam.
+    A saída é exibida na ordem do plano, assim que o prefixo fica pronto.
+    Retorna os registros de resultado na ordem do plano.
+    """
+    deps = _build_dependency_graph(steps, depends_on, log)
+    total = len(steps)
+    outputs = [None] * total
+    results = [None] * total
+    pending = list(range(total))
+    done = set()
+    running = {}
+    next_to_show = 0
+    start = time.perf_counter()
+    
+    def run_captured(idx: int):
+        router.begin()
+        try:
+            result = _run_step(idx + 1, total, steps[idx], log, safe_mode, router, config)
+        finally:
+            output = router.end()
+        return output, result
+    
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        while pending or running:
+            for idx in [i for i in pending if deps[i] <= done]:
+                pending.remove(idx)
+                running[pool.submit(run_captured, idx)] = idx
+            
+            try:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            except KeyboardInterrupt:
+                # Ctrl+C: os passos em andamento param, os pendentes nem começam
+                watchdog.request_cancel()
+                continue
+            for future in finished:
+                idx = running.pop(future)
+                outputs[idx], results[idx] = future.result()
+                done.add(idx)
+            
+            while next_to_show < total and outputs[next_to_show] is not None:
+                router.original.write(outputs[next_to_show])
+                next_to_show += 1
+    
+    log.debug(f"⚡ {total} passos executados em {(time.perf_counter() - start) * 1000:.0f} ms (até {max_workers} em paralelo)")
+    return results
+
+def _execute_single_step(step: str, log, safe_mode: bool):
+    """
+    🎯 EXECUTA UM ÚNICO COMANDO
+    
+    Separa o passo uma única vez em (comando, parâmetro) e chama o handler
+    registrado em core/command_registry.py. Todos os comandos respeitam o safe_mode.
+    
+    Returns:
+        tuple: (status, veio_do_cache)
+    """
     # 🔧 COMANDOS ESPECIAIS
-    elif step == "interpretar_resposta_ia":
+    if step == "interpretar_resposta_ia":
         log.log("🤖 Interpretando resposta da IA...")
+        return "success", False
     
     # ⚠️ COMANDO DESCONHECIDO
-    else:
+    if not command_registry.is_valid_step(step):
         log.warning(f"⚠️ Comando não reconhecido: {step}")
-        _falar_para_usuario(f"Desculpe, não sei como executar: {step}", log)
-
-# 🌐 FUNÇÕES DE NAVEGAÇÃO WEB
-
-def _abrir_navegador(log, safe_mode: bool) -> None:
-    """🌐 Abre o navegador padrão do sistema"""
-    log.log("🌐 Abrindo navegador padrão...")
-    if not safe_mode:
-        webbrowser.open("about:blank")
-
-def _abrir_url(url: str, log, safe_mode: bool) -> None:
-    """🔗 Abre uma URL específica no navegador"""
-    log.log(f"🔗 Abrindo URL: {url}")
-    if not safe_mode:
-        webbrowser.open(url)
-
-def _pesquisar_youtube(termo: str, log, safe_mode: bool) -> None:
-    """🎥 Pesquisa um termo no YouTube"""
-    termo_encoded = urllib.parse.quote(termo)
-    search_url = f"https://www.youtube.com/results?search_query={termo_encoded}"
-    log.log(f"🎥 Pesquisando no YouTube: {termo}")
-    if not safe_mode:
-        webbrowser.open(search_url)
-
-def _pesquisar_google(termo: str, log, safe_mode: bool) -> None:
-    """🔍 Pesquisa um termo no Google"""
-    termo_encoded = urllib.parse.quote(termo)
-    search_url = f"https://www.google.com/search?q={termo_encoded}"
-    log.log(f"🔍 Pesquisando no Google: {termo}")
-    if not safe_mode:
-        webbrowser.open(search_url)
-
-# 💻 FUNÇÕES DO SISTEMA LOCAL
-
-def _abrir_explorador(log, safe_mode: bool) -> None:
-    """📁 Abre o Windows Explorer"""
-    log.log("📁 Abrindo explorador de arquivos...")
-    if not safe_mode:
-        try:
-            os.system("start explorer")
-            log.log("✅ Explorador aberto com sucesso")
-        except Exception as e:
-            log.error(f"❌ Erro ao abrir explorador: {str(e)}")
+        _resolve_handler("falar_para_usuario")(f"Desculpe, não sei como executar: {step}", log, safe_mode)
+        return "unknown", False
+    
+    verb, arg = command_registry.parse_step(step)
+    handler = _resolve_handler(verb)
+    
+    # ♻️ AÇÕES SOMENTE LEITURA: reaproveita resultado recente
+    cache_key, cache_ttl = _cache_policy(verb, arg, safe_mode)
+    router = sys.stdout if isinstance(sys.stdout, _StepOutputRouter) else None
+    if cache_key and router:
+        cached = _result_cache.get(cache_key)
+        if cached:
+            output, age = cached
+            log.log(f"♻️ Resultado em cache ({age:.0f}s atrás): {step}")
+            print(f"🌟 Sol: ♻️ (resultado em cache de {age:.0f}s atrás)")
+            sys.stdout.write(output)
+            return "success", True
+        router.record_start()
+    
+    try:
+        if command_registry.COMMANDS[verb]["arity"]:
+            result = handler(arg, log, safe_mode)
+        else:
+            result = handler(log, safe_mode)
+    finally:
+        output = router.record_stop() if cache_key and router else None
+    
+    # Handlers retornam False quando falham - falhas não vão para o cache
+    if output is not None and result is not False:
+        _result_cache.put(cache_key, _strip_log_lines(output), cache_ttl)
+    return ("failed" if result is False else "success"), False
 
-def _criar_pasta(pasta: str, log, safe_mode: bool) -> None:
-    """📂 Cria uma nova pasta no sistema"""
-    log.log(f"📂 Criando pasta em: {pasta}")
-    if not safe_mode:
-        try:
-            os.makedirs(pasta, exist_ok=True)
-            log.log(f"✅ Pasta criada com sucesso: {pasta}")
-        except Exception as e:
-            log.error(f"❌ Erro ao criar pasta: {str(e)}")
+# ♻️ CACHE DE RESULTADOS (ações somente leitura)
 
-def _abrir_programa(programa: str, log, safe_mode: bool) -> None:
-    """🚀 Abre um programa/aplicativo"""
-    log.log(f"🚀 Abrindo programa: {programa}")
-    if not safe_mode:
-        try:
-            # 📋 PROGRAMAS COMUNS MAPEADOS
-            programas_comuns = {
-                "notepad": "notepad.exe",
-                "bloco": "notepad.exe", 
-                "calculadora": "calc.exe",
-                "calc": "calc.exe",
-                "paint": "mspaint.exe",
-                "cmd": "cmd.exe",
-                "terminal": "cmd.exe",
-                "powershell": "powershell.exe"
-            }
-            
-            comando = programas_comuns.get(programa.lower(), programa)
-            subprocess.Popen(comando, shell=True)
-            log.log(f"✅ Programa {programa} aberto com sucesso")
-        except Exception as e:
-            log.error(f"❌ Erro ao abrir programa {programa}: {str(e)}")
+class _ResultCache:
+    """
+    ♻️ Saída de ações somente leitura, com TTL por comando
+    
+    O TTL vem da coluna "cache_ttl" do registro: hostname/whoami valem pela
+    sessão inteira, systeminfo por minutos, status de memória por segundos.
+    """
+    
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: str):
+        """Retorna (saída, idade em segundos) ou None se não houver/expirou"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, expires_at, output = entry
+            if now >= expires_at:
+                del self._entries[key]
+                return None
+            return output, now - stored_at
+    
+    def put(self, key: str, output: str, ttl: float) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (now, now + ttl, output)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
 
-def _listar_arquivos(caminho: str, log, safe_mode: bool) -> None:
-    """📋 Lista arquivos de um diretório"""
-    log.log(f"📋 Listando arquivos em: {caminho}")
-    if not safe_mode:
-        try:
-            if os.path.exists(caminho):
-                arquivos = os.listdir(caminho)
-                print(f"🌟 Sol: Encontrei {len(arquivos)} itens em {caminho}:")
-                for arquivo in arquivos[:10]:  # Limita a 10 itens
-                    icone = "📁" if os.path.isdir(os.path.join(caminho, arquivo)) else "📄"
-                    print(f"  {icone} {arquivo}")
-                if len(arquivos) > 10:
-                    print(f"  📦 ... e mais {len(arquivos) - 10} itens")
-            else:
-                print(f"🌟 Sol: O caminho {caminho} não existe")
-        except Exception as e:
-            log.error(f"❌ Erro ao listar arquivos: {str(e)}")
-    else:
-        log.debug(f"(safe_mode) Listagem simulada de {caminho}")
-        print(f"🌟 Sol: (Modo seguro) Simulando listagem de arquivos em {caminho}")
+_result_cache = _ResultCache()
 
-# 📊 FUNÇÕES DE INFORMAÇÕES DO SISTEMA
+# Linhas do Logger ("[2025-10-28 10:00:00] [INFO] ...") não fazem parte do resultado
+_LOG_LINE_RE = re.compile(r"^\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\] \[[A-Z]+\] ")
 
-def _obter_data_atual(log, safe_mode: bool) -> None:
-    """📅 Obtém e exibe a data atual"""
-    hoje = datetime.now().strftime("%d/%m/%Y")
-    log.log(f"📅 Data atual detectada: {hoje}")
-    print(f"🌟 Sol: Hoje é {hoje}")
+def _cache_policy(verb: str, arg, safe_mode: bool):
+    """🔑 (chave normalizada, ttl) do passo - ou (None, None) se não for cacheável"""
+    ttl = command_registry.COMMANDS[verb].get("cache_ttl")
+    normalized_arg = (arg or "").strip().casefold()
+    if isinstance(ttl, dict):
+        ttl = ttl.get(normalized_arg)
+    if not ttl:
+        return None, None
+    
+    mode = "seguro" if safe_mode else "real"
+    return f"{mode}|{verb}:{normalized_arg}", ttl
 
-def _obter_hora_atual(log, safe_mode: bool) -> None:
-    """⏰ Obtém e exibe a hora atual"""
-    agora = datetime.now().strftime("%H:%M:%S")
-    log.log(f"⏰ Hora atual detectada: {agora}")
-    print(f"🌟 Sol: Agora são {agora}")
+def _strip_log_lines(output: str) -> str:
+    return "".join(line for line in output.splitlines(keepends=True) if not _LOG_LINE_RE.match(line))
 
-def _mostrar_status_sistema(log, safe_mode: bool) -> None:
-    """📊 Mostra informações detalhadas do sistema"""
-    log.log("📊 Coletando informações do sistema...")
-    try:
-        import platform
-        # psutil é opcional - se não tiver, mostra info básica
-        try:
-            import psutil
-            memoria = psutil.virtual_memory()
-            disco = psutil.disk_usage('C:')
-            tem_psutil = True
-        except ImportError:
-            tem_psutil = False
-        
-        sistema = platform.system()
-        versao = platform.version()
-        processador = platform.processor()
-        
-        print("🌟 Sol: Aqui estão as informações do seu sistema:")
-        print(f"  💻 Sistema: {sistema}")
-        print(f"  🔧 Processador: {processador}")
-        print(f"  📅 Data/Hora: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
-        
-        if tem_psutil:
-            print(f"  🧠 Memória: {round(memoria.total / (1024**3), 1)}GB total, {round(memoria.available / (1024**3), 1)}GB disponível")
-            print(f"  💾 Disco C: {round(disco.total / (1024**3), 1)}GB total, {round(disco.free / (1024**3), 1)}GB livre")
-        else:
-            print("  📝 Para informações detalhadas de memória/disco, instale: pip install psutil")
-        
-    except Exception as e:
-        log.error(f"❌ Erro ao obter status do sistema: {str(e)}")
-        print("🌟 Sol: Não consegui obter todas as informações do sistema")
+def clear_result_cache() -> None:
+    """🧹 Descarta todos os resultados em cache"""
+    _result_cache.clear()
 
-def _executar_comando_sistema(comando: str, log, safe_mode: bool) -> None:
-    """⚙️ Executa comandos seguros do sistema Windows"""
-    log.log(f"⚙️ Comando solicitado: {comando}")
-    
-    # 🛡️ LISTA DE COMANDOS SEGUROS PERMITIDOS
-    comandos_seguros = {
-        "ipconfig": "ipconfig",
-        "date": "date /t",
-        "time": "time /t", 
-        "dir": "dir",
-        "whoami": "whoami",
-        "hostname": "hostname",
-        "systeminfo": "systeminfo | findstr /C:\"OS Name\" /C:\"Total Physical Memory\"",
-        "tasklist": "tasklist"
-    }
+def _resolve_handler(verb: str):
+    """
+    🔌 Retorna a função que executa o comando
     
-    if comando.lower() in comandos_seguros:
-        if not safe_mode:
-            try:
-                resultado = subprocess.run(
-                    comandos_seguros[comando.lower()], 
-                    shell=True, 
-                    capture_output=True, 
-                    text=True, 
-                    timeout=10
-                )
-                print(f"🌟 Sol: Resultado do comando '{comando}':")
-                print(resultado.stdout)
-                if resultado.stderr:
-                    log.warning(f"⚠️ Avisos do comando: {resultado.stderr}")
-            except subprocess.TimeoutExpired:
-                log.error("⏰ Comando demorou muito para executar")
-                print("🌟 Sol: O comando demorou muito para responder")
-            except Exception as e:
-                log.error(f"❌ Erro ao executar comando: {str(e)}")
-                print("🌟 Sol: Houve um erro ao executar o comando")
-        else:
-            print(f"🌟 Sol: (Modo seguro) Simulando execução do comando '{comando}'")
-    else:
-        log.warning(f"⚠️ Comando não permitido ou desconhecido: {comando}")
-        comandos_disponiveis = ", ".join(comandos_seguros.keys())
-        print(f"🌟 Sol: Comando '{comando}' não é permitido por segurança")
-        print(f"     Comandos disponíveis: {comandos_disponiveis}")
-
-# 💬 FUNÇÕES DE COMUNICAÇÃO
-
-def _falar_para_usuario(mensagem: str, log) -> None:
-    """💬 Comunica diretamente com o usuário"""
-    log.log(f"💬 Respondendo ao usuário: {mensagem}")
-    print(f"🌟 Sol: {mensagem}")
+    O módulo de ações (actions/*) só é importado no primeiro uso;
+    depois a função fica em cache e o despacho é uma consulta ao dicionário.
+    """
+    handler = _handler_cache.get(verb)
+    if handler is None:
+        module_name, _, function_name = command_registry.COMMANDS[verb]["handler"].partition(":")
+        handler = getattr(importlib.import_module(module_name), function_name)
+        _handler_cache[verb] = handler
+    return handler
 
 # 🏆 FUNÇÕES AUXILIARES E UTILITÁRIOS
 
 def get_available_commands() -> dict:
     """
     📋 Retorna dicionário com todos os comandos disponíveis e suas descrições
-    (Útil para documentação e help)
+    (Útil para documentação e help - vem do registro oficial)
     """
-    return {
-        # Navegação Web
-        "abrir_navegador": "Abre o navegador padrão",
-        "abrir_url:URL": "Abre uma URL específica",
-        "pesquisar_no_youtube:TERMO": "Pesquisa no YouTube",
-        "pesquisar_google:TERMO": "Pesquisa no Google",
-        
-        # Sistema Local  
-        "abrir_explorador_arquivos": "Abre o Windows Explorer",
-        "criar_pasta:CAMINHO": "Cria uma nova pasta",
-        "abrir_programa:NOME": "Abre um programa/aplicativo",
-        "listar_arquivos:CAMINHO": "Lista arquivos de um diretório",
-        
-        # Informações
-        "obter_data_atual": "Mostra a data atual",
-        "obter_hora_atual": "Mostra a hora atual", 
-        "mostrar_status_sistema": "Informações detalhadas do PC",
-        "executar_comando:CMD": "Executa comando seguro do sistema",
-        
-        # Comunicação
-        "falar_para_usuario:MENSAGEM": "Envia mensagem ao usuário"
-    }
+    return command_registry.get_command_descriptions()
 
 def validate_command(command: str) -> bool:
     """
     ✅ Valida se um comando está no formato correto
     """
-    comandos_validos = get_available_commands().keys()
-    
-    # Verifica comandos simples
-    if command in comandos_validos:
-        return True
-    
-    # Verifica comandos com parâmetros
-    for cmd_pattern in comandos_validos:
-        if ":" in cmd_pattern:
-            cmd_base = cmd_pattern.split(":")[0] + ":"
-            if command.startswith(cmd_base):
-                return True
-    
-    return False
+    return command_registry.is_valid_step(command)
 
 # 🎯 EXEMPLO DE USO E TESTE
 if __name__ == "__main__":
@@ -394,7 +521,14 @@ if __name__ == "__main__":
     ]
     
     print("\n🧪 Executando testes...")
-    execute_steps(comandos_teste, log_teste, config_teste)
+    resultados = execute_steps(comandos_teste + ["formatar_disco:C:"], log_teste, config_teste)
+    assert [r["step"] for r in resultados] == comandos_teste + ["formatar_disco:C:"]
+    assert resultados[-1]["status"] == "unknown"
+    assert "Teste de comunicação!" in resultados[2]["output"]
+    
+    print("\n📊 Resultados:")
+    for r in resultados:
+        print(f"  • {r['step']}: {r['status']} em {r['duration'] * 1000:.1f} ms ({len(r['output'])} caracteres)")
     
     print("\n📋 Comandos disponíveis:")
     for cmd, desc in get_available_commands().items():
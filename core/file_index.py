@@ -0,0 +1,463 @@
+"""
+⚡ SolAgent v1.2 - File Index (Índice de Arquivos)
+=================================================
+
+Índice persistente dos nomes de arquivos das pastas configuradas,
+usado pela ação buscar_arquivo ("acha o arquivo do contrato").
+
+Funcionalidades:
+- Banco SQLite em disco (cache/file_index.db) - sobrevive a reinícios
+- Trigramas do nome (sem acentos/maiúsculas) para busca por trecho
+- Tamanho e data de modificação guardados junto com o nome
+- Reindexação incremental em segundo plano: pastas cuja data de
+  modificação não mudou não são lidas de novo (um stat por pasta)
+- Pastas ignoradas configuráveis (node_modules, .git, ...)
+- Só indexa as pastas listadas em "file_index_roots" (nenhuma por padrão)
+
+Autores: Mario, GitHub Copilot & Sol (ela mesma ajudou a se criar!)
+Versão: 1.2 (Audio Revolution) - Tríade Criativa
+Data: 28/10/2025
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Any, Dict, List, Optional
+
+# 🚫 Pastas que quase nunca têm o que o usuário procura
+DEFAULT_EXCLUDES = ["node_modules", "__pycache__", ".git", "$Recycle.Bin", "AppData", "venv", ".venv"]
+
+# 💾 Pastas processadas por transação durante a reindexação
+COMMIT_EVERY_DIRS = 200
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirs (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    parent INTEGER,
+    mtime REAL
+);
+CREATE INDEX IF NOT EXISTS dirs_parent ON dirs(parent);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    dir INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    folded TEXT NOT NULL,
+    size INTEGER,
+    mtime REAL
+);
+CREATE INDEX IF NOT EXISTS files_dir ON files(dir);
+CREATE TABLE IF NOT EXISTS trigrams (
+    tri TEXT NOT NULL,
+    file INTEGER NOT NULL,
+    PRIMARY KEY (tri, file)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS trigram_counts (
+    tri TEXT PRIMARY KEY,
+    n INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def _fold(text: str) -> str:
+    """🔤 Minúsculas e sem acentos ("Relatório" -> "relatorio")"""
+    text = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(ch for ch in text if not unicodedata.combining(ch))
+
+
+def _trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class FileIndex:
+    """
+    🗂️ ÍNDICE DE NOMES DE ARQUIVOS
+
+    Características:
+    - Busca: lê só a lista do trigrama mais raro do termo (contagens
+      mantidas em trigram_counts) e confirma com LIKE - não percorre a
+      tabela de arquivos
+    - Reindexação: compara a data de modificação de cada pasta com a
+      guardada; só pastas alteradas são listadas e só os arquivos
+      adicionados/removidos mexem nos trigramas
+    - Uma conexão protegida por lock, segurado só para ler/gravar o banco:
+      a leitura das pastas (scandir) acontece fora dele, então uma pasta
+      lenta (ex.: de rede) não trava as buscas
+
+    Observação: a data da pasta muda quando entradas são criadas, removidas
+    ou renomeadas - o tamanho de um arquivo editado só é atualizado quando
+    a pasta dele muda por outro motivo.
+    """
+
+    def __init__(self, config: dict, log):
+        self.config = config
+        self.log = log
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # 🔧 CONFIGURAÇÕES
+        self.enabled = config.get("file_index_enabled", True)
+        # Opt-in: sem pastas configuradas nada é indexado (ex.: ["~/Documentos"])
+        self.roots = [os.path.abspath(os.path.expanduser(root))
+                      for root in config.get("file_index_roots") or []]
+        self.excludes = {name.casefold() for name in config.get("file_index_excludes", DEFAULT_EXCLUDES)}
+        self.refresh_seconds = config.get("file_index_refresh_minutes", 30) * 60
+        self.max_results = config.get("file_index_max_results", 20)
+        self.db_path = os.path.abspath(config.get("file_index_path", os.path.join("cache", "file_index.db")))
+
+        # 📊 Estado da última reindexação
+        self.refreshing = False
+        self.last_refresh: Optional[float] = None
+        self.last_stats: Dict[str, Any] = {}
+
+        self._conn = self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        """🚀 Abre (ou cria) o banco do índice"""
+        directory = os.path.dirname(self.db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    # 🔍 BUSCA
+
+    def search(self, term: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        🔍 Arquivos cujo nome contém todas as palavras do termo
+
+        Returns:
+            list: [{"path", "name", "size", "mtime"}, ...] - os mais
+                  recentes primeiro (até o limite)
+        """
+        words = _fold(term).split()
+        if not words:
+            return []
+
+        tris = set()
+        for word in words:
+            tris |= _trigrams(word)
+
+        with self._lock:
+            if tris:
+                # ⚡ Percorre só a lista do trigrama mais raro; o LIKE confirma
+                # as palavras
+                counts = dict(self._conn.execute(
+                    f"SELECT tri, n FROM trigram_counts WHERE tri IN ({','.join('?' * len(tris))})",
+                    sorted(tris)).fetchall())
+                if len(counts) < len(tris):
+                    return []  # algum trigrama não existe em nenhum nome
+                rarest = min(counts, key=counts.get)
+                sql = ("SELECT d.path, f.name, f.size, f.mtime FROM trigrams t "
+                       "JOIN files f ON f.id = t.file JOIN dirs d ON d.id = f.dir WHERE t.tri = ?")
+                params: List[Any] = [rarest]
+            else:
+                # Palavras com menos de 3 letras: sem trigramas, varre os nomes
+                sql = "SELECT d.path, f.name, f.size, f.mtime FROM files f JOIN dirs d ON d.id = f.dir WHERE 1"
+                params = []
+
+            for word in words:
+                sql += " AND f.folded LIKE ? ESCAPE '\\'"
+                params.append("%" + word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%")
+            # Ordena antes do LIMIT: os mais recentes de todos, não de uma amostra
+            sql += " ORDER BY f.mtime DESC LIMIT ?"
+            params.append(limit or self.max_results)
+
+            rows = self._conn.execute(sql, params).fetchall()
+
+        return [{"path": os.path.join(path, name), "name": name, "size": size, "mtime": mtime}
+                for path, name, size, mtime in rows]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """📈 Tamanho do índice e dados da última reindexação"""
+        with self._lock:
+            files = self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+            dirs = self._conn.execute("SELECT COUNT(*) FROM dirs").fetchone()[0]
+        return {
+            "files": files,
+            "dirs": dirs,
+            "roots": list(self.roots),
+            "refreshing": self.refreshing,
+            "last_refresh": self.last_refresh,
+            "last_stats": dict(self.last_stats),
+        }
+
+    # 🔄 REINDEXAÇÃO
+
+    def start_background_refresh(self) -> None:
+        """🔄 Reindexa agora e depois a cada file_index_refresh_minutes"""
+        if not self.enabled or not self.roots or (self._thread and self._thread.is_alive()):
+            return
+
+        def loop() -> None:
+            while not self._stop.is_set():
+                try:
+                    self.refresh()
+                except Exception as e:
+                    self.log.error(f"❌ Erro ao indexar arquivos: {str(e)}")
+                self._stop.wait(self.refresh_seconds)
+
+        self._thread = threading.Thread(target=loop, name="sol-file-index", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """🛑 Interrompe a reindexação em segundo plano"""
+        self._stop.set()
+
+    def refresh(self) -> Dict[str, Any]:
+        """
+        🔄 Atualiza o índice de todas as pastas raiz
+
+        Returns:
+            dict: dirs_scanned, dirs_unchanged, dirs_removed, files_added,
+                  files_removed, duration
+        """
+        start = time.perf_counter()
+        stats = {"dirs_scanned": 0, "dirs_unchanged": 0, "dirs_removed": 0,
+                 "files_added": 0, "files_removed": 0}
+        self.refreshing = True
+        pending = 0
+        try:
+            for root in self.roots:
+                stack = [(root, None)]
+                while stack and not self._stop.is_set():
+                    path, parent = stack.pop()
+                    stack.extend(self._refresh_dir(path, parent, stats))
+                    pending += 1
+                    if pending >= COMMIT_EVERY_DIRS:
+                        with self._lock:
+                            self._conn.commit()
+                        pending = 0
+        finally:
+            with self._lock:
+                self._conn.commit()
+            self.refreshing = False
+
+        stats["duration"] = time.perf_counter() - start
+        self.last_refresh = time.time()
+        self.last_stats = stats
+        self.log.debug(f"🗂️ Índice de arquivos atualizado em {stats['duration']:.1f}s: {stats}")
+        return stats
+
+    def _refresh_dir(self, path: str, parent: Optional[int], stats: Dict[str, int]) -> list:
+        """📂 Atualiza uma pasta e retorna as subpastas a visitar
+
+        stat/scandir rodam sem o lock; ele só é pego para consultar e gravar.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT id, mtime FROM dirs WHERE path = ?", (path,)).fetchone()
+
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            if row:
+                with self._lock:
+                    self._remove_tree_locked(row[0], path, stats)
+            return []
+
+        # ⚡ Pasta sem alterações: reaproveita as subpastas já conhecidas
+        if row and row[1] == mtime:
+            stats["dirs_unchanged"] += 1
+            with self._lock:
+                return [(sub_path, row[0]) for (sub_path,) in
+                        self._conn.execute("SELECT path FROM dirs WHERE parent = ?", (row[0],))]
+
+        stats["dirs_scanned"] += 1
+        files, subdirs = self._scan_dir(path)
+        with self._lock:
+            return self._apply_dir_locked(path, parent, row, mtime, files, subdirs, stats)
+
+    def _scan_dir(self, path: str) -> tuple:
+        """🚶 Lê a pasta: ({nome: (tamanho, mtime)}, {subpastas})"""
+        files = {}
+        subdirs = set()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not self._excluded(entry.name):
+                                subdirs.add(entry.path)
+                        elif entry.is_file(follow_symlinks=False) and not entry.path.startswith(self.db_path):
+                            st = entry.stat(follow_symlinks=False)
+                            files[entry.name] = (st.st_size, st.st_mtime)
+                    except OSError:
+                        continue
+        except OSError:
+            # Sem permissão: guarda a pasta para não tentar de novo até ela mudar
+            pass
+        return files, subdirs
+
+    def _apply_dir_locked(self, path: str, parent: Optional[int], row, mtime: float,
+                          files: dict, subdirs: set, stats: Dict[str, int]) -> list:
+        """💾 Grava no índice o resultado da leitura de uma pasta"""
+        if row:
+            dir_id = row[0]
+            self._conn.execute("UPDATE dirs SET mtime = ?, parent = ? WHERE id = ?", (mtime, parent, dir_id))
+        else:
+            dir_id = self._conn.execute("INSERT INTO dirs (path, parent, mtime) VALUES (?, ?, ?)",
+                                        (path, parent, mtime)).lastrowid
+
+        # 🔀 Diferença entre o que está no índice e o que está na pasta
+        known = {name: (file_id, folded) for file_id, name, folded in
+                 self._conn.execute("SELECT id, name, folded FROM files WHERE dir = ?", (dir_id,))}
+
+        removed = [(file_id, folded) for name, (file_id, folded) in known.items() if name not in files]
+        self._delete_files_locked(removed)
+        stats["files_removed"] += len(removed)
+
+        for name, (size, file_mtime) in files.items():
+            if name in known:
+                self._conn.execute("UPDATE files SET size = ?, mtime = ? WHERE id = ?",
+                                   (size, file_mtime, known[name][0]))
+            else:
+                self._insert_file_locked(dir_id, name, size, file_mtime)
+                stats["files_added"] += 1
+
+        # 🧹 Subpastas que sumiram
+        for sub_id, sub_path in self._conn.execute(
+                "SELECT id, path FROM dirs WHERE parent = ?", (dir_id,)).fetchall():
+            if sub_path not in subdirs:
+                self._remove_tree_locked(sub_id, sub_path, stats)
+
+        return [(sub_path, dir_id) for sub_path in subdirs]
+
+    def _insert_file_locked(self, dir_id: int, name: str, size: int, mtime: float) -> None:
+        folded = _fold(name)
+        file_id = self._conn.execute(
+            "INSERT INTO files (dir, name, folded, size, mtime) VALUES (?, ?, ?, ?, ?)",
+            (dir_id, name, folded, size, mtime)).lastrowid
+        tris = [(tri,) for tri in _trigrams(folded)]
+        self._conn.executemany("INSERT INTO trigrams (tri, file) VALUES (?, ?)",
+                               [(tri, file_id) for (tri,) in tris])
+        self._conn.executemany("INSERT INTO trigram_counts (tri, n) VALUES (?, 1) "
+                               "ON CONFLICT(tri) DO UPDATE SET n = n + 1", tris)
+
+    def _delete_files_locked(self, files: list) -> None:
+        """🗑️ Remove arquivos e seus trigramas (pela chave primária, sem varredura)"""
+        if not files:
+            return
+        pairs = [(tri, file_id) for file_id, folded in files for tri in _trigrams(folded)]
+        self._conn.executemany("DELETE FROM trigrams WHERE tri = ? AND file = ?", pairs)
+        self._conn.executemany("UPDATE trigram_counts SET n = n - 1 WHERE tri = ?", [(tri,) for tri, _ in pairs])
+        self._conn.executemany("DELETE FROM files WHERE id = ?", [(file_id,) for file_id, _ in files])
+
+    def _remove_tree_locked(self, dir_id: int, path: str, stats: Dict[str, int]) -> None:
+        """🧹 Remove uma pasta (e tudo abaixo dela) do índice"""
+        prefix = path.rstrip(os.sep) + os.sep
+        # Faixa [prefixo, prefixo + maior caractere): usa o índice UNIQUE de
+        # path e diferencia maiúsculas (LIKE não diferencia - apagaria a
+        # "Fotos" vizinha ao remover "fotos")
+        dir_ids = [dir_id] + [sub_id for (sub_id,) in self._conn.execute(
+            "SELECT id FROM dirs WHERE path >= ? AND path < ?", (prefix, prefix + chr(0x10FFFF)))]
+
+        for sub_id in dir_ids:
+            files = self._conn.execute("SELECT id, folded FROM files WHERE dir = ?", (sub_id,)).fetchall()
+            self._delete_files_locked(files)
+            stats["files_removed"] += len(files)
+        self._conn.executemany("DELETE FROM dirs WHERE id = ?", [(sub_id,) for sub_id in dir_ids])
+        stats["dirs_removed"] += len(dir_ids)
+
+    def _excluded(self, name: str) -> bool:
+        return name.casefold() in self.excludes
+
+
+# 🌍 ÍNDICE COMPARTILHADO (criado no main, usado pelas ações)
+_index: Optional[FileIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_index(config: Optional[dict] = None, log=None) -> FileIndex:
+    """🗂️ Índice da sessão (criado com a configuração na primeira chamada)"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = FileIndex(config or {}, log)
+        return _index
+
+
+def start(config: dict, log) -> Optional[FileIndex]:
+    """🚀 Cria o índice e inicia a reindexação em segundo plano"""
+    if not config.get("file_index_enabled", True):
+        return None
+    index = get_index(config, log)
+    if not index.roots:
+        log.debug("🗂️ Nenhuma pasta em file_index_roots - índice de arquivos desligado")
+        return None
+    index.start_background_refresh()
+    return index
+
+# 🎯 EXEMPLO DE USO E MICRO-BENCHMARK
+if __name__ == "__main__":
+    import random
+    import shutil
+    import string
+    import tempfile
+
+    print("🗂️ SolAgent File Index v1.2 - Testando...")
+
+    class LogTeste:
+        def log(self, msg): print(f"[LOG] {msg}")
+        def debug(self, msg): print(f"[DEBUG] {msg}")
+        def error(self, msg): print(f"[ERROR] {msg}")
+        def warning(self, msg): print(f"[WARNING] {msg}")
+
+    log_teste = LogTeste()
+    raiz = tempfile.mkdtemp()
+    os.makedirs(os.path.join(raiz, "Documentos", "Jurídico"))
+    os.makedirs(os.path.join(raiz, "node_modules"))
+    for nome in ("Contrato Aluguel.pdf", "contrato_final.docx", "notas.txt"):
+        open(os.path.join(raiz, "Documentos", "Jurídico", nome), "w").close()
+    open(os.path.join(raiz, "node_modules", "contrato.js"), "w").close()
+
+    config_teste = {"file_index_roots": [raiz], "file_index_path": os.path.join(raiz, "idx", "index.db")}
+    indice = FileIndex(config_teste, log_teste)
+    stats = indice.refresh()
+    assert stats["files_added"] == 3, stats
+    assert {r["name"] for r in indice.search("contrato")} == {"Contrato Aluguel.pdf", "contrato_final.docx"}
+    assert [r["name"] for r in indice.search("CONTRATO aluguel")] == ["Contrato Aluguel.pdf"]
+    assert indice.search("juridico") == []  # só nomes de arquivos
+
+    # Incremental: nada mudou -> nenhuma pasta relida
+    stats = indice.refresh()
+    assert stats["dirs_scanned"] == 0 and stats["files_added"] == 0, stats
+
+    os.remove(os.path.join(raiz, "Documentos", "Jurídico", "notas.txt"))
+    shutil.rmtree(os.path.join(raiz, "Documentos", "Jurídico"))
+    stats = indice.refresh()
+    assert stats["dirs_removed"] == 1 and indice.search("contrato") == [], stats
+
+    # ⏱️ Busca em um índice sintético grande
+    n_arquivos = 50_000
+    random.seed(42)
+    with indice._lock:
+        dir_id = indice._conn.execute("INSERT INTO dirs (path, parent, mtime) VALUES (?, NULL, 0)",
+                                      (os.path.join(raiz, "sintetico"),)).lastrowid
+        for i in range(n_arquivos):
+            nome = "".join(random.choice(string.ascii_lowercase) for _ in range(random.randint(6, 14)))
+            indice._insert_file_locked(dir_id, f"{nome}_{i}.txt", i, float(i))
+        indice._insert_file_locked(dir_id, "Contrato Fornecedor 2025.pdf", 1, 1.0)
+        indice._conn.commit()
+
+    for termo in ("contrato", "fornecedor 2025", "txt", "zzzzzz"):
+        inicio = time.perf_counter()
+        resultados = indice.search(termo)
+        print(f"  ⏱️ '{termo}' em {n_arquivos} arquivos: {(time.perf_counter() - inicio) * 1000:.1f} ms "
+              f"({len(resultados)} resultados)")
+
+    # Mais recentes de todos os que batem, não de uma amostra qualquer
+    assert [r["mtime"] for r in indice.search("txt", limit=3)] == [n_arquivos - 1, n_arquivos - 2, n_arquivos - 3]
+
+    # Sem file_index_roots: nada é indexado
+    sem_raiz = FileIndex({"file_index_path": os.path.join(raiz, "idx", "vazio.db")}, log_teste)
+    assert sem_raiz.roots == [] and sem_raiz.refresh()["dirs_scanned"] == 0
+
+    shutil.rmtree(raiz, ignore_errors=True)
+    print("\n✅ Teste concluído!")
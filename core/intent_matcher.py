@@ -0,0 +1,185 @@
+"""
+⚡ SolAgent v1.2 - Intent Matcher (Intenções do Modo Demonstração)
+=================================================================
+
+Reconhecimento de intenções por palavras-chave para o brain offline.
+Todas as palavras-chave viram UMA expressão regular compilada em
+formato de trie, que percorre o comando uma única vez.
+
+Funcionalidades:
+- Regras carregadas de arquivo JSON (core/mock_intents.json)
+- Uma varredura por comando, independente do número de regras
+- Retorna todas as intenções encontradas com pontuação
+- Sem acentos / maiúsculas na comparação ("musica" == "Música")
+- Micro-benchmark embutido (python -m core.intent_matcher)
+
+Autores: Mario, GitHub Copilot & Sol (ela mesma ajudou a se criar!)
+Versão: 1.2 (Audio Revolution) - Tríade Criativa
+Data: 28/10/2025
+"""
+
+import json
+import os
+import re
+import unicodedata
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_INTENTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mock_intents.json")
+
+_FALLBACK_PLAN = {
+    "explicacao": "Modo demonstração ativo - funcionalidades limitadas",
+    "passos": ["falar_para_usuario:Olá! Sou a Sol em modo demonstração."]
+}
+
+
+def _fold(text: str) -> str:
+    """🔤 Minúsculas e sem acentos"""
+    text = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(ch for ch in text if not unicodedata.combining(ch))
+
+
+def _trie_pattern(words: List[str]) -> str:
+    """
+    🌳 Monta uma regex fatorada por prefixo ("hora|horas" -> "hora(?:s)?")
+
+    O motor de regex percorre a trie em vez de testar cada alternativa,
+    então o custo por posição depende do tamanho da palavra, não da lista.
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def build(node: Dict[str, Any]) -> str:
+        terminal = "" in node
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch != ""]
+
+        if not branches:
+            return ""
+        if len(branches) == 1 and not terminal:
+            return branches[0]
+
+        body = "(?:" + "|".join(branches) + ")"
+        return body + "?" if terminal else body
+
+    return build(trie)
+
+
+class IntentMatcher:
+    """
+    🎯 RECONHECEDOR DE INTENÇÕES COMPILADO
+
+    Características:
+    - Palavras-chave casam no início de palavra ("hora" casa "horas")
+    - Pontuação = palavras-chave distintas encontradas x peso da intenção
+    - Empate decidido pela prioridade da regra (não pela ordem no arquivo)
+    """
+
+    def __init__(self, rules: Dict[str, Any]):
+        self.intents: List[Dict[str, Any]] = rules.get("intents", [])
+        self.default_plan: Dict[str, Any] = rules.get("default", _FALLBACK_PLAN)
+
+        # 🔑 palavra-chave normalizada -> índices das intenções
+        self._keyword_index: Dict[str, List[int]] = {}
+        for idx, intent in enumerate(self.intents):
+            for keyword in intent.get("keywords", []):
+                folded = _fold(keyword).strip()
+                if not folded:
+                    continue
+                owners = self._keyword_index.setdefault(folded, [])
+                if idx not in owners:  # "video" e "vídeo" contam uma vez só
+                    owners.append(idx)
+
+        self._regex = None
+        if self._keyword_index:
+            self._regex = re.compile(r"\b" + _trie_pattern(list(self._keyword_index)))
+
+    @classmethod
+    def from_file(cls, path: str = DEFAULT_INTENTS_FILE) -> "IntentMatcher":
+        """📂 Carrega regras de um arquivo JSON"""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def match(self, user_input: str) -> List[Tuple[str, float]]:
+        """
+        🔍 Todas as intenções encontradas, da mais provável para a menos
+
+        Returns:
+            list: [(nome_da_intencao, pontuacao), ...]
+        """
+        return [(self.intents[idx]["name"], score) for idx, score in self._score(user_input)]
+
+    def best_plan(self, user_input: str) -> Dict[str, Any]:
+        """🏆 Plano da intenção vencedora (ou plano padrão)"""
+        ranked = self._score(user_input)
+        template = self.intents[ranked[0][0]] if ranked else self.default_plan
+
+        return {
+            "explicacao": template.get("explicacao", ""),
+            "passos": [step.replace("{input}", user_input) for step in template.get("passos", [])]
+        }
+
+    def _score(self, user_input: str) -> List[Tuple[int, float]]:
+        if self._regex is None or not user_input:
+            return []
+
+        found = set(m.group(0) for m in self._regex.finditer(_fold(user_input)))
+
+        scores: Dict[int, float] = {}
+        for keyword in found:
+            for idx in self._keyword_index.get(keyword, ()):
+                scores[idx] = scores.get(idx, 0.0) + self.intents[idx].get("weight", 1.0)
+
+        return sorted(
+            scores.items(),
+            key=lambda item: (item[1], self.intents[item[0]].get("priority", 0)),
+            reverse=True
+        )
+
+# 🎯 EXEMPLO DE USO E MICRO-BENCHMARK
+if __name__ == "__main__":
+    import random
+    import string
+    import timeit
+
+    print("🎯 SolAgent Intent Matcher v1.2 - Testando...")
+
+    matcher = IntentMatcher.from_file()
+    assert matcher.best_plan("que horas são?")["passos"] == ["obter_hora_atual"]
+    assert matcher.best_plan("toca uma musica no youtube")["passos"][0] == "abrir_navegador"
+    assert matcher.best_plan("qual minha senha de hoje")["passos"][0].startswith("falar_para_usuario:")
+    assert matcher.best_plan("pesquisar receitas")["passos"][1] == "pesquisar_google:pesquisar receitas"
+    assert matcher.best_plan("xyz")["explicacao"] == matcher.default_plan["explicacao"]
+    print(f"  🔍 'pesquisar vídeo no youtube' -> {matcher.match('pesquisar vídeo no youtube')}")
+
+    # ⏱️ Custo por chamada conforme o número de regras cresce
+    random.seed(42)
+    frase = "sol, por favor abre o youtube e procura um video de musica para estudar"
+
+    def palavra() -> str:
+        return "".join(random.choice(string.ascii_lowercase) for _ in range(random.randint(4, 10)))
+
+    print("\n  ⏱️ Regras | Compilado (µs) | Varredura linear any() (µs)")
+    for n_regras in (8, 100, 1000, 5000):
+        regras = {"intents": [
+            {"name": f"intent_{i}", "keywords": [palavra() for _ in range(4)], "passos": []}
+            for i in range(n_regras)
+        ]}
+        regras["intents"].append({"name": "youtube", "keywords": ["youtube", "video"], "passos": []})
+        compilado = IntentMatcher(regras)
+
+        def linear() -> Optional[str]:
+            texto = frase.lower()
+            for intent in regras["intents"]:
+                if any(kw in texto for kw in intent["keywords"]):
+                    return intent["name"]
+            return None
+
+        repeticoes = 2000
+        t_compilado = timeit.timeit(lambda: compilado.match(frase), number=repeticoes) / repeticoes * 1e6
+        t_linear = timeit.timeit(linear, number=repeticoes // 10) / (repeticoes // 10) * 1e6
+        print(f"  {n_regras:>12} | {t_compilado:>14.1f} | {t_linear:>27.1f}")
+
+    print("\n✅ Teste concluído!")
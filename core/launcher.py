@@ -0,0 +1,324 @@
+"""
+⚡ SolAgent v1.2 - Launcher (Abre Programas sem Shell)
+====================================================
+
+Abre programas, pastas, URLs e arquivos de áudio executando o
+programa direto (sem cmd.exe / sh no meio) - sem o custo de subir
+um shell a cada ação, e funcionando também no Linux.
+
+Funcionalidades:
+- Backend Windows (os.startfile + executáveis do PATH + áudio via MCI/winsound)
+- Backend Linux (xdg-open + executáveis do PATH)
+- Nomes amigáveis ("calculadora", "bloco") mapeados por sistema
+- Caminho de cada programa resolvido uma vez só (cache)
+- Tempo de abertura medido e registrado no log
+- Processos registrados no watchdog (encerrados se o passo for abortado)
+
+Autores: Mario, GitHub Copilot & Sol (ela mesma ajudou a se criar!)
+Versão: 1.2 (Audio Revolution) - Tríade Criativa
+Data: 28/10/2025
+"""
+
+import os
+import shlex
+import shutil
+import subprocess
+import threading
+import time
+from typing import Dict, List, Optional
+
+from core import tracer, watchdog
+
+
+class WindowsBackend:
+    """🪟 Windows: executáveis do PATH e os.startfile para "abrir com o padrão" """
+
+    name = "windows"
+
+    # 📋 Nomes amigáveis -> executáveis (o primeiro encontrado vale)
+    aliases = {
+        "notepad": ["notepad.exe"],
+        "bloco": ["notepad.exe"],
+        "calculadora": ["calc.exe"],
+        "calc": ["calc.exe"],
+        "paint": ["mspaint.exe"],
+        "cmd": ["cmd.exe"],
+        "terminal": ["wt.exe", "cmd.exe"],
+        "powershell": ["powershell.exe"],
+        "explorer": ["explorer.exe"],
+    }
+
+    # 🖥️ Programas de console: precisam de uma janela própria (e do teclado)
+    console_programs = {"cmd.exe", "powershell.exe", "pwsh.exe"}
+
+    def open_command(self, target: str) -> Optional[List[str]]:
+        return None  # os.startfile (não cria shell nem processo intermediário)
+
+    def file_manager(self) -> List[str]:
+        return ["explorer"]
+
+    def audio_players(self) -> List[List[str]]:
+        """🔊 Players de linha de comando (se instalados) - senão play_file"""
+        return [["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet"]]
+
+    def play_file(self, file_path: str) -> bool:
+        """
+        🔊 Toca e só retorna no fim, sem abrir processo
+
+        WAV pelo winsound; MP3 e outros pelo MCI do Windows (winmm),
+        que espera a reprodução terminar como o antigo "start /wait".
+        """
+        if file_path.lower().endswith(".wav"):
+            import winsound
+            winsound.PlaySound(file_path, winsound.SND_FILENAME)
+            return True
+
+        import ctypes
+        mci = ctypes.windll.winmm.mciSendStringW
+        alias = f"sol{threading.get_ident()}"
+        if mci(f'open "{file_path}" type mpegvideo alias {alias}', None, 0, None) != 0:
+            return False
+        try:
+            return mci(f"play {alias} wait", None, 0, None) == 0
+        finally:
+            mci(f"close {alias}", None, 0, None)
+
+
+class LinuxBackend:
+    """🐧 Linux: executáveis do PATH e xdg-open para "abrir com o padrão" """
+
+    name = "linux"
+
+    aliases = {
+        "notepad": ["gnome-text-editor", "gedit", "kate", "mousepad", "xed"],
+        "bloco": ["gnome-text-editor", "gedit", "kate", "mousepad", "xed"],
+        "calculadora": ["gnome-calculator", "kcalc", "galculator", "xcalc"],
+        "calc": ["gnome-calculator", "kcalc", "galculator", "xcalc"],
+        "paint": ["pinta", "kolourpaint", "gimp"],
+        "cmd": ["x-terminal-emulator", "gnome-terminal", "konsole", "xterm"],
+        "terminal": ["x-terminal-emulator", "gnome-terminal", "konsole", "xterm"],
+        "powershell": ["pwsh"],
+        "explorer": ["nautilus", "dolphin", "nemo", "thunar", "pcmanfm"],
+    }
+
+    # Emuladores de terminal já abrem a própria janela
+    console_programs = set()
+
+    def open_command(self, target: str) -> Optional[List[str]]:
+        return ["xdg-open", target]
+
+    def file_manager(self) -> List[str]:
+        return ["xdg-open", os.path.expanduser("~")]
+
+    def audio_players(self) -> List[List[str]]:
+        """🔊 Players de linha de comando, na ordem de preferência"""
+        return [
+            ["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet"],
+            ["mpv", "--no-video", "--really-quiet"],
+            ["paplay"],
+            ["aplay", "-q"],
+        ]
+
+    def play_file(self, file_path: str) -> bool:
+        return False  # sem player embutido: só os de linha de comando
+
+
+def default_backend():
+    """🔎 Backend do sistema atual"""
+    return WindowsBackend() if os.name == "nt" else LinuxBackend()
+
+
+class Launcher:
+    """
+    🚀 ABRE PROGRAMAS SEM SHELL
+
+    Características:
+    - resolve() encontra o executável uma vez e guarda o caminho
+    - launch() executa direto (argv), sem interpretar a linha em um shell
+    - open() abre URL/arquivo/pasta com o programa padrão do sistema
+    - play_audio() toca um arquivo e espera terminar quando possível
+    - last_latency_ms: tempo da última abertura (para benchmark)
+    """
+
+    def __init__(self, log=None, backend=None):
+        self.log = log
+        self.backend = backend or default_backend()
+        self._paths: Dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+        self.last_latency_ms = None
+
+    def resolve(self, program: str) -> Optional[str]:
+        """🔎 Caminho completo do programa (ou None) - resolvido só na primeira vez"""
+        key = program.lower()
+        with self._lock:
+            if key in self._paths:
+                return self._paths[key]
+
+        path = None
+        for candidate in self.backend.aliases.get(key, [program]):
+            path = shutil.which(candidate)
+            if path:
+                break
+        with self._lock:
+            self._paths[key] = path
+        return path
+
+    def launch(self, command_line: str, wait: bool = False) -> subprocess.Popen:
+        """
+        🚀 Executa "programa arg1 arg2" direto, sem shell
+
+        Raises:
+            FileNotFoundError: programa não encontrado no PATH
+        """
+        args = self.split_command(command_line)
+        if not args:
+            raise FileNotFoundError("nenhum programa informado")
+        path = self.resolve(args[0])
+        if path is None:
+            raise FileNotFoundError(f"programa não encontrado: {args[0]}")
+        console = os.path.basename(path).lower() in self.backend.console_programs
+        return self._spawn([path] + args[1:], label=args[0], wait=wait, console=console)
+
+    @staticmethod
+    def split_command(command_line: str) -> List[str]:
+        """✂️ "programa arg1 \"arg 2\"" -> ["programa", "arg1", "arg 2"]"""
+        args = shlex.split(command_line, posix=os.name != "nt")
+        # No modo Windows o shlex mantém as aspas ("C:\Program Files\x.exe")
+        return [arg[1:-1] if len(arg) > 1 and arg[0] == arg[-1] == '"' else arg for arg in args]
+
+    def open(self, target: str) -> Optional[subprocess.Popen]:
+        """🔗 Abre URL, arquivo ou pasta com o programa padrão do sistema"""
+        command = self.backend.open_command(target)
+        if command is None:
+            start = time.perf_counter()
+            with tracer.span("launch", "launcher", program="startfile"):
+                os.startfile(target)
+            self._record_latency("startfile", start)
+            return None
+
+        path = self.resolve(command[0])
+        if path is None:
+            raise FileNotFoundError(f"programa não encontrado: {command[0]}")
+        return self._spawn([path] + command[1:], label=command[0])
+
+    def open_file_manager(self) -> Optional[subprocess.Popen]:
+        """📁 Abre o gerenciador de arquivos"""
+        command = self.backend.file_manager()
+        path = self.resolve(command[0])
+        if path is None:
+            raise FileNotFoundError(f"programa não encontrado: {command[0]}")
+        return self._spawn([path] + command[1:], label=command[0])
+
+    def play_audio(self, file_path: str) -> bool:
+        """
+        🔊 Toca um arquivo de áudio
+
+        Espera o fim da reprodução (falas seguidas não se atropelam):
+        player de linha de comando ou o player embutido do sistema
+        (backend.play_file). Só se nenhum dos dois funcionar abre com o
+        programa padrão - aí sem esperar.
+        """
+        for player in self.backend.audio_players():
+            path = self.resolve(player[0])
+            if path:
+                proc = self._spawn([path] + player[1:] + [file_path], label=player[0], wait=True)
+                return proc.returncode == 0
+        if self.backend.play_file(file_path):
+            return True
+        if self.log:
+            self.log.warning("⚠️ Nenhum player que espere o fim - abrindo com o programa padrão")
+        self.open(file_path)
+        return True
+
+    def _spawn(self, argv: List[str], label: str, wait: bool = False,
+               console: bool = False) -> subprocess.Popen:
+        """
+        ⚙️ Popen sem shell, com a latência medida e o processo no watchdog
+
+        console=True (cmd, powershell no Windows): abre em uma janela nova e
+        sem redirecionar stdin/stdout - senão o shell sai na hora.
+        """
+        if console:
+            options = {"creationflags": subprocess.CREATE_NEW_CONSOLE}
+        else:
+            options = {"stdin": subprocess.DEVNULL, "stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+        if os.name != "nt":
+            options["start_new_session"] = True  # Ctrl+C no terminal não derruba o programa aberto
+
+        start = time.perf_counter()
+        with tracer.span("launch", "launcher", program=label):
+            proc = subprocess.Popen(argv, **options)
+        self._record_latency(label, start)
+        watchdog.track_process(proc)
+
+        if wait:
+            proc.wait()
+        return proc
+
+    def _record_latency(self, label: str, start: float) -> None:
+        self.last_latency_ms = (time.perf_counter() - start) * 1000
+        if self.log:
+            self.log.debug(f"🚀 {label} aberto em {self.last_latency_ms:.1f} ms")
+
+
+# 🌍 LAUNCHER COMPARTILHADO (cache de caminhos vale para a sessão toda)
+_launcher: Optional[Launcher] = None
+_launcher_lock = threading.Lock()
+
+
+def get_launcher(log=None) -> Launcher:
+    """🚀 Launcher da sessão (criado na primeira chamada)"""
+    global _launcher
+    with _launcher_lock:
+        if _launcher is None:
+            _launcher = Launcher(log)
+        elif _launcher.log is None:
+            _launcher.log = log
+        return _launcher
+
+# 🎯 EXEMPLO DE USO E TESTE
+if __name__ == "__main__":
+    import sys
+    import timeit
+
+    print("🚀 SolAgent Launcher v1.2 - Testando...")
+
+    class LogTeste:
+        def log(self, msg): print(f"[LOG] {msg}")
+        def debug(self, msg): print(f"[DEBUG] {msg}")
+        def error(self, msg): print(f"[ERROR] {msg}")
+        def warning(self, msg): print(f"[WARNING] {msg}")
+
+    launcher = Launcher(LogTeste())
+    print(f"  🖥️ Backend: {launcher.backend.name}")
+
+    python = os.path.basename(sys.executable)
+    assert launcher.resolve(python)
+    assert launcher.resolve("programa-que-nao-existe") is None
+    for backend in (WindowsBackend(), LinuxBackend()):
+        # Nenhum alias cai em um programa que precisa de argumento para abrir
+        assert all("xdg-open" not in candidatos for candidatos in backend.aliases.values()), backend.name
+    try:
+        launcher.launch("programa-que-nao-existe")
+        raise AssertionError("programa inexistente não deu erro")
+    except FileNotFoundError:
+        pass
+
+    sem_cache = timeit.timeit(lambda: shutil.which(python), number=200) / 200 * 1e6
+    com_cache = timeit.timeit(lambda: launcher.resolve(python), number=200) / 200 * 1e6
+    print(f"  🔎 Resolver '{python}': {sem_cache:.1f} µs sem cache, {com_cache:.1f} µs com cache")
+
+    # ⏱️ Direto x via shell (mesmo programa, esperando terminar)
+    comando = f'"{sys.executable}" -c "pass"'
+    direto = []
+    via_shell = []
+    for _ in range(5):
+        inicio = time.perf_counter()
+        launcher.launch(comando, wait=True)
+        direto.append((time.perf_counter() - inicio) * 1000)
+        inicio = time.perf_counter()
+        subprocess.run(comando, shell=True)
+        via_shell.append((time.perf_counter() - inicio) * 1000)
+    print(f"  ⏱️ Direto: {min(direto):.1f} ms | via shell: {min(via_shell):.1f} ms (melhor de 5)")
+
+    print("\n✅ Teste concluído!")
@@ -0,0 +1,331 @@
+"""
+⚡ SolAgent v1.2 - Metrics Sampler (Monitor do Sistema em Segundo Plano)
+======================================================================
+
+Coleta CPU, memória, disco e processos em uma thread de fundo,
+para que mostrar_status_sistema responda na hora - com tendências
+("média de CPU nos últimos 5 minutos") além dos valores atuais.
+
+Funcionalidades:
+- Buffer circular de tamanho fixo (sem crescer com o tempo)
+- Mínimo/média/máximo por janela com NumPy (fallback em Python puro)
+- Processos que mais usam CPU/memória na última amostra
+- Disco do sistema detectado (C:\\ no Windows, / nos demais)
+- psutil e numpy opcionais
+
+Autores: Mario, GitHub Copilot & Sol (ela mesma ajudou a se criar!)
+Versão: 1.2 (Audio Revolution) - Tríade Criativa
+Data: 28/10/2025
+"""
+
+import os
+import platform
+import shutil
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# 📊 Colunas de cada amostra (a ordem é a das colunas do buffer)
+FIELDS = ("time", "cpu", "memory", "disk", "sol_cpu", "sol_memory_mb")
+
+# 🏃 Processos guardados da última amostra
+TOP_PROCESSES = 5
+
+# ⏱️ Intervalo mínimo entre zerar os contadores de CPU e a primeira leitura
+# (cpu_percent logo depois de zerado devolve 0.0 - não é uma medida)
+CPU_PRIME_SECONDS = 0.5
+
+
+def default_disk_path() -> str:
+    """💾 Raiz do disco do sistema ("C:\\" no Windows, "/" nos demais)"""
+    if os.name == "nt":
+        return os.environ.get("SystemDrive", "C:") + "\\"
+    return "/"
+
+
+class _RingBuffer:
+    """
+    🔁 Buffer circular de amostras numéricas
+
+    Com NumPy: matriz (capacidade x colunas) preenchida com NaN e um
+    índice que dá a volta - as estatísticas são vetorizadas.
+    Sem NumPy: deque de tuplas com maxlen.
+    """
+
+    def __init__(self, capacity: int, columns: int):
+        self.capacity = capacity
+        self.columns = columns
+        self.count = 0
+        if NUMPY_AVAILABLE:
+            self._data = np.full((capacity, columns), np.nan)
+            self._next = 0
+        else:
+            self._data = deque(maxlen=capacity)
+
+    def append(self, row) -> None:
+        if NUMPY_AVAILABLE:
+            self._data[self._next] = row
+            self._next = (self._next + 1) % self.capacity
+        else:
+            self._data.append(tuple(row))
+        self.count = min(self.count + 1, self.capacity)
+
+    def last(self) -> Optional[List[float]]:
+        if not self.count:
+            return None
+        if NUMPY_AVAILABLE:
+            return self._data[(self._next - 1) % self.capacity].tolist()
+        return list(self._data[-1])
+
+    def window_stats(self, since: float) -> Dict[int, Dict[str, float]]:
+        """📈 coluna -> {min, mean, max} das linhas com coluna 0 (tempo) >= since"""
+        stats = {}
+        if NUMPY_AVAILABLE:
+            rows = self._data[self._data[:, 0] >= since]  # NaN nunca passa no filtro
+            if not len(rows):
+                return stats
+            for col in range(1, self.columns):
+                values = rows[:, col]
+                values = values[~np.isnan(values)]
+                if len(values):
+                    stats[col] = {"min": float(values.min()), "mean": float(values.mean()),
+                                  "max": float(values.max()), "samples": int(len(values))}
+            return stats
+
+        rows = [row for row in self._data if row[0] >= since]
+        for col in range(1, self.columns):
+            values = [row[col] for row in rows if row[col] is not None]
+            if values:
+                stats[col] = {"min": min(values), "mean": sum(values) / len(values),
+                              "max": max(values), "samples": len(values)}
+        return stats
+
+
+class MetricsSampler:
+    """
+    📡 AMOSTRADOR DE MÉTRICAS
+
+    Características:
+    - Uma amostra a cada metrics_interval_seconds (padrão 5s)
+    - Guarda metrics_history_minutes de histórico (padrão 15 min)
+    - Informações fixas (sistema, processador) lidas uma vez só
+    - sample_now() para uso sem a thread (ex.: primeira chamada)
+    """
+
+    def __init__(self, config: dict, log):
+        self.config = config
+        self.log = log
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # 🔧 CONFIGURAÇÕES
+        self.interval = max(1.0, float(config.get("metrics_interval_seconds", 5)))
+        history_seconds = config.get("metrics_history_minutes", 15) * 60
+        self.disk_path = config.get("metrics_disk_path") or default_disk_path()
+
+        self._buffer = _RingBuffer(max(2, int(history_seconds / self.interval)), len(FIELDS))
+        self.top_processes: List[Dict[str, Any]] = []
+        self._last_disk = None
+        self._last_memory = None
+
+        # 🖥️ Informações que não mudam enquanto a Sol roda
+        self.system_info = {
+            "system": platform.system(),
+            "release": platform.release(),
+            "processor": platform.processor() or platform.machine(),
+            "cpu_count": os.cpu_count(),
+        }
+        self._own_process = psutil.Process() if PSUTIL_AVAILABLE else None
+        self._cpu_primed_at = time.monotonic()
+        if PSUTIL_AVAILABLE:
+            self._prime_cpu_counters()
+            self.system_info["memory_total"] = psutil.virtual_memory().total
+
+    @property
+    def running(self) -> bool:
+        return bool(self._thread and self._thread.is_alive())
+
+    def start(self) -> None:
+        """🚀 Inicia a coleta em segundo plano"""
+        if self.running:
+            return
+
+        def loop() -> None:
+            while not self._stop.is_set():
+                try:
+                    self.sample_now()
+                except Exception as e:
+                    self.log.debug(f"📡 Falha ao coletar métricas: {str(e)}")
+                self._stop.wait(self.interval)
+
+        self._thread = threading.Thread(target=loop, name="sol-metrics", daemon=True)
+        self._thread.start()
+        self.log.debug(f"📡 Monitor do sistema ativo (a cada {self.interval:.0f}s, "
+                       f"{'NumPy' if NUMPY_AVAILABLE else 'Python puro'})")
+
+    def stop(self) -> None:
+        """🛑 Interrompe a coleta"""
+        self._stop.set()
+
+    def sample_now(self) -> Dict[str, Any]:
+        """📸 Coleta uma amostra e guarda no buffer"""
+        disk_percent = None
+        disk = None
+        try:
+            disk = shutil.disk_usage(self.disk_path)
+            disk_percent = disk.used / disk.total * 100 if disk.total else None
+        except OSError:
+            pass
+
+        cpu = memory = sol_cpu = sol_memory = None
+        top = []
+        memory_info = None
+        if PSUTIL_AVAILABLE:
+            # Primeira amostra logo após zerar os contadores: espera o mínimo
+            # para não publicar um 0% de CPU sem sentido (acontece uma vez)
+            wait = CPU_PRIME_SECONDS - (time.monotonic() - self._cpu_primed_at)
+            if wait > 0:
+                time.sleep(wait)
+            cpu = psutil.cpu_percent(interval=None)
+            memory_info = psutil.virtual_memory()
+            memory = memory_info.percent
+            try:
+                with self._own_process.oneshot():
+                    sol_cpu = self._own_process.cpu_percent(interval=None)
+                    sol_memory = self._own_process.memory_info().rss / (1024 ** 2)
+            except psutil.Error:
+                pass
+            top = self._top_processes()
+
+        row = [time.time(), cpu, memory, disk_percent, sol_cpu, sol_memory]
+        with self._lock:
+            if NUMPY_AVAILABLE:
+                self._buffer.append([np.nan if v is None else v for v in row])
+            else:
+                self._buffer.append(row)
+            self.top_processes = top
+            self._last_disk = disk
+            self._last_memory = memory_info
+
+        return dict(zip(FIELDS, row))
+
+    def snapshot(self, window_seconds: float = 300) -> Dict[str, Any]:
+        """
+        📊 Valores atuais + tendências da janela pedida
+
+        Returns:
+            dict: current {campo: valor}, trends {campo: {min, mean, max}},
+                  top_processes, system, disk, memory, window_seconds
+        """
+        with self._lock:
+            has_samples = self._buffer.count > 0
+        if not has_samples:
+            self.sample_now()
+
+        with self._lock:
+            last = self._buffer.last()
+            stats = self._buffer.window_stats(time.time() - window_seconds)
+            current = {field: (None if value is None or value != value else value)  # NaN -> None
+                       for field, value in zip(FIELDS, last)}
+            return {
+                "current": current,
+                "trends": {FIELDS[col]: values for col, values in stats.items()},
+                "top_processes": list(self.top_processes),
+                "system": dict(self.system_info),
+                "disk": self._last_disk,
+                "disk_path": self.disk_path,
+                "memory": self._last_memory,
+                "window_seconds": window_seconds,
+            }
+
+    def _prime_cpu_counters(self) -> None:
+        """⏱️ Primeira leitura de CPU (sistema, Sol e processos) só zera os contadores"""
+        psutil.cpu_percent(interval=None)
+        try:
+            self._own_process.cpu_percent(interval=None)
+        except psutil.Error:
+            pass
+        for _ in psutil.process_iter(["cpu_percent"]):
+            pass
+        self._cpu_primed_at = time.monotonic()
+
+    def _top_processes(self) -> List[Dict[str, Any]]:
+        """🏃 Processos com mais CPU (desempate por memória)"""
+        processes = []
+        for proc in psutil.process_iter(["pid", "name", "cpu_percent", "memory_info"]):
+            info = proc.info
+            if info.get("memory_info") is None:
+                continue
+            processes.append({
+                "pid": info["pid"],
+                "name": info.get("name") or "?",
+                "cpu": info.get("cpu_percent") or 0.0,
+                "memory_mb": info["memory_info"].rss / (1024 ** 2),
+            })
+        processes.sort(key=lambda p: (p["cpu"], p["memory_mb"]), reverse=True)
+        return processes[:TOP_PROCESSES]
+
+
+# 🌍 MONITOR COMPARTILHADO (iniciado no main, usado pelas ações)
+_sampler: Optional[MetricsSampler] = None
+_sampler_lock = threading.Lock()
+
+
+def get_sampler(config: Optional[dict] = None, log=None) -> MetricsSampler:
+    """📡 Monitor da sessão (criado com a configuração na primeira chamada)"""
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = MetricsSampler(config or {}, log)
+        return _sampler
+
+
+def start(config: dict, log) -> Optional[MetricsSampler]:
+    """🚀 Cria o monitor e inicia a coleta (precisa do psutil)"""
+    if not config.get("metrics_enabled", True) or not PSUTIL_AVAILABLE:
+        return None
+    sampler = get_sampler(config, log)
+    sampler.start()
+    return sampler
+
+# 🎯 EXEMPLO DE USO E TESTE
+if __name__ == "__main__":
+    print("📡 SolAgent Metrics Sampler v1.2 - Testando...")
+    print(f"  psutil: {PSUTIL_AVAILABLE} | numpy: {NUMPY_AVAILABLE}")
+
+    class LogTeste:
+        def log(self, msg): print(f"[LOG] {msg}")
+        def debug(self, msg): print(f"[DEBUG] {msg}")
+        def error(self, msg): print(f"[ERROR] {msg}")
+        def warning(self, msg): print(f"[WARNING] {msg}")
+
+    buffer = _RingBuffer(3, 2)
+    for t in range(5):
+        buffer.append([float(t), float(t * 10)])
+    assert buffer.count == 3 and buffer.last() == [4.0, 40.0]
+    assert buffer.window_stats(since=2.0)[1] == {"min": 20.0, "mean": 30.0, "max": 40.0, "samples": 3}
+    assert buffer.window_stats(since=4.0)[1]["samples"] == 1
+
+    sampler = MetricsSampler({"metrics_interval_seconds": 1}, LogTeste())
+    for _ in range(3):
+        sampler.sample_now()
+    foto = sampler.snapshot(window_seconds=60)
+    print(f"  📸 Atual: {foto['current']}")
+    print(f"  📈 Tendências: {foto['trends']}")
+    assert foto["current"]["disk"] is not None
+
+    print("\n✅ Teste concluído!")
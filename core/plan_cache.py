@@ -0,0 +1,374 @@
+"""
+⚡ SolAgent v1.2 - Plan Cache (Cache de Planos)
+==============================================
+
+Cache persistente de planos gerados pelo Brain.
+Comandos repetidos ("que horas são", "abre o YouTube") não precisam
+de uma nova chamada à OpenAI.
+
+Funcionalidades:
+- Chave normalizada (sem stopwords e sem pontuação de fim de frase;
+  maiúsculas, acentos e símbolos do texto são mantidos)
+- Planos cujos passos usam trechos do pedido não entram no cache
+- Camada em memória (LRU) para respostas em microssegundos
+- Camada em disco (JSON) que sobrevive a reinícios
+- Expiração por TTL e limite de tamanho
+- Contadores de acerto/erro para o relatório de histórico
+
+Autores: Mario, GitHub Copilot & Sol (ela mesma ajudou a se criar!)
+Versão: 1.2 (Audio Revolution) - Tríade Criativa
+Data: 28/10/2025
+"""
+
+import json
+import os
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# 🧹 Palavras que não mudam a intenção do comando
+STOPWORDS = frozenset({
+    "a", "o", "as", "os", "um", "uma", "uns", "umas",
+    "de", "do", "da", "dos", "das", "em", "no", "na", "nos", "nas",
+    "e", "por", "pra", "pro", "para", "com", "que", "se",
+    "me", "mim", "eu", "voce", "vc", "sol", "ai", "ei", "oi",
+    "favor", "porfavor", "pode", "poderia", "consegue", "quero", "queria",
+})
+
+# ✂️ Pontuação de frase (só sai das pontas das palavras)
+SENTENCE_PUNCTUATION = ",;!?¡¿…"
+
+
+def _fold(word: str) -> str:
+    """🔤 Minúsculas e sem acentos - só para comparar com as stopwords"""
+    word = unicodedata.normalize("NFKD", word.casefold())
+    return "".join(ch for ch in word if not unicodedata.combining(ch))
+
+
+def _trim(word: str) -> str:
+    """✂️ Tira a pontuação de frase das pontas ("YouTube," -> "YouTube")
+
+    O ponto final só sai depois de letra/número: ".", ".." e "C:\\." ficam.
+    """
+    word = word.strip(SENTENCE_PUNCTUATION)
+    if len(word) > 1 and word.endswith(".") and word[-2].isalnum():
+        word = word[:-1]
+    return word
+
+
+def normalize_input(text: str) -> str:
+    """
+    🔑 Normaliza o comando para uso como chave de cache
+
+    "Sol, que horas são?" e "  que horas são " geram a mesma chave.
+    Maiúsculas, acentos e símbolos são mantidos: "pesquisa c++" e
+    "pesquisa c#", ou "cria pasta Projetos" e "cria pasta projetos",
+    são pedidos diferentes. A ordem das palavras é preservada.
+    """
+    if not text:
+        return ""
+
+    words = [_trim(word) for word in text.split()]
+    return " ".join(word for word in words if word and _fold(word) not in STOPWORDS)
+
+
+def embeds_input(user_input: str, plan: Dict[str, Any]) -> bool:
+    """
+    🧩 Algum passo do plano usa um trecho do pedido como parâmetro?
+
+    "pesquisa receita de bolo" -> "pesquisar_google:receita de bolo":
+    esse plano só vale para esse texto exato, então não é guardado.
+    """
+    params = [_fold(step.partition(":")[2]) for step in plan.get("passos", [])
+              if isinstance(step, str) and ":" in step]
+    if not params:
+        return False
+
+    # Stopwords também contam: "cria pasta a" não pode virar "cria pasta"
+    words = {_fold(_trim(word)) for word in user_input.split()} - {""}
+    for param in params:
+        tokens = set("".join(ch if ch.isalnum() else " " for ch in param).split())
+        if any(word in param if len(word) > 1 else word in tokens or word == param
+               for word in words):
+            return True
+    return False
+
+
+class PlanCache:
+    """
+    🗃️ CACHE DE PLANOS EM DUAS CAMADAS
+
+    Características:
+    - LRU em memória (OrderedDict) na frente
+    - Arquivo JSON em disco com TTL e limite de entradas
+    - Gravação atômica (arquivo temporário + os.replace)
+    - Estatísticas de uso persistidas junto com as entradas
+    - Só planos que não dependem do texto do pedido (ver embeds_input)
+    """
+
+    def __init__(self, config: dict, log):
+        self.config = config
+        self.log = log
+        self._lock = threading.Lock()
+
+        # 🔧 CONFIGURAÇÕES
+        self.enabled = config.get("plan_cache_enabled", True)
+        self.cache_dir = config.get("plan_cache_dir", "cache")
+        self.ttl_seconds = config.get("plan_cache_ttl_hours", 24) * 3600
+        self.max_disk_entries = config.get("plan_cache_max_entries", 500)
+        self.max_memory_entries = config.get("plan_cache_memory_entries", 128)
+
+        self.cache_file = os.path.join(self.cache_dir, "plan_cache.json")
+
+        # 🧠 Camadas
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._disk: Dict[str, Dict[str, Any]] = {}
+
+        # 📊 Contadores (sessão + acumulado em disco)
+        self.session_stats = self._empty_stats()
+        self.total_stats = self._empty_stats()
+
+        self._initialize()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        return {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def _initialize(self) -> None:
+        """🚀 Carrega a camada em disco"""
+
+        if not self.enabled:
+            self.log.debug("🗃️ Cache de planos desabilitado por configuração")
+            return
+
+        if not os.path.exists(self.cache_file):
+            return
+
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._disk = data.get("entries", {})
+            self.total_stats.update(data.get("stats", {}))
+            expired = self._evict_locked(time.time())
+            self.log.debug(f"🗃️ Cache de planos carregado: {len(self._disk)} entradas ({expired} expiradas)")
+        except Exception as e:
+            self.log.warning(f"⚠️ Cache de planos corrompido, recomeçando: {str(e)}")
+            self._disk = {}
+
+    def get(self, user_input: str) -> Optional[Dict[str, Any]]:
+        """
+        🔍 Busca um plano em cache
+
+        Returns:
+            dict: Cópia do plano em cache ou None se não houver/expirou
+        """
+        if not self.enabled:
+            return None
+
+        key = normalize_input(user_input)
+        if not key:
+            return None
+
+        now = time.time()
+        with self._lock:
+            # ⚡ Camada 1: memória
+            entry = self._memory.get(key)
+            if entry and not self._is_expired(entry, now) and not embeds_input(user_input, entry["plan"]):
+                self._memory.move_to_end(key)
+                entry["last_used"] = now
+                self._count("memory_hits")
+                return self._copy_plan(entry["plan"])
+
+            # 💾 Camada 2: disco
+            entry = self._disk.get(key)
+            if entry and not self._is_expired(entry, now) and not embeds_input(user_input, entry["plan"]):
+                entry["last_used"] = now
+                self._remember_locked(key, entry)
+                self._count("disk_hits")
+                return self._copy_plan(entry["plan"])
+
+            self._count("misses")
+            return None
+
+    def put(self, user_input: str, plan: Dict[str, Any]) -> None:
+        """💾 Guarda um plano validado nas duas camadas"""
+        if not self.enabled:
+            return
+
+        key = normalize_input(user_input)
+        if not key:
+            return
+
+        # 🧩 Parâmetro tirado do pedido: outro texto com a mesma chave
+        # receberia o argumento errado
+        if embeds_input(user_input, plan):
+            self.log.debug("🗃️ Plano usa trechos do pedido - não vai para o cache")
+            return
+
+        now = time.time()
+        entry = {
+            "plan": self._copy_plan(plan),
+            "created": now,
+            "last_used": now,
+        }
+
+        with self._lock:
+            self._remember_locked(key, entry)
+            self._disk[key] = entry
+            self._count("stores")
+            self._evict_locked(now)
+            self._save_locked()
+
+    def clear(self) -> None:
+        """🧹 Remove todas as entradas (contadores são mantidos)"""
+        with self._lock:
+            self._memory.clear()
+            self._disk.clear()
+            self._save_locked()
+        self.log.log("🧹 Cache de planos limpo")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """📈 Estatísticas de uso para o relatório"""
+        with self._lock:
+            session = dict(self.session_stats)
+            total = dict(self.total_stats)
+            entries = len(self._disk)
+
+        def hit_rate(stats: Dict[str, int]) -> float:
+            hits = stats["memory_hits"] + stats["disk_hits"]
+            lookups = hits + stats["misses"]
+            return (hits / lookups * 100) if lookups > 0 else 0.0
+
+        return {
+            "enabled": self.enabled,
+            "entries": entries,
+            "session": session,
+            "total": total,
+            "session_hit_rate": hit_rate(session),
+            "total_hit_rate": hit_rate(total),
+        }
+
+    def _remember_locked(self, key: str, entry: Dict[str, Any]) -> None:
+        """⚡ Insere na LRU em memória, descartando a entrada mais antiga"""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_locked(self, now: float) -> int:
+        """🧹 Remove expirados e aplica o limite de tamanho (menos usados primeiro)"""
+        expired = [key for key, entry in self._disk.items() if self._is_expired(entry, now)]
+        for key in expired:
+            del self._disk[key]
+            self._memory.pop(key, None)
+
+        overflow = len(self._disk) - self.max_disk_entries
+        if overflow > 0:
+            oldest = sorted(self._disk, key=lambda k: self._disk[k].get("last_used", 0))[:overflow]
+            for key in oldest:
+                del self._disk[key]
+                self._memory.pop(key, None)
+        else:
+            overflow = 0
+
+        evicted = len(expired) + overflow
+        if evicted:
+            self.session_stats["evictions"] += evicted
+            self.total_stats["evictions"] += evicted
+        return evicted
+
+    def _save_locked(self) -> None:
+        """💾 Grava o arquivo de forma atômica"""
+        try:
+            if not os.path.exists(self.cache_dir):
+                os.makedirs(self.cache_dir)
+
+            tmp_file = self.cache_file + ".tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump({"entries": self._disk, "stats": self.total_stats}, f, ensure_ascii=False)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            self.log.error(f"❌ Erro ao salvar cache de planos: {str(e)}")
+
+    def _is_expired(self, entry: Dict[str, Any], now: float) -> bool:
+        return now - entry.get("created", 0) > self.ttl_seconds
+
+    def _count(self, counter: str) -> None:
+        self.session_stats[counter] += 1
+        self.total_stats[counter] += 1
+
+    @staticmethod
+    def _copy_plan(plan: Dict[str, Any]) -> Dict[str, Any]:
+        """📋 Evita que quem usa o plano altere a entrada em cache"""
+        copy = {
+            "explicacao": plan.get("explicacao", ""),
+            "passos": list(plan.get("passos", [])),
+        }
+        if isinstance(plan.get("depends_on"), dict):
+            copy["depends_on"] = {
+                str(k): list(v) if isinstance(v, list) else [v]
+                for k, v in plan["depends_on"].items()
+            }
+        return copy
+
+# 🎯 EXEMPLO DE USO E TESTE
+if __name__ == "__main__":
+    import tempfile
+
+    print("🗃️ SolAgent Plan Cache v1.2 - Testando...")
+
+    class LogTeste:
+        def log(self, msg): print(f"[LOG] {msg}")
+        def debug(self, msg): print(f"[DEBUG] {msg}")
+        def error(self, msg): print(f"[ERROR] {msg}")
+        def warning(self, msg): print(f"[WARNING] {msg}")
+
+    log_teste = LogTeste()
+    config_teste = {"plan_cache_dir": tempfile.mkdtemp(), "plan_cache_max_entries": 2}
+
+    assert normalize_input("Sol, que horas são?") == normalize_input("  que horas são ")
+    assert normalize_input("lista .") != normalize_input("lista")
+    assert normalize_input("Abre o YouTube, por favor!") == "Abre YouTube"
+
+    # Pedidos com argumentos diferentes não podem dividir a chave
+    for texto_a, texto_b in [("pesquisa c++", "pesquisa c#"),
+                             ("cria pasta Projetos", "cria pasta projetos"),
+                             ("lista C:/Users/ana", "lista C:\\Users\\ana"),
+                             ("lista /home/Ana", "lista /home/ana")]:
+        assert normalize_input(texto_a) != normalize_input(texto_b), (texto_a, texto_b)
+
+    cache = PlanCache(config_teste, log_teste)
+    plano = {"explicacao": "Vou mostrar a hora", "passos": ["obter_hora_atual"]}
+
+    assert cache.get("que horas são") is None
+    cache.put("que horas são", plano)
+    assert cache.get("Que horas são?") == plano
+
+    # Reinício: nova instância lê do disco
+    cache = PlanCache(config_teste, log_teste)
+    assert cache.get("que horas são") == plano
+    assert cache.get("que horas são") == plano
+
+    # Plano com parâmetro vindo do pedido não é guardado
+    cache.put("pesquisa c++", {"explicacao": "Google", "passos": ["pesquisar_google:c++"]})
+    assert cache.get("pesquisa c++") is None
+    assert embeds_input("cria pasta Projetos", {"passos": ["criar_pasta:C:\\Projetos"]})
+    assert not embeds_input("que horas são", plano)
+    assert embeds_input("cria pasta a", {"passos": ["criar_pasta:C:\\a"]})
+
+    # Limite de tamanho
+    cache.put("abre o youtube", {"explicacao": "YouTube", "passos": []})
+    cache.put("abre o google", {"explicacao": "Google", "passos": []})
+    assert cache.get_stats()["entries"] == 2
+
+    # Micro-benchmark da camada em memória
+    inicio = time.perf_counter()
+    for _ in range(10000):
+        cache.get("abre o google")
+    por_chamada = (time.perf_counter() - inicio) / 10000 * 1e6
+    print(f"⚡ Acerto em memória: {por_chamada:.1f} µs por chamada")
+
+    print(f"📊 {cache.get_stats()}")
+    print("\n✅ Teste concluído!")
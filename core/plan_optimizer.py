@@ -0,0 +1,196 @@
+"""
+⚡ SolAgent v1.2 - Plan Optimizer (Otimizador de Planos)
+=======================================================
+
+Passo entre o Brain e o Executor: limpa o plano antes da confirmação.
+Menos passos repetidos = menos processos abertos (e menos abas!).
+
+Funcionalidades:
+- Remove passos "implícitos" (abrir_navegador quando abrir_url,
+  pesquisar_no_youtube etc. já abrem o navegador sozinhos)
+- Remove abrir_url da página inicial de um site que uma pesquisa
+  do plano já abre (youtube.com + pesquisar_no_youtube)
+- Junta passos idênticos repetidos (mantém a primeira ocorrência)
+- Não junta repetições separadas por uma alteração no mesmo recurso
+  (listar, criar pasta, listar de novo = as duas listagens ficam) nem
+  por um passo sem recurso declarado (executar_comando, abrir_programa:
+  pode mudar qualquer coisa)
+- Reescreve depends_on para os novos números dos passos
+- Relatório do que saiu e de quantos processos deixam de abrir
+
+Autores: Mario, GitHub Copilot & Sol (ela mesma ajudou a se criar!)
+Versão: 1.2 (Audio Revolution) - Tríade Criativa
+Data: 28/10/2025
+"""
+
+import urllib.parse
+from typing import Any, Dict, List, Optional, Tuple
+
+from core import command_registry
+
+
+def optimize_plan(plan: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    ✂️ Otimiza os passos de um plano
+
+    Returns:
+        tuple: (plano otimizado, relatório) - o relatório tem
+               removed [(passo, motivo)], launches_before, launches_after
+    """
+    steps = list(plan.get("passos", []))
+    specs = [command_registry.COMMANDS.get(command_registry.parse_step(step)[0]) if isinstance(step, str) else None
+             for step in steps]
+
+    alias: Dict[int, Optional[int]] = {}   # índice removido -> índice mantido (ou None)
+    removed: List[Tuple[str, str]] = []
+
+    # 🌐 Passos implícitos: outro passo do mesmo recurso já faz o trabalho
+    for i, spec in enumerate(specs):
+        if not spec or not spec.get("implied"):
+            continue
+        provider = next((j for j, other in enumerate(specs)
+                         if other and not other.get("implied") and other.get("resource") == spec["resource"]), None)
+        if provider is not None:
+            alias[i] = None
+            removed.append((steps[i], f"{command_registry.parse_step(steps[provider])[0]} já abre o {spec['resource']}"))
+
+    # 🏠 Página inicial de um site que uma pesquisa do plano já abre
+    sites = {spec["site"]: command_registry.parse_step(steps[j])[0]
+             for j, spec in enumerate(specs) if spec and spec.get("site")}
+    for i, step in enumerate(steps):
+        if i in alias or not sites or not isinstance(step, str):
+            continue
+        verb, arg = command_registry.parse_step(step)
+        site = _homepage_site(arg) if verb == "abrir_url" else None
+        if site in sites:
+            alias[i] = None
+            removed.append((step, f"{sites[site]} já abre {site}"))
+
+    # 🔁 Passos idênticos repetidos
+    seen: Dict[str, int] = {}
+    for i, step in enumerate(steps):
+        if i in alias:
+            continue
+        spec = specs[i]
+        if step in seen:
+            alias[i] = seen[step]
+            removed.append((step, f"repete o passo {seen[step] + 1}"))
+            continue
+        seen[step] = i
+        if spec and not spec.get("resource") and not spec.get("pure"):
+            # Barreira (efeitos desconhecidos): nada antes dela vale depois
+            seen = {step: i}
+        elif spec and spec.get("exclusive"):
+            # Alteração no recurso: leituras anteriores dele deixam de valer
+            resource = spec.get("resource")
+            for other in [s for s, j in seen.items()
+                          if j != i and specs[j] and specs[j].get("resource") == resource]:
+                del seen[other]
+
+    kept = [i for i in range(len(steps)) if i not in alias]
+    optimized = dict(plan)
+    optimized["passos"] = [steps[i] for i in kept]
+
+    depends_on = plan.get("depends_on")
+    if isinstance(depends_on, dict):
+        remapped = _remap_depends_on(depends_on, kept, alias)
+        if remapped:
+            optimized["depends_on"] = remapped
+        else:
+            optimized.pop("depends_on", None)
+
+    report = {
+        "removed": removed,
+        "launches_before": _count_launches(specs, range(len(steps))),
+        "launches_after": _count_launches(specs, kept),
+    }
+    return optimized, report
+
+
+def _homepage_site(url: Optional[str]) -> Optional[str]:
+    """🏠 "https://www.youtube.com/" -> "youtube.com" (None se não for página inicial)"""
+    parsed = urllib.parse.urlsplit((url or "").strip())
+    if parsed.path.strip("/") or parsed.query or parsed.fragment:
+        return None
+    host = parsed.netloc.lower()
+    return host[4:] if host.startswith("www.") else host or None
+
+
+def _remap_depends_on(depends_on: Dict[str, Any], kept: List[int],
+                      alias: Dict[int, Optional[int]]) -> Dict[str, List[int]]:
+    """🔢 {"3": [1, 2]} com os números dos passos depois das remoções (1-based)"""
+    new_number = {old: new for new, old in enumerate(kept, start=1)}
+
+    def resolve(old: int) -> Optional[int]:
+        while old in alias:
+            old = alias[old]
+            if old is None:
+                return None
+        return new_number.get(old)
+
+    remapped: Dict[str, List[int]] = {}
+    for key, deps in depends_on.items():
+        try:
+            step = resolve(int(key) - 1)
+        except (TypeError, ValueError):
+            continue
+        # Dependências de um passo removido não passam para quem ficou
+        if step is None or int(key) - 1 in alias:
+            continue
+        targets = []
+        for dep in deps if isinstance(deps, list) else [deps]:
+            try:
+                target = resolve(int(dep) - 1)
+            except (TypeError, ValueError):
+                continue
+            if target is not None and target != step and target not in targets:
+                targets.append(target)
+        if targets:
+            remapped[str(step)] = targets
+    return remapped
+
+
+def _count_launches(specs: List[Optional[Dict[str, Any]]], indices) -> int:
+    """🚀 Quantos passos abrem um processo (navegador, programa, comando)"""
+    return sum(1 for i in indices if specs[i] and specs[i].get("spawns"))
+
+# 🎯 EXEMPLO DE USO E TESTE
+if __name__ == "__main__":
+    print("✂️ SolAgent Plan Optimizer v1.2 - Testando...")
+
+    plano = {
+        "explicacao": "YouTube e Google",
+        "passos": ["abrir_navegador", "pesquisar_no_youtube:lofi", "abrir_navegador",
+                   "pesquisar_google:lofi", "pesquisar_no_youtube:lofi", "obter_hora_atual"],
+        "depends_on": {"4": [3], "6": [5]},
+    }
+    otimizado, relatorio = optimize_plan(plano)
+    assert otimizado["passos"] == ["pesquisar_no_youtube:lofi", "pesquisar_google:lofi", "obter_hora_atual"]
+    assert otimizado["depends_on"] == {"3": [1]}, otimizado
+    assert (relatorio["launches_before"], relatorio["launches_after"]) == (5, 2), relatorio
+
+    # Repetição separada por uma alteração no mesmo recurso é mantida
+    passos = ["listar_arquivos:C:\\x", "criar_pasta:C:\\x\\novo", "listar_arquivos:C:\\x", "listar_arquivos:C:\\x"]
+    otimizado, _ = optimize_plan({"explicacao": "", "passos": passos})
+    assert otimizado["passos"] == passos[:3], otimizado
+
+    # Passo sem recurso (barreira) no meio: as repetições ficam
+    passos = ["executar_comando:X", "abrir_programa:Y", "executar_comando:X",
+              "obter_hora_atual", "listar_arquivos:C:\\x", "executar_comando:Z",
+              "listar_arquivos:C:\\x", "obter_hora_atual", "executar_comando:Z"]
+    otimizado, _ = optimize_plan({"explicacao": "", "passos": passos})
+    assert otimizado["passos"] == passos[:7] + ["obter_hora_atual"], otimizado
+
+    # Página inicial + pesquisa no mesmo site = uma aba só
+    otimizado, relatorio = optimize_plan({"explicacao": "", "passos": [
+        "abrir_navegador", "abrir_url:https://www.youtube.com", "pesquisar_no_youtube:lofi"]})
+    assert otimizado["passos"] == ["pesquisar_no_youtube:lofi"], otimizado
+    assert relatorio["launches_after"] == 1
+
+    # Só abrir o navegador continua valendo
+    otimizado, relatorio = optimize_plan({"explicacao": "", "passos": ["abrir_navegador"]})
+    assert otimizado["passos"] == ["abrir_navegador"] and not relatorio["removed"]
+
+    for passo, motivo in optimize_plan(plano)[1]["removed"]:
+        print(f"  ✂️ {passo} ({motivo})")
+    print("\n✅ Teste concluído!")
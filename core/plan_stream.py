@@ -0,0 +1,182 @@
+"""
+⚡ SolAgent v1.2 - Plan Stream (Leitura Incremental do Plano)
+============================================================
+
+Parser JSON incremental para respostas em streaming da IA.
+Permite mostrar (e falar) a explicação enquanto os passos
+ainda estão sendo gerados.
+
+Funcionalidades:
+- Consome o texto em pedaços (tokens) conforme chegam
+- Emite "explicacao" assim que o campo fecha
+- Emite cada item de "passos" assim que ele fecha
+- Ignora texto fora do objeto (ex.: cercas ```json)
+
+Autores: Mario, GitHub Copilot & Sol (ela mesma ajudou a se criar!)
+Versão: 1.2 (Audio Revolution) - Tríade Criativa
+Data: 28/10/2025
+"""
+
+import json
+from typing import Callable, List, Optional
+
+
+class IncrementalPlanParser:
+    """
+    🧩 PARSER INCREMENTAL DO PLANO
+
+    Acompanha apenas o necessário do JSON (pilha de containers,
+    strings e chaves do objeto raiz) - não monta a árvore inteira.
+    O texto completo continua disponível em `text` para a validação final.
+    """
+
+    def __init__(self,
+                 on_explanation: Optional[Callable[[str], None]] = None,
+                 on_step: Optional[Callable[[str], None]] = None):
+        self.on_explanation = on_explanation
+        self.on_step = on_step
+
+        self.explanation: Optional[str] = None
+        self.steps: List[str] = []
+
+        self._chunks: List[str] = []
+        self._stack: List[str] = []
+        self._started = False
+        self._done = False
+
+        self._in_string = False
+        self._escape = False
+        self._string_role: Optional[str] = None
+        self._buffer: Optional[List[str]] = None
+
+        self._expecting_key = False
+        self._current_key: Optional[str] = None
+        self._in_steps = False
+
+    @property
+    def text(self) -> str:
+        """📄 Todo o texto recebido até agora"""
+        return "".join(self._chunks)
+
+    def feed(self, chunk: str) -> None:
+        """📥 Processa mais um pedaço da resposta"""
+        if not chunk:
+            return
+        self._chunks.append(chunk)
+        for ch in chunk:
+            if self._done:
+                break
+            self._feed_char(ch)
+
+    def _feed_char(self, ch: str) -> None:
+        # 🔤 Dentro de string: só procura o fechamento
+        if self._in_string:
+            if self._buffer is not None:
+                self._buffer.append(ch)
+            if self._escape:
+                self._escape = False
+            elif ch == "\\":
+                self._escape = True
+            elif ch == '"':
+                self._in_string = False
+                self._close_string()
+            return
+
+        depth = len(self._stack)
+
+        if not self._started:
+            # Texto antes do objeto raiz (ex.: ```json) é ignorado
+            if ch == "{":
+                self._started = True
+                self._stack.append(ch)
+                self._expecting_key = True
+            return
+
+        if ch == '"':
+            self._in_string = True
+            if depth == 1 and self._expecting_key:
+                self._string_role = "key"
+            elif depth == 1 and self._current_key == "explicacao":
+                self._string_role = "explicacao"
+            elif depth == 2 and self._in_steps:
+                self._string_role = "passo"
+            else:
+                self._string_role = None
+            self._buffer = ['"'] if self._string_role else None
+
+        elif ch in "{[":
+            if depth == 1 and ch == "[" and self._current_key == "passos":
+                self._in_steps = True
+            self._stack.append(ch)
+
+        elif ch in "}]":
+            if self._stack:
+                self._stack.pop()
+            if len(self._stack) == 1:
+                self._in_steps = False
+            elif not self._stack:
+                self._done = True
+
+        elif depth == 1 and ch == ":":
+            self._expecting_key = False
+
+        elif depth == 1 and ch == ",":
+            self._expecting_key = True
+            self._current_key = None
+
+    def _close_string(self) -> None:
+        """✅ Uma string terminou - emite se for um campo de interesse"""
+        role = self._string_role
+        literal = "".join(self._buffer) if self._buffer is not None else None
+        self._string_role = None
+        self._buffer = None
+
+        if role is None:
+            return
+
+        try:
+            value = json.loads(literal)
+        except json.JSONDecodeError:
+            return
+
+        if role == "key":
+            self._current_key = value
+        elif role == "explicacao" and self.explanation is None:
+            self.explanation = value
+            if self.on_explanation:
+                self.on_explanation(value)
+        elif role == "passo":
+            self.steps.append(value)
+            if self.on_step:
+                self.on_step(value)
+
+# 🎯 EXEMPLO DE USO E TESTE
+if __name__ == "__main__":
+    print("🧩 SolAgent Plan Stream v1.2 - Testando...")
+
+    resposta = (
+        '```json\n{"explicacao": "Vou abrir o \\"YouTube\\"", '
+        '"passos": ["abrir_navegador", "pesquisar_no_youtube:lo-fi, jazz"]}\n```'
+    )
+
+    eventos = []
+    parser = IncrementalPlanParser(
+        on_explanation=lambda texto: eventos.append(("explicacao", texto)),
+        on_step=lambda passo: eventos.append(("passo", passo)),
+    )
+
+    # Simula tokens de 3 caracteres
+    for i in range(0, len(resposta), 3):
+        parser.feed(resposta[i:i + 3])
+
+    assert eventos == [
+        ("explicacao", 'Vou abrir o "YouTube"'),
+        ("passo", "abrir_navegador"),
+        ("passo", "pesquisar_no_youtube:lo-fi, jazz"),
+    ], eventos
+    assert parser.text == resposta
+
+    for tipo, valor in eventos:
+        print(f"  📤 {tipo}: {valor}")
+
+    print("\n✅ Teste concluído!")
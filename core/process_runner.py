@@ -0,0 +1,196 @@
+"""
+⚡ SolAgent v1.2 - Process Runner (Execução de Comandos em Streaming)
+===================================================================
+
+Executa comandos do sistema com asyncio, mostrando a saída linha a
+linha enquanto o processo roda - sem travar esperando o fim.
+
+Funcionalidades:
+- Saída entregue linha a linha (callback on_line)
+- Timeout por comando (o processo é encerrado)
+- Limite de saída: só as últimas linhas ficam em memória
+- Cancelamento por Ctrl+C ou por threading.Event
+- stderr lido em paralelo (sem risco de deadlock no pipe)
+
+Autores: Mario, GitHub Copilot & Sol (ela mesma ajudou a se criar!)
+Versão: 1.2 (Audio Revolution) - Tríade Criativa
+Data: 28/10/2025
+"""
+
+import asyncio
+import locale
+import os
+import signal
+import subprocess
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+READ_CHUNK_BYTES = 4096
+
+
+def run_streaming(command: str,
+                  on_line: Optional[Callable[[str], None]] = None,
+                  timeout: float = 10,
+                  max_output_bytes: int = 256 * 1024,
+                  keep_lines: int = 200,
+                  cancel_event: Optional[threading.Event] = None) -> Dict[str, Any]:
+    """
+    🚀 Executa um comando e entrega a saída linha a linha
+
+    Args:
+        command (str): Linha de comando (interpretada pelo shell do sistema)
+        on_line (callable): Recebe cada linha de stdout assim que ela chega
+        timeout (float): Tempo máximo em segundos
+        max_output_bytes (int): Acima disso o processo é encerrado (saída truncada)
+        keep_lines (int): Quantas linhas finais ficam guardadas no resultado
+        cancel_event (threading.Event): Se sinalizado, encerra o processo
+
+    Returns:
+        dict: returncode, output (últimas linhas), stderr, truncated,
+              timed_out, cancelled, duration
+
+    Ctrl+C durante a execução encerra o processo e propaga KeyboardInterrupt.
+    """
+    return asyncio.run(_run(command, on_line, timeout, max_output_bytes, keep_lines, cancel_event))
+
+
+async def _run(command, on_line, timeout, max_output_bytes, keep_lines, cancel_event) -> Dict[str, Any]:
+    encoding = locale.getpreferredencoding(False)
+    start = time.perf_counter()
+    result = {
+        "returncode": None,
+        "output": "",
+        "stderr": "",
+        "truncated": False,
+        "timed_out": False,
+        "cancelled": False,
+        "duration": 0.0,
+    }
+
+    stdout_tail = deque(maxlen=keep_lines)
+    stderr_tail = deque(maxlen=keep_lines)
+    total_bytes = 0
+
+    # Nova sessão/grupo: permite encerrar o shell E os filhos dele
+    proc = await asyncio.create_subprocess_shell(
+        command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        **({} if os.name == "nt" else {"start_new_session": True})
+    )
+
+    async def pump(stream, tail, callback) -> None:
+        nonlocal total_bytes
+        pending = b""
+        while True:
+            chunk = await stream.read(READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            total_bytes += len(chunk)
+            if total_bytes > max_output_bytes:
+                result["truncated"] = True
+                kill_tree(proc)
+                return
+            pending += chunk
+            *lines, pending = pending.split(b"\n")
+            for raw in lines:
+                line = raw.decode(encoding, errors="replace").rstrip("\r")
+                tail.append(line)
+                if callback:
+                    callback(line)
+        if pending:
+            line = pending.decode(encoding, errors="replace").rstrip("\r")
+            tail.append(line)
+            if callback:
+                callback(line)
+
+    async def watch_cancel() -> None:
+        while not cancel_event.is_set():
+            await asyncio.sleep(0.1)
+        result["cancelled"] = True
+
+    readers = asyncio.gather(
+        pump(proc.stdout, stdout_tail, on_line),
+        pump(proc.stderr, stderr_tail, None),
+    )
+    waiters = [asyncio.ensure_future(readers)]
+    watcher = asyncio.ensure_future(watch_cancel()) if cancel_event else None
+    if watcher:
+        waiters.append(watcher)
+
+    try:
+        done, _ = await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        if not done:
+            result["timed_out"] = True
+        if not (result["timed_out"] or result["cancelled"] or result["truncated"]):
+            # Pipes fechados não quer dizer processo encerrado (ex.: filho que
+            # fecha stdout/stderr e continua rodando): espera só o tempo que sobrou
+            exit_waiter = asyncio.ensure_future(proc.wait())
+            waiters.append(exit_waiter)
+            remaining = max(0.0, timeout - (time.perf_counter() - start))
+            watching = [exit_waiter] + ([watcher] if watcher and not watcher.done() else [])
+            await asyncio.wait(watching, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            if not exit_waiter.done() and not result["cancelled"]:
+                result["timed_out"] = True
+        if result["timed_out"] or result["cancelled"] or result["truncated"]:
+            kill_tree(proc)
+        result["returncode"] = await proc.wait()
+    except asyncio.CancelledError:
+        # Ctrl+C: asyncio.run cancela a tarefa - não deixa o processo órfão
+        result["cancelled"] = True
+        kill_tree(proc)
+        await proc.wait()
+        raise
+    finally:
+        for waiter in waiters:
+            waiter.cancel()
+        result["output"] = "\n".join(stdout_tail)
+        result["stderr"] = "\n".join(stderr_tail)
+        result["duration"] = time.perf_counter() - start
+
+    return result
+
+
+def kill_tree(proc) -> None:
+    """🛑 Encerra o processo e seus filhos (ignora se já terminou)"""
+    try:
+        if os.name == "nt":
+            subprocess.run(["taskkill", "/F", "/T", "/PID", str(proc.pid)], capture_output=True)
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError, OSError):
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+
+# 🎯 EXEMPLO DE USO E TESTE
+if __name__ == "__main__":
+    import sys
+
+    print("⚙️ SolAgent Process Runner v1.2 - Testando...")
+
+    py = f'"{sys.executable}"'
+    linhas = []
+    r = run_streaming(f'{py} -c "print(1); print(2)"', on_line=linhas.append)
+    assert linhas == ["1", "2"] and r["returncode"] == 0, r
+
+    r = run_streaming(f'{py} -c "import time; time.sleep(5)"', timeout=0.5)
+    assert r["timed_out"] and r["duration"] < 2, r
+
+    # Fecha a saída e continua rodando: o timeout vale mesmo assim
+    fecha_saida = "import os, time; os.close(1); os.close(2); time.sleep(5)"
+    r = run_streaming(f'{py} -c "{fecha_saida}"', timeout=0.5)
+    assert r["timed_out"] and r["duration"] < 2, r
+
+    r = run_streaming(f'{py} -c "print(\'x\' * 100000)"', max_output_bytes=1000)
+    assert r["truncated"], r
+
+    evento = threading.Event()
+    threading.Timer(0.3, evento.set).start()
+    r = run_streaming(f'{py} -c "import time; time.sleep(5)"', timeout=10, cancel_event=evento)
+    assert r["cancelled"] and r["duration"] < 2, r
+
+    print("\n✅ Teste concluído!")
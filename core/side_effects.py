@@ -0,0 +1,262 @@
+"""
+⚡ SolAgent v1.2 - Side Effects (Ações que Alteram o Sistema + Simulação)
+=======================================================================
+
+Porta única das ações que mexem no computador: abrir URL, criar pasta,
+abrir programa, executar comando. Os handlers seguem o mesmo caminho
+nos dois modos - no modo seguro, cada primitiva é trocada por uma
+versão que só registra o efeito esperado.
+
+Funcionalidades:
+- Primitivas reais (modo execução) e simuladas (modo seguro)
+- Simulação fiel: programa inexistente falha igual ao modo real
+- Efeitos registrados por passo (pastas, processos, URLs, comandos)
+- Relatório da simulação com tempo estimado pelo histórico real
+- simulate(): roda um plano inteiro sem tocar na máquina (CI/benchmark)
+
+Autores: Mario, GitHub Copilot & Sol (ela mesma ajudou a se criar!)
+Versão: 1.2 (Audio Revolution) - Tríade Criativa
+Data: 28/10/2025
+"""
+
+import os
+import threading
+import webbrowser
+from typing import Any, Dict, List, Optional
+
+from core import launcher as launcher_module, process_runner
+
+# 🏷️ Tipos de efeito, na ordem do relatório
+EFFECT_KINDS = [
+    ("folder", "📂 Pastas criadas"),
+    ("process", "🚀 Processos abertos"),
+    ("url", "🔗 URLs abertas"),
+    ("file", "📄 Arquivos abertos"),
+    ("command", "⚙️ Comandos executados"),
+]
+
+_local = threading.local()
+
+
+def begin_step(effects: List[Dict[str, Any]]) -> None:
+    """📝 Efeitos desta thread passam a ser anotados na lista do passo"""
+    _local.effects = effects
+
+
+def _record(kind: str, target: str, simulated: bool, **details) -> None:
+    effects = getattr(_local, "effects", None)
+    if effects is not None:
+        effects.append({"kind": kind, "target": target, "simulated": simulated, **details})
+
+
+# 🌐 NAVEGADOR
+
+def open_url(url: str, log, safe_mode: bool) -> bool:
+    """🔗 Abre a URL no navegador padrão (False se nenhum navegador aceitou)"""
+    _record("url", url, safe_mode)
+    if safe_mode:
+        print(f"🌟 Sol: (Modo seguro) Abriria no navegador: {url}")
+        return True
+    if not webbrowser.open(url):
+        log.error(f"❌ Nenhum navegador conseguiu abrir: {url}")
+        return False
+    return True
+
+
+# 📂 ARQUIVOS
+
+def make_dirs(path: str, safe_mode: bool) -> None:
+    """📂 Cria a pasta (e as pastas-pai que faltarem)"""
+    _record("folder", path, safe_mode, exists=os.path.isdir(path))
+    if safe_mode:
+        print(f"🌟 Sol: (Modo seguro) Criaria a pasta: {path}")
+        return
+    os.makedirs(path, exist_ok=True)
+
+
+# 🚀 PROGRAMAS
+
+class SimulatedLauncher:
+    """
+    🔒 Launcher do modo seguro: mesma interface do core/launcher.py
+
+    Resolve o programa de verdade (só leitura do PATH) - um programa
+    inexistente dá FileNotFoundError como no modo real - mas não abre nada.
+    """
+
+    def __init__(self, real: "launcher_module.Launcher"):
+        self._real = real
+        self.backend = real.backend
+
+    def resolve(self, program: str) -> Optional[str]:
+        return self._real.resolve(program)
+
+    def launch(self, command_line: str, wait: bool = False) -> None:
+        args = self._real.split_command(command_line)
+        program = args[0] if args else ""
+        path = self._real.resolve(program) if program else None
+        if path is None:
+            raise FileNotFoundError(f"programa não encontrado: {program}")
+        _record("process", command_line, True, path=path)
+        print(f"🌟 Sol: (Modo seguro) Abriria o programa: {path}")
+
+    def open(self, target: str) -> None:
+        kind = "url" if "://" in target else "file"
+        _record(kind, target, True)
+        print(f"🌟 Sol: (Modo seguro) Abriria com o programa padrão: {target}")
+
+    def open_file_manager(self) -> None:
+        command = self.backend.file_manager()
+        _record("process", " ".join(command), True)
+        print("🌟 Sol: (Modo seguro) Abriria o explorador de arquivos")
+
+    def play_audio(self, file_path: str) -> bool:
+        return True
+
+
+class _RecordingLauncher:
+    """🚀 Launcher real que também anota os processos abertos no passo"""
+
+    def __init__(self, real: "launcher_module.Launcher"):
+        self._real = real
+
+    def __getattr__(self, name):
+        return getattr(self._real, name)
+
+    def launch(self, command_line: str, wait: bool = False):
+        proc = self._real.launch(command_line, wait=wait)
+        _record("process", command_line, False, pid=proc.pid)
+        return proc
+
+    def open(self, target: str):
+        proc = self._real.open(target)
+        _record("url" if "://" in target else "file", target, False)
+        return proc
+
+    def open_file_manager(self):
+        proc = self._real.open_file_manager()
+        _record("process", " ".join(self._real.backend.file_manager()), False, pid=proc.pid if proc else None)
+        return proc
+
+
+def get_launcher(log, safe_mode: bool):
+    """🚀 Launcher da sessão - simulado no modo seguro"""
+    real = launcher_module.get_launcher(log)
+    return SimulatedLauncher(real) if safe_mode else _RecordingLauncher(real)
+
+
+# ⚙️ COMANDOS DO SISTEMA
+
+def run_command(command_line: str, safe_mode: bool, **options) -> Dict[str, Any]:
+    """
+    ⚙️ process_runner.run_streaming - ou um resultado vazio no modo seguro
+
+    Returns:
+        dict: mesmo formato de process_runner.run_streaming
+    """
+    _record("command", command_line, safe_mode)
+    if not safe_mode:
+        return process_runner.run_streaming(command_line, **options)
+    print(f"🌟 Sol: (Modo seguro) Simulando execução do comando '{command_line}'")
+    return {"returncode": 0, "output": "", "stderr": "", "truncated": False,
+            "timed_out": False, "cancelled": False, "duration": 0.0}
+
+
+# 📋 RELATÓRIO DA SIMULAÇÃO
+
+def build_report(step_results: List[Dict[str, Any]],
+                 step_stats: Optional[List[Dict[str, Any]]] = None) -> str:
+    """
+    📋 Efeitos esperados + tempo estimado de cada passo
+
+    Args:
+        step_results: Registros do Executor (com a lista "effects")
+        step_stats: CommandHistory.get_step_stats() - tempos do modo real
+    """
+    estimates = {stats["command"]: stats for stats in (step_stats or [])}
+    lines = ["", "🔒 ═══ SIMULAÇÃO (modo seguro) ═══", "📋 Efeitos esperados:"]
+
+    effects = [effect for result in step_results for effect in result.get("effects", [])]
+    for kind, title in EFFECT_KINDS:
+        targets = [effect["target"] for effect in effects if effect["kind"] == kind]
+        if targets:
+            lines.append(f"  {title}: {', '.join(targets)}")
+    if not effects:
+        lines.append("  (Nenhuma alteração no sistema - só leitura/informação)")
+    failing = [result["step"] for result in step_results if result["status"] != "success"]
+    if failing:
+        lines.append(f"  ⚠️ Falhariam: {', '.join(failing)}")
+
+    lines.append("⏱️ Tempo estimado (histórico do modo real):")
+    total = 0.0
+    unknown = 0
+    for number, result in enumerate(step_results, start=1):
+        stats = estimates.get(result["command"])
+        if stats and stats["avg_duration"] > 0:
+            total += stats["avg_duration"]
+            lines.append(f"  {number}. {result['step']} ~ {_format_ms(stats['avg_duration'])} "
+                         f"(média de {stats['runs']} execuções, {stats['success_rate']:.0f}% de sucesso)")
+        else:
+            unknown += 1
+            lines.append(f"  {number}. {result['step']} ~ ? (sem histórico)")
+
+    simulated = sum(result["duration"] for result in step_results)
+    summary = f"  Total estimado: ~{_format_ms(total)}"
+    if unknown:
+        summary += f" + {unknown} passo(s) sem histórico"
+    lines.append(f"{summary} (simulação levou {_format_ms(simulated)})")
+    return "\n".join(lines)
+
+
+def _format_ms(seconds: float) -> str:
+    return f"{seconds * 1000:.0f} ms" if seconds < 1 else f"{seconds:.1f} s"
+
+
+def simulate(steps: list, log, config: Optional[dict] = None,
+             step_stats: Optional[List[Dict[str, Any]]] = None):
+    """
+    🧪 Roda um plano no modo seguro e devolve (registros, relatório)
+
+    Mesmo caminho do Executor, sem tocar na máquina - útil para medir
+    planos no CI.
+    """
+    from core import executor_commercial  # evita import circular
+
+    results = executor_commercial.execute_steps(steps, log, dict(config or {}, safe_mode=True))
+    return results, build_report(results, step_stats)
+
+# 🎯 EXEMPLO DE USO E TESTE
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    print("🔒 SolAgent Side Effects v1.2 - Testando...")
+
+    class LogTeste:
+        def log(self, msg): print(f"[LOG] {msg}")
+        def debug(self, msg): print(f"[DEBUG] {msg}")
+        def error(self, msg): print(f"[ERROR] {msg}")
+        def warning(self, msg): print(f"[WARNING] {msg}")
+
+    pasta = os.path.join(tempfile.mkdtemp(), "nova", "pasta")
+    plano = [
+        "abrir_navegador",
+        "pesquisar_no_youtube:lofi",
+        f"criar_pasta:{pasta}",
+        "abrir_programa:programa-que-nao-existe",
+        "executar_comando:hostname",
+        "obter_hora_atual",
+    ]
+    historico = [{"command": "pesquisar_no_youtube", "runs": 12, "success_rate": 100.0,
+                  "avg_duration": 0.35, "max_duration": 0.9}]
+
+    inicio = time.perf_counter()
+    resultados, relatorio = simulate(plano, LogTeste(), {"parallel_execution": False}, historico)
+    print(f"  ⏱️ Plano simulado em {(time.perf_counter() - inicio) * 1000:.0f} ms")
+    print(relatorio)
+
+    assert not os.path.exists(pasta), "o modo seguro criou a pasta!"
+    assert resultados[2]["effects"][0]["kind"] == "folder"
+    assert resultados[3]["status"] == "failed"  # mesmo erro do modo real
+    assert resultados[4]["effects"][0] == {"kind": "command", "target": "hostname", "simulated": True}
+    print("\n✅ Teste concluído!")
@@ -0,0 +1,226 @@
+"""
+⚡ SolAgent v1.2 - Stream Transcriber (Transcrição Durante a Gravação)
+=====================================================================
+
+Transcreve enquanto a tecla ainda está pressionada: a cada segundo
+novo de áudio o Whisper decodifica a janela desde o último ponto
+confirmado. Palavras que duas passadas seguidas concordam ficam
+confirmadas e a janela anda para depois delas.
+
+Ao soltar a tecla só falta o finalzinho - o tempo até o texto fica
+quase o mesmo para um comando de 2 ou de 20 segundos.
+
+Funcionalidades:
+- Janelas sobrepostas a partir do último ponto confirmado
+- Estabilização por prefixo comum entre passadas (palavra a palavra)
+- Texto parcial ao vivo (callback on_partial)
+- Janela limitada: confirma à força se a fala não estabiliza
+- Janelas sem fala (VAD) não vão para o Whisper
+
+Autores: Mario, GitHub Copilot & Sol (ela mesma ajudou a se criar!)
+Versão: 1.2 (Audio Revolution) - Tríade Criativa
+Data: 28/10/2025
+"""
+
+import threading
+from typing import Callable, List, Optional, Tuple
+
+from core import tracer, vad
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# ⏱️ Áudio novo necessário para uma nova passada
+STEP_SECONDS = 1.0
+
+# ⏱️ Janela máxima sem confirmação (depois confirma à força)
+MAX_WINDOW_SECONDS = 8.0
+
+# ⏱️ Janela mínima para valer uma passada
+MIN_WINDOW_SECONDS = 0.5
+
+# 📝 Texto confirmado passado como contexto (initial_prompt) para a próxima janela
+PROMPT_CHARS = 200
+
+# (palavra, amostra inicial, amostra final) - posições absolutas na gravação
+Word = Tuple[str, int, int]
+
+
+def _normalize(word: str) -> str:
+    return word.strip().lower().strip(".,!?;:")
+
+
+class StreamingTranscriber:
+    """
+    📡 TRANSCRIÇÃO INCREMENTAL (uma thread, enquanto grava)
+
+    decode(audio, prompt, word_timestamps) é o Whisper (AudioInput._decode):
+    recebe um array float32 que pode alterar e devolve o dict do
+    model.transcribe.
+
+    Uso: start() quando a gravação começa, finish() quando termina -
+    finish() devolve o texto completo.
+    """
+
+    def __init__(self, capture, decode: Callable, sample_rate: int, config: Optional[dict] = None,
+                 on_partial: Optional[Callable[[str], None]] = None, log=None):
+        config = config or {}
+        self.capture = capture
+        self.decode = decode
+        self.sample_rate = sample_rate
+        self.config = config
+        self.on_partial = on_partial
+        self.log = log
+        self.vad_enabled = config.get("vad_enabled", True)
+        self.step_samples = int(sample_rate * config.get("stream_step_seconds", STEP_SECONDS))
+        self.max_window_samples = int(sample_rate * config.get("stream_max_window_seconds", MAX_WINDOW_SECONDS))
+        self.min_window_samples = int(sample_rate * MIN_WINDOW_SECONDS)
+
+        self.committed_text = ""
+        self.partial_text = ""
+        self.passes = 0
+        self._committed_sample = 0
+        self._last_pass_end = 0
+        self._pending: List[Word] = []  # Hipótese da última passada (ainda não confirmada)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> None:
+        """▶️ Começa a transcrever em segundo plano"""
+        self._thread = threading.Thread(target=self._loop, name="sol-stream-transcribe", daemon=True)
+        self._thread.start()
+
+    def _loop(self) -> None:
+        try:
+            while not self._stop.is_set():
+                if self.capture.samples_written - self._last_pass_end < self.step_samples:
+                    self._stop.wait(0.05)
+                    continue
+                self._pass()
+        except Exception as e:
+            # Falhou no meio: finish() transcreve o que faltar de uma vez
+            if self.log:
+                self.log.debug(f"📡 Transcrição incremental parou: {str(e)}")
+
+    def _window(self):
+        """🪟 Áudio desde o ponto confirmado (cópia - o Whisper normaliza in place)"""
+        samples, end = self.capture.read_since(self._committed_sample)
+        start = end - len(samples)  # no modo circular o começo pode ter sido sobrescrito
+        return np.array(samples, dtype=np.float32), start, end
+
+    def _has_speech(self, audio) -> bool:
+        return not self.vad_enabled or vad.trim(audio, self.sample_rate, self.config) is not None
+
+    def _pass(self) -> None:
+        """🔁 Uma passada: decodifica a janela, confirma o prefixo estável"""
+        audio, start, end = self._window()
+        self._last_pass_end = end
+        if len(audio) < self.min_window_samples:
+            return
+        if not self._has_speech(audio):
+            if not self._pending:
+                # Só silêncio até aqui: a próxima janela começa mais à frente
+                self._committed_sample = max(self._committed_sample, end - self.min_window_samples)
+            return
+
+        with tracer.span("stream_pass", "audio", seconds=len(audio) / self.sample_rate) as span:
+            result = self.decode(audio, prompt=self.committed_text[-PROMPT_CHARS:] or None, word_timestamps=True)
+            words = [(w["word"], start + int(w["start"] * self.sample_rate), start + int(w["end"] * self.sample_rate))
+                     for segment in result.get("segments", []) for w in segment.get("words", [])]
+
+            agreed = 0
+            for new, old in zip(words, self._pending):
+                if _normalize(new[0]) != _normalize(old[0]):
+                    break
+                agreed += 1
+
+            # Janela grande demais sem estabilizar: confirma tudo menos o último segundo
+            if not agreed and end - self._committed_sample > self.max_window_samples:
+                agreed = sum(1 for word in words if word[2] < end - self.step_samples)
+
+            self._commit(words[:agreed])
+            self._pending = words[agreed:]
+            span.set(words=len(words), committed=agreed)
+        self.passes += 1
+
+        self.partial_text = (self.committed_text + "".join(word[0] for word in self._pending)).strip()
+        if self.on_partial and self.partial_text:
+            self.on_partial(self.partial_text)
+
+    def _commit(self, words: List[Word]) -> None:
+        if not words:
+            return
+        self.committed_text += "".join(word[0] for word in words)
+        self._committed_sample = max(self._committed_sample, words[-1][2])
+
+    def finish(self) -> str:
+        """
+        🏁 Para a transcrição incremental e decodifica só o que falta
+
+        Returns:
+            str: Texto completo (confirmado + final da gravação)
+        """
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+        audio, start, end = self._window()
+        tail = ""
+        if len(audio) and self._has_speech(audio):
+            with tracer.span("stream_tail", "audio", seconds=len(audio) / self.sample_rate):
+                result = self.decode(audio, prompt=self.committed_text[-PROMPT_CHARS:] or None,
+                                     word_timestamps=False)
+            tail = result["text"]
+        text = " ".join((self.committed_text + " " + tail).split())
+        if self.log:
+            self.log.debug(f"📡 {self.passes} passada(s) durante a gravação, "
+                           f"final de {len(audio) / self.sample_rate:.1f}s decodificado ao soltar")
+        return text
+
+# 🎯 EXEMPLO DE USO E TESTE
+if __name__ == "__main__":
+    import sys
+    import time
+
+    print("📡 SolAgent Stream Transcriber v1.2 - Testando...")
+    if not NUMPY_AVAILABLE:
+        print("⚠️ numpy não instalado - nada a testar")
+        sys.exit(0)
+
+    from core.audio_buffer import CaptureBuffer
+
+    taxa = 16000
+    meio = taxa // 2
+
+    # 🧪 "Whisper" falso: cada meio segundo de áudio com valor k é a palavra "pk";
+    # o último meio segundo ainda incompleto sai errado (hipótese instável)
+    def decode_falso(audio, prompt=None, word_timestamps=False):
+        palavras = []
+        for inicio in range(0, len(audio), meio):
+            bloco = audio[inicio:inicio + meio]
+            nome = f" p{int(round(float(bloco[0]) * 100))}" if len(bloco) == meio else " ???"
+            palavras.append({"word": nome, "start": inicio / taxa, "end": (inicio + len(bloco)) / taxa})
+        time.sleep(0.02 * len(audio) / taxa)  # custo proporcional à janela
+        return {"text": "".join(p["word"] for p in palavras if p["word"] != " ???"),
+                "segments": [{"words": palavras}]}
+
+    buffer = CaptureBuffer(taxa, max_seconds=30)
+    parciais = []
+    stream = StreamingTranscriber(buffer, decode_falso, taxa, {"vad_enabled": False}, on_partial=parciais.append)
+    stream.start()
+    for k in range(1, 21):  # 10 s "falados" em blocos de meio segundo
+        buffer.write(np.full(meio, k / 100, dtype=np.float32))
+        time.sleep(0.03)
+
+    inicio = time.perf_counter()
+    texto = stream.finish()
+    final_ms = (time.perf_counter() - inicio) * 1000
+    esperado = " ".join(f"p{k}" for k in range(1, 21))
+    assert texto == esperado, texto
+    assert stream.passes > 0 and parciais and stream.committed_text.strip()
+    print(f"  📝 {stream.passes} passadas, parcial: '{parciais[-1][:40]}...'")
+    print(f"  ⏱️ Soltou -> texto: {final_ms:.0f} ms (10 s de fala)")
+    print("\n✅ Teste concluído!")
@@ -0,0 +1,237 @@
+"""
+⚡ SolAgent v1.2 - Tracer (Linha do Tempo de Cada Interação)
+===========================================================
+
+Mede onde o tempo vai em uma interação: gravação, Whisper, plano,
+fala, confirmação e cada passo do Executor.
+
+Gera um arquivo por sessão no formato Chrome Trace Event - abra em
+chrome://tracing ou https://ui.perfetto.dev para ver a linha do tempo.
+
+Funcionalidades:
+- Ativado pela configuração "trace_enabled" (desligado por padrão)
+- Spans com início/duração por thread (passos paralelos lado a lado)
+- Eventos instantâneos (ex.: primeiro token da IA)
+- Desligado: span() devolve um objeto vazio pronto - custo de um if
+- Arquivo reescrito a cada interação (dá para abrir com a Sol rodando)
+
+Autores: Mario, GitHub Copilot & Sol (ela mesma ajudou a se criar!)
+Versão: 1.2 (Audio Revolution) - Tríade Criativa
+Data: 28/10/2025
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+_enabled = False
+_events: List[Dict[str, Any]] = []
+_thread_names: Dict[int, str] = {}
+_origin_ns = time.perf_counter_ns()
+_pid = os.getpid()
+_max_events = 100000
+_dropped = 0
+_trace_file: Optional[str] = None
+_flush_lock = threading.Lock()
+_log = None
+
+
+class _NullSpan:
+    """💤 Span do tracer desligado: não mede nada"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+    def set(self, **args) -> None:
+        pass
+
+    def end(self, **args) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """⏱️ Um trecho medido (evento "X" do Chrome Trace)"""
+
+    __slots__ = ("name", "cat", "args", "start")
+
+    def __init__(self, name: str, cat: str, args: Dict[str, Any]):
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        _record({
+            "name": self.name,
+            "cat": self.cat,
+            "ph": "X",
+            "ts": (self.start - _origin_ns) / 1000,
+            "dur": (end - self.start) / 1000,
+            "args": self.args,
+        })
+        return False
+
+    def set(self, **args) -> None:
+        """📝 Acrescenta argumentos descobertos durante o trecho"""
+        self.args.update(args)
+
+    def end(self, **args) -> None:
+        """🏁 Fecha um span aberto com start_span()"""
+        self.args.update(args)
+        self.__exit__(None, None, None)
+
+
+def configure(config: dict, log) -> bool:
+    """
+    🔧 Liga o tracer se "trace_enabled" estiver na configuração
+
+    Returns:
+        bool: True se o tracer ficou ativo
+    """
+    global _enabled, _max_events, _trace_file, _log
+
+    if not config.get("trace_enabled", False):
+        _enabled = False
+        return False
+
+    trace_dir = config.get("trace_dir", os.path.join("logs", "traces"))
+    _trace_file = os.path.join(trace_dir, f"sol_trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    _max_events = config.get("trace_max_events", 100000)
+    _log = log
+    _enabled = True
+    atexit.register(flush)
+    log.log(f"🧭 Tracing ativo: {_trace_file}")
+    return True
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def span(name: str, cat: str = "sol", **args):
+    """
+    ⏱️ Mede um trecho de código
+
+        with tracer.span("generate_plan", "brain", chars=len(texto)):
+            ...
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, cat, args)
+
+
+def start_span(name: str, cat: str = "sol", **args):
+    """⏱️ Abre um span que termina em outro ponto do código (span.end())"""
+    return span(name, cat, **args).__enter__()
+
+
+def instant(name: str, cat: str = "sol", **args) -> None:
+    """📍 Marca um momento (evento "i" do Chrome Trace)"""
+    if not _enabled:
+        return
+    _record({
+        "name": name,
+        "cat": cat,
+        "ph": "i",
+        "s": "t",
+        "ts": (time.perf_counter_ns() - _origin_ns) / 1000,
+        "args": args,
+    })
+
+
+def flush() -> Optional[str]:
+    """💾 Grava o arquivo da sessão (atômico); retorna o caminho"""
+    if not _enabled or not _trace_file:
+        return None
+
+    with _flush_lock:
+        events = list(_events)
+        metadata = [{"name": "thread_name", "ph": "M", "pid": _pid, "tid": tid, "args": {"name": name}}
+                    for tid, name in list(_thread_names.items())]
+        metadata.append({"name": "process_name", "ph": "M", "pid": _pid, "tid": 0, "args": {"name": "SolAgent"}})
+        try:
+            directory = os.path.dirname(_trace_file)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            tmp_file = _trace_file + ".tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms",
+                           "otherData": {"dropped_events": _dropped}}, f, ensure_ascii=False)
+            os.replace(tmp_file, _trace_file)
+        except Exception as e:
+            if _log:
+                _log.error(f"❌ Erro ao salvar trace: {str(e)}")
+            return None
+    return _trace_file
+
+
+def _record(event: Dict[str, Any]) -> None:
+    global _dropped
+    if len(_events) >= _max_events:
+        _dropped += 1
+        return
+    thread = threading.current_thread()
+    event["pid"] = _pid
+    event["tid"] = thread.ident
+    if thread.ident not in _thread_names:
+        _thread_names[thread.ident] = thread.name
+    _events.append(event)  # list.append é atômico no CPython
+
+# 🎯 EXEMPLO DE USO E TESTE
+if __name__ == "__main__":
+    import tempfile
+    import timeit
+
+    print("🧭 SolAgent Tracer v1.2 - Testando...")
+
+    class LogTeste:
+        def log(self, msg): print(f"[LOG] {msg}")
+        def debug(self, msg): print(f"[DEBUG] {msg}")
+        def error(self, msg): print(f"[ERROR] {msg}")
+        def warning(self, msg): print(f"[WARNING] {msg}")
+
+    def medir() -> None:
+        with span("passo", "executor", step="obter_hora_atual"):
+            pass
+
+    desligado = timeit.timeit(medir, number=100000) / 100000 * 1e9
+    print(f"  💤 Desligado: {desligado:.0f} ns por span")
+
+    configure({"trace_enabled": True, "trace_dir": tempfile.mkdtemp()}, LogTeste())
+    ligado = timeit.timeit(medir, number=1000) / 1000 * 1e9
+    print(f"  ⏱️ Ligado: {ligado:.0f} ns por span")
+
+    trecho = start_span("interaction", "main")
+    worker = threading.Thread(target=medir, name="sol-step")
+    worker.start()
+    worker.join()
+    instant("first_token", "brain")
+    trecho.end(steps=1)
+
+    caminho = flush()
+    with open(caminho, encoding="utf-8") as f:
+        eventos = json.load(f)["traceEvents"]
+    nomes = {e["name"] for e in eventos}
+    assert {"interaction", "first_token", "thread_name", "passo"} <= nomes, nomes
+    assert any(e["name"] == "thread_name" and e["args"]["name"] == "sol-step" for e in eventos)
+    print(f"  💾 {len(eventos)} eventos em {caminho}")
+    print("\n✅ Teste concluído!")
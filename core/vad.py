@@ -0,0 +1,248 @@
+"""
+⚡ SolAgent v1.2 - VAD (Detecção de Voz)
+=======================================
+
+Separa fala de silêncio antes do Whisper - que gasta tempo
+proporcional ao tamanho do clipe, com ou sem fala nele.
+
+Funcionalidades:
+- Energia (dBFS) e taxa de cruzamentos por zero por quadro, vetorizadas
+- Histerese: a fala começa acima de um limiar e só termina abaixo de
+  outro, mais baixo (não corta no meio de uma palavra mais fraca)
+- Consoantes surdas ("s", "f", "ch") seguram a fala pela taxa de
+  cruzamentos mesmo com pouca energia
+- trim(): corta o silêncio do começo/fim e descarta clipes sem fala
+- Endpointer: detecta o fim da fala durante a gravação (modo mãos livres)
+
+Autores: Mario, GitHub Copilot & Sol (ela mesma ajudou a se criar!)
+Versão: 1.2 (Audio Revolution) - Tríade Criativa
+Data: 28/10/2025
+"""
+
+from typing import Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# 🎚️ Tamanho de cada quadro analisado
+FRAME_MS = 30
+
+# 🎚️ Limiares acima do ruído de fundo: a fala começa em START_DB e termina abaixo de STOP_DB
+START_DB = 12.0
+STOP_DB = 6.0
+
+# 🔇 Ruído de fundo (dBFS) considerado entre estes limites: abaixo do mínimo
+# é silêncio digital, acima do máximo o clipe é quase todo fala.
+# O mínimo fica perto do ruído de um microfone baixo (16 bits ~ -90 dBFS):
+# mais alto que o ruído real, ele corta fala fraca como se fosse silêncio.
+# Configuráveis: vad_min_noise_floor_db / vad_max_noise_floor_db
+MIN_NOISE_FLOOR_DB = -80.0
+MAX_NOISE_FLOOR_DB = -45.0
+
+# 🔇 Percentil da energia dos quadros tomado como ruído de fundo
+NOISE_PERCENTILE = 10
+
+# 🐍 Consoante surda: muitos cruzamentos por zero com energia um pouco acima do ruído
+ZCR_THRESHOLD = 0.25
+ZCR_MARGIN_DB = 3.0
+
+# ✂️ Margem mantida antes/depois da fala e fala mínima para o clipe valer
+PAD_MS = 150
+MIN_SPEECH_MS = 150
+
+# 🤫 Silêncio que encerra a fala no modo mãos livres
+HANDS_FREE_SILENCE_MS = 800
+
+# 📈 Quadros recentes usados pelo Endpointer para estimar o ruído (~3 s)
+NOISE_WINDOW_FRAMES = 100
+
+
+def _settings(config: Optional[dict]) -> dict:
+    config = config or {}
+    return {
+        "start_db": config.get("vad_start_db", START_DB),
+        "stop_db": config.get("vad_stop_db", STOP_DB),
+        "min_speech_ms": config.get("vad_min_speech_ms", MIN_SPEECH_MS),
+        "pad_ms": config.get("vad_pad_ms", PAD_MS),
+        "min_noise_floor_db": config.get("vad_min_noise_floor_db", MIN_NOISE_FLOOR_DB),
+        "max_noise_floor_db": config.get("vad_max_noise_floor_db", MAX_NOISE_FLOOR_DB),
+    }
+
+
+def frame_features(audio, sample_rate: int, frame_ms: int = FRAME_MS):
+    """
+    📊 Energia (dBFS) e taxa de cruzamentos por zero de cada quadro
+
+    Amostras que não completam um quadro no fim são ignoradas.
+
+    Returns:
+        tuple: (energia_db, zcr) - arrays com um valor por quadro
+    """
+    frame = max(1, int(sample_rate * frame_ms / 1000))
+    count = len(audio) // frame
+    frames = np.asarray(audio[:count * frame], dtype=np.float32).reshape(count, frame)
+    energy_db = 10.0 * np.log10(np.einsum("ij,ij->i", frames, frames) / frame + 1e-10)
+    signs = np.signbit(frames)
+    zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / frame
+    return energy_db, zcr
+
+
+def _thresholds(energy_db, settings: dict):
+    """
+    🎚️ Limiares (início, fim, consoante surda) a partir do ruído de fundo
+
+    O ruído é um percentil baixo da energia - alguns quadros de silêncio
+    digital ou de fala contínua não o puxam para os extremos.
+    """
+    noise_floor = float(np.percentile(energy_db, NOISE_PERCENTILE))
+    noise_floor = min(max(noise_floor, settings["min_noise_floor_db"]), settings["max_noise_floor_db"])
+    return (noise_floor + settings["start_db"], noise_floor + settings["stop_db"],
+            noise_floor + ZCR_MARGIN_DB)
+
+
+def speech_mask(audio, sample_rate: int, config: Optional[dict] = None):
+    """
+    🗣️ Quadros com fala (array booleano), com histerese
+
+    Um trecho contínuo acima do limiar baixo é fala se em algum ponto
+    passou do limiar alto - feito sem laço: rotula os trechos com
+    cumsum e marca os que têm um quadro "forte" com bincount.
+    """
+    settings = _settings(config)
+    energy_db, zcr = frame_features(audio, sample_rate)
+    if not energy_db.size:
+        return np.zeros(0, dtype=bool)
+
+    start, stop, unvoiced = _thresholds(energy_db, settings)
+    strong = energy_db > start
+    weak = (energy_db > stop) | ((zcr > ZCR_THRESHOLD) & (energy_db > unvoiced))
+
+    runs = np.cumsum(np.concatenate(([True], weak[1:] != weak[:-1]))) - 1
+    has_strong = np.bincount(runs, weights=strong & weak, minlength=runs[-1] + 1) > 0
+    return weak & has_strong[runs]
+
+
+def trim(audio, sample_rate: int, config: Optional[dict] = None):
+    """
+    ✂️ Corta o silêncio do começo e do fim
+
+    Returns:
+        Fatia do próprio array (sem cópia) com a fala e uma margem
+        de PAD_MS, ou None se não há fala suficiente no clipe
+    """
+    settings = _settings(config)
+    mask = speech_mask(audio, sample_rate, config)
+    frame = max(1, int(sample_rate * FRAME_MS / 1000))
+    if np.count_nonzero(mask) * FRAME_MS < settings["min_speech_ms"]:
+        return None
+
+    active = np.flatnonzero(mask)
+    pad = int(sample_rate * settings["pad_ms"] / 1000)
+    begin = max(0, int(active[0]) * frame - pad)
+    end = min(len(audio), (int(active[-1]) + 1) * frame + pad)
+    return audio[begin:end]
+
+
+class Endpointer:
+    """
+    🤫 FIM DA FALA EM TEMPO REAL (modo mãos livres)
+
+    Recebe as amostras conforme chegam (feed) e avisa quando houve
+    fala seguida de silence_ms de silêncio. O ruído de fundo vem dos
+    últimos ~3 s, acompanhando mudanças do ambiente.
+    """
+
+    def __init__(self, sample_rate: int, silence_ms: int = HANDS_FREE_SILENCE_MS,
+                 config: Optional[dict] = None):
+        self.sample_rate = sample_rate
+        self.silence_frames = max(1, int(silence_ms / FRAME_MS))
+        self.settings = _settings(config)
+        self.frame = max(1, int(sample_rate * FRAME_MS / 1000))
+        self._history = np.zeros(0, dtype=np.float32)
+        self.speech_started = False
+        self.in_speech = False
+        self.silent_frames = 0
+        self._pending = np.zeros(0, dtype=np.float32)
+
+    def feed(self, samples) -> bool:
+        """
+        🎙️ Processa amostras novas
+
+        Returns:
+            bool: True quando a fala terminou (silêncio depois de fala)
+        """
+        if self._pending.size:
+            samples = np.concatenate((self._pending, samples))
+        usable = len(samples) // self.frame * self.frame
+        self._pending = np.array(samples[usable:], dtype=np.float32)
+        energy_db, zcr = frame_features(samples[:usable], self.sample_rate)
+        if not energy_db.size:
+            return False
+        self._history = np.concatenate((self._history, energy_db))[-NOISE_WINDOW_FRAMES:]
+        start, stop, unvoiced = _thresholds(self._history, self.settings)
+
+        # Histerese quadro a quadro - poucos quadros por chamada (~50 ms de áudio)
+        for energy, crossings in zip(energy_db.tolist(), zcr.tolist()):
+            if self.in_speech:
+                self.in_speech = energy > stop or (crossings > ZCR_THRESHOLD and energy > unvoiced)
+            else:
+                self.in_speech = energy > start
+            if self.in_speech:
+                self.speech_started = True
+                self.silent_frames = 0
+            elif self.speech_started:
+                self.silent_frames += 1
+                if self.silent_frames >= self.silence_frames:
+                    return True
+        return False
+
+# 🎯 EXEMPLO DE USO E TESTE
+if __name__ == "__main__":
+    import sys
+    import time
+
+    print("🗣️ SolAgent VAD v1.2 - Testando...")
+    if not NUMPY_AVAILABLE:
+        print("⚠️ numpy não instalado - nada a testar")
+        sys.exit(0)
+
+    taxa = 16000
+    gerador = np.random.default_rng(0)
+
+    def ruido(segundos):
+        return (gerador.standard_normal(int(segundos * taxa)) * 0.001).astype(np.float32)
+
+    def fala(segundos):
+        t = np.arange(int(segundos * taxa)) / taxa
+        return (np.sin(2 * np.pi * 220 * t) * 0.3 * (1 + np.sin(2 * np.pi * 3 * t)) / 2).astype(np.float32)
+
+    clipe = np.concatenate((ruido(2.0), fala(1.0), ruido(3.0)))
+    inicio = time.perf_counter()
+    cortado = trim(clipe, taxa)
+    tempo = (time.perf_counter() - inicio) * 1000
+    assert cortado is not None and cortado.base is not None  # fatia, sem cópia
+    assert 0.9 < len(cortado) / taxa < 1.5, len(cortado) / taxa
+    print(f"  ✂️ {len(clipe) / taxa:.1f}s -> {len(cortado) / taxa:.2f}s em {tempo:.2f} ms")
+
+    assert trim(ruido(3.0), taxa) is None
+
+    # 🔈 Microfone baixo: ruído ~ -90 dBFS e fala fraca (pico ~ -57 dBFS)
+    baixo = np.concatenate((ruido(2.0) * 0.03, fala(1.0) * (0.002 / 0.3), ruido(3.0) * 0.03))
+    cortado = trim(baixo, taxa)
+    assert cortado is not None and 0.9 < len(cortado) / taxa < 1.5, cortado
+    assert trim(baixo, taxa, {"vad_min_noise_floor_db": -67.0}) is None  # limite antigo cortava a fala
+    assert trim(np.zeros(taxa, dtype=np.float32), taxa) is None
+
+    # 🤫 Mãos livres: termina ~800 ms depois da fala, em blocos de 1024
+    detector = Endpointer(taxa)
+    fim = None
+    for posicao in range(0, len(clipe), 1024):
+        if detector.feed(clipe[posicao:posicao + 1024]):
+            fim = (posicao + 1024) / taxa
+            break
+    assert fim is not None and 3.6 < fim < 4.0, fim
+    print(f"  🤫 Fala terminou em {fim:.2f}s (fala até 3.00s)")
+    print("\n✅ Teste concluído!")
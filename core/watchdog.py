@@ -0,0 +1,233 @@
+"""
+⚡ SolAgent v1.2 - Watchdog (Tempo Limite e Cancelamento de Passos)
+=================================================================
+
+Protege o loop principal de passos travados: cada passo do Executor
+roda em uma thread vigiada, com tempo limite e cancelamento.
+Um passo preso não prende mais a Sol - a sessão (e o Whisper já
+carregado) continuam vivos.
+
+Funcionalidades:
+- Tempo limite por ação (coluna "timeout" do registro, "step_timeouts"
+  e "step_timeout_seconds" na configuração)
+- Ctrl+C ou tecla de atalho (Esc) cancelam só o plano atual
+- Cancelamento cooperativo: o passo recebe um threading.Event
+  (comandos do sistema e leituras de pasta param sozinhos)
+- Processos abertos por um passo cancelado/expirado são encerrados
+
+Autores: Mario, GitHub Copilot & Sol (ela mesma ajudou a se criar!)
+Versão: 1.2 (Audio Revolution) - Tríade Criativa
+Data: 28/10/2025
+"""
+
+import threading
+import time
+from typing import Any, Callable, Optional, Tuple
+
+from core import command_registry, process_runner
+
+try:
+    import keyboard
+    KEYBOARD_AVAILABLE = True
+except ImportError:
+    KEYBOARD_AVAILABLE = False
+
+# ⏱️ Tempo limite padrão de um passo (segundos)
+DEFAULT_STEP_TIMEOUT = 30
+
+# 🔁 Intervalo em que a thread que espera confere cancelamento/tempo
+POLL_SECONDS = 0.1
+
+# 🕊️ Tempo para o passo parar sozinho depois do aviso de cancelamento
+GRACE_SECONDS = 0.5
+
+# 🛑 Cancelamento do plano atual (Ctrl+C ou tecla de atalho)
+_plan_cancel = threading.Event()
+_local = threading.local()
+
+
+class StepContext:
+    """
+    🧾 Estado de um passo vigiado
+
+    - cancel_event: sinalizado quando o passo expira ou o plano é cancelado
+    - processes: processos abertos pelo passo (encerrados se ele for abortado)
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.cancel_event = threading.Event()
+        self.processes = []
+        self._lock = threading.Lock()
+
+    def track(self, proc) -> None:
+        with self._lock:
+            self.processes.append(proc)
+
+    def kill_processes(self) -> int:
+        """🛑 Encerra os processos do passo que ainda rodam; retorna quantos"""
+        with self._lock:
+            processes, self.processes = self.processes, []
+        killed = 0
+        for proc in processes:
+            if proc.poll() is None:
+                process_runner.kill_tree(proc)
+                killed += 1
+        return killed
+
+
+def current() -> Optional[StepContext]:
+    """🧾 Contexto do passo que roda nesta thread (None fora do Executor)"""
+    return getattr(_local, "context", None)
+
+
+def cancel_event() -> Optional[threading.Event]:
+    """🛑 Evento de cancelamento do passo atual (para process_runner etc.)"""
+    context = current()
+    return context.cancel_event if context else None
+
+
+def track_process(proc) -> None:
+    """📌 Registra um processo aberto pelo passo atual (subprocess.Popen)"""
+    context = current()
+    if context:
+        context.track(proc)
+
+
+def request_cancel() -> None:
+    """🛑 Cancela o plano em execução (os próximos passos não rodam)"""
+    _plan_cancel.set()
+
+
+def reset() -> None:
+    """🔄 Novo plano: esquece cancelamentos anteriores"""
+    _plan_cancel.clear()
+
+
+def is_cancelled() -> bool:
+    return _plan_cancel.is_set()
+
+
+def step_timeout(verb: str, config: Optional[dict] = None) -> float:
+    """
+    ⏱️ Tempo limite de um comando
+
+    Ordem: config["step_timeouts"][comando] > coluna "timeout" do
+    registro > config["step_timeout_seconds"] > DEFAULT_STEP_TIMEOUT
+    """
+    config = config or {}
+    overrides = config.get("step_timeouts") or {}
+    if verb in overrides:
+        return float(overrides[verb])
+    spec = command_registry.COMMANDS.get(verb) or {}
+    if "timeout" in spec:
+        return float(spec["timeout"])
+    return float(config.get("step_timeout_seconds", DEFAULT_STEP_TIMEOUT))
+
+
+def run_guarded(func: Callable[[], Any], timeout: float, name: str = "passo") -> Tuple[str, Any]:
+    """
+    🐕 Roda func em uma thread vigiada e espera com tempo limite
+
+    Ctrl+C durante a espera cancela o plano (não derruba a sessão).
+    Exceções de func são repassadas para quem chamou.
+
+    Returns:
+        tuple: ("done", retorno de func), ("timeout", processos encerrados)
+               ou ("cancelled", processos encerrados)
+    """
+    context = StepContext(name)
+    box = {}
+    finished = threading.Event()
+
+    def target() -> None:
+        _local.context = context
+        try:
+            box["value"] = func()
+        except BaseException as e:
+            box["error"] = e
+        finally:
+            finished.set()
+
+    deadline = time.monotonic() + timeout if timeout else None
+    thread = threading.Thread(target=target, name=f"sol-step-{name}", daemon=True)
+    thread.start()
+
+    status = "done"
+    while not finished.is_set():
+        if _plan_cancel.is_set():
+            status = "cancelled"
+            break
+        if deadline is not None and time.monotonic() >= deadline:
+            status = "timeout"
+            break
+        try:
+            finished.wait(POLL_SECONDS)
+        except KeyboardInterrupt:
+            request_cancel()
+
+    if status != "done":
+        # Avisa o passo, dá um instante para ele parar e encerra o que ele abriu
+        context.cancel_event.set()
+        finished.wait(GRACE_SECONDS)
+        return status, context.kill_processes()
+
+    if "error" in box:
+        raise box["error"]
+    return status, box.get("value")
+
+
+def install_hotkey(config: dict, log) -> bool:
+    """⌨️ Registra a tecla que cancela o plano atual ("cancel_hotkey", padrão Esc)"""
+    key = config.get("cancel_hotkey", "esc")
+    if not key or not KEYBOARD_AVAILABLE:
+        return False
+    try:
+        keyboard.add_hotkey(key, request_cancel)
+    except Exception as e:
+        # Ex.: Linux sem permissão para ler o teclado
+        log.debug(f"⌨️ Tecla de cancelamento indisponível: {str(e)}")
+        return False
+    log.debug(f"⌨️ '{key}' cancela o plano em execução")
+    return True
+
+# 🎯 EXEMPLO DE USO E TESTE
+if __name__ == "__main__":
+    import subprocess
+    import sys
+
+    print("🐕 SolAgent Watchdog v1.2 - Testando...")
+
+    assert run_guarded(lambda: 42, timeout=1) == ("done", 42)
+
+    # Passo travado: expira e o processo aberto por ele é encerrado
+    def passo_travado():
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        track_process(proc)
+        time.sleep(30)
+
+    inicio = time.perf_counter()
+    status, encerrados = run_guarded(passo_travado, timeout=0.5, name="travado")
+    assert (status, encerrados) == ("timeout", 1), (status, encerrados)
+    print(f"  ⏰ Expirou em {time.perf_counter() - inicio:.1f}s, {encerrados} processo(s) encerrado(s)")
+
+    # Cancelamento cooperativo: o passo para ao ver o evento
+    def passo_cooperativo():
+        cancel_event().wait(30)
+        return "parou"
+
+    threading.Timer(0.3, request_cancel).start()
+    assert run_guarded(passo_cooperativo, timeout=10) == ("cancelled", 0)
+    assert is_cancelled()
+    reset()
+
+    # Exceção do passo chega em quem chamou
+    try:
+        run_guarded(lambda: 1 / 0, timeout=1)
+        raise AssertionError("exceção não repassada")
+    except ZeroDivisionError:
+        pass
+
+    assert step_timeout("obter_hora_atual") == DEFAULT_STEP_TIMEOUT
+    assert step_timeout("obter_hora_atual", {"step_timeouts": {"obter_hora_atual": 2}}) == 2
+    print("\n✅ Teste concluído!")
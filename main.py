@@ -17,7 +17,8 @@ Data: 28/10/2025
 """
 
 import json
-from core import brain_commercial as brain, executor_commercial as executor, confirm, logger
+import threading
+from core import brain_commercial as brain, executor_commercial as executor, confirm, logger, file_index, metrics_sampler, plan_optimizer, side_effects, tracer, watchdog
 
 # Sistema de áudio + histórico - com fallback gracioso
 try:
@@ -40,6 +41,7 @@ def load_config():
 def main():
     config = load_config()
     log = logger.Logger(debug_mode=config.get("debug_mode", False))
+    tracer.configure(config, log)
     
     # 🎤 Inicializa sistemas de áudio
     audio_input = None
@@ -49,6 +51,7 @@ def main():
         try:
             audio_input = AudioInput(config, log)
             audio_output = AudioOutput(config, log)
+            audio_input.on_recording_start = lambda: brain.prewarm_connection(config, log)
             log.log("🎵 Sistemas de áudio inicializados")
         except Exception as e:
             log.warning(f"⚠️ Erro ao inicializar áudio: {str(e)}")
@@ -63,6 +66,22 @@ def main():
         except Exception as e:
             log.warning(f"⚠️ Erro ao inicializar histórico: {str(e)}")
     
+    # 🗂️ Índice de arquivos (buscar_arquivo) - atualizado em segundo plano
+    try:
+        if file_index.start(config, log):
+            log.log("🗂️ Indexação de arquivos iniciada em segundo plano")
+    except Exception as e:
+        log.warning(f"⚠️ Erro ao iniciar índice de arquivos: {str(e)}")
+    
+    # 📡 Monitor do sistema (mostrar_status_sistema responde na hora)
+    try:
+        metrics_sampler.start(config, log)
+    except Exception as e:
+        log.warning(f"⚠️ Erro ao iniciar monitor do sistema: {str(e)}")
+    
+    # ⌨️ Tecla que cancela o plano em execução (além do Ctrl+C)
+    cancel_hotkey_active = watchdog.install_hotkey(config, log)
+    
     # 🌟 Banner de inicialização
     print("🌟 ═══════════════════════════════════════════════════════════")
     print("🌟   SolAgent v1.2 - Assistente Inteligente com Voz")
@@ -77,14 +96,15 @@ def main():
     print("\n� Status dos Sistemas:")
     print(f"  🔒 Modo: {'SEGURO (simulação)' if safe_mode else 'EXECUÇÃO REAL'}")
     print(f"  🧠 IA: {'OpenAI configurada' if openai_configured else 'Modo demonstração'}")
-    print(f"  🎤 Entrada de voz: {'✅ Disponível' if voice_input_available else '❌ Indisponível'}")  
+    print(f"  🎤 Entrada de voz: {audio_input.status_text() if audio_input else '❌ Indisponível'}")  
     print(f"  🔊 Saída de voz: {'✅ Disponível' if voice_output_available else '❌ Indisponível'}")
     
     # 💡 Instruções
     if voice_input_available:
-        push_key = config.get("push_to_talk_key", "space").upper()
         print(f"\n💡 Como usar:")
-        print(f"  🎤 Pressione e segure '{push_key}' para falar")
+        print(f"  🎤 {audio_input.key_hint()}")
+        if not audio_input.is_ready():
+            print(f"     (o Whisper termina de carregar em segundo plano - fala gravada antes disso fica na fila)")
         print(f"  ✍️ Ou digite normalmente")
         print(f"  📝 Comandos especiais: 'sair', 'config', 'modo', 'teste_audio', 'historico'")
     else:
@@ -93,11 +113,12 @@ def main():
         print(f"  📝 Comandos: 'sair', 'config', 'modo', 'historico'")
         
         if AUDIO_SYSTEM_AVAILABLE:
-            print(f"  🎵 Para ativar voz, instale: pip install sounddevice soundfile numpy openai-whisper keyboard pyttsx3")
+            print(f"  🎵 Para ativar voz, instale: pip install sounddevice numpy openai-whisper keyboard pyttsx3")
 
     # 🔄 Loop principal híbrido (texto + voz)
     while True:
         user_input = None
+        voice_input_available = audio_input and audio_input.is_available()  # Whisper pode ter falhado ao carregar
         
         # 🎯 Captura entrada (voz ou texto)
         if voice_input_available:
@@ -105,6 +126,7 @@ def main():
         
         # Fallback texto se não capturou voz
         if not user_input:
+            brain.prewarm_connection(config, log)
             try:
                 user_input = input("\n💬 Você: ").strip()
             except (EOFError, KeyboardInterrupt):
@@ -141,42 +163,111 @@ def main():
 
         # 🧠 Processamento principal
         execution_result = "unknown"
+        step_results = None
         input_method = "voice" if voice_input_available and user_input else "text"
         response_method = "both" if voice_output_available else "text"
+        interaction_span = tracer.start_span("interaction", "main", input_method=input_method)
         
         try:
-            plan = brain.generate_plan(user_input, config, log)
+            # 📡 Streaming: explicação e passos aparecem enquanto a IA ainda gera
+            streamed = {"explicacao": None, "passos": []}
+            speech_thread = None
+            
+            def on_explanation(text):
+                nonlocal speech_thread
+                streamed["explicacao"] = text
+                print(f"\n🌟 Sol: {text}")
+                if voice_output_available:
+                    speech_thread = threading.Thread(target=audio_output.speak, args=(text,), daemon=True)
+                    speech_thread.start()
+            
+            def on_step(step):
+                if not streamed["passos"]:
+                    print("\n📝 Plano de ação:")
+                streamed["passos"].append(step)
+                print(f"  {len(streamed['passos'])}. {step}")
             
-            # 🗣️ Resposta da Sol (visual + voz)
+            with tracer.span("generate_plan", "brain"):
+                plan = brain.generate_plan(user_input, config, log, on_explanation, on_step)
+            
+            # 🗣️ Resposta da Sol (visual + voz) - se não veio pelo streaming
             response_text = plan['explicacao']
-            print(f"\n🌟 Sol: {response_text}")
+            if response_text != streamed["explicacao"]:
+                print(f"\n🌟 Sol: {response_text}")
+                
+                if voice_output_available:
+                    if speech_thread:
+                        speech_thread.join()
+                    audio_output.speak(response_text)
             
-            if voice_output_available:
-                audio_output.speak(response_text)
+            if speech_thread:
+                speech_thread.join()
+            
+            # ✂️ Otimiza o plano antes da confirmação (passos repetidos/implícitos)
+            optimization = None
+            if config.get("plan_optimizer_enabled", True) and plan["passos"]:
+                plan, optimization = plan_optimizer.optimize_plan(plan)
+                for step, reason in optimization["removed"]:
+                    log.debug(f"✂️ Passo removido: {step} ({reason})")
             
             # 📝 Mostra plano de ação
             if plan["passos"]:
-                print("\n📝 Plano de ação:")
-                for i, step in enumerate(plan["passos"], start=1):
-                    print(f"  {i}. {step}")
+                if plan["passos"] != streamed["passos"]:
+                    print("\n📝 Plano de ação otimizado:" if optimization and optimization["removed"] else "\n📝 Plano de ação:")
+                    for i, step in enumerate(plan["passos"], start=1):
+                        print(f"  {i}. {step}")
+                    if optimization and optimization["removed"]:
+                        print(f"  ✂️ {len(optimization['removed'])} passo(s) desnecessário(s) removido(s)", end="")
+                        if optimization["launches_after"] < optimization["launches_before"]:
+                            print(f" - processos abertos: {optimization['launches_before']} → {optimization['launches_after']}")
+                        else:
+                            print()
 
                 # 🤔 Confirmação (com voz se disponível)
-                if confirm.ask_user_confirmation():
+                with tracer.span("confirmation_wait", "main"):
+                    confirmed = confirm.ask_user_confirmation()
+                if confirmed:
                     execution_msg = "Perfeito! Executando agora..."
                     print(f"\n⚡ {execution_msg}")
                     
                     if voice_output_available:
                         audio_output.speak("Executando!")
                     
-                    executor.execute_steps(plan["passos"], log, config)
+                    cancel_keys = "Ctrl+C" + (f" ou {config.get('cancel_hotkey', 'esc').upper()}" if cancel_hotkey_active else "")
+                    print(f"   ({cancel_keys} cancela o plano)")
                     
-                    completion_msg = "Pronto! Tarefa concluída com sucesso!"
-                    print(f"✅ {completion_msg}")
+                    step_results = executor.execute_steps(plan["passos"], log, config, plan.get("depends_on"))
+                    failed_steps = [r for r in step_results if r["status"] != "success"]
                     
-                    if voice_output_available:
-                        audio_output.speak("Concluído!")
+                    # 🔒 Modo seguro: o que a execução real faria e quanto levaria
+                    if config.get("safe_mode", True) and config.get("dry_run_report", True):
+                        print(side_effects.build_report(
+                            step_results, command_history.get_step_stats() if command_history else None))
                     
-                    execution_result = "success"
+                    if any(r["status"] == "cancelled" for r in step_results):
+                        print("🚫 Plano cancelado - os passos restantes não foram executados.")
+                        
+                        if voice_output_available:
+                            audio_output.speak("Plano cancelado.")
+                        
+                        execution_result = "cancelled"
+                    elif not failed_steps:
+                        completion_msg = "Pronto! Tarefa concluída com sucesso!"
+                        print(f"✅ {completion_msg}")
+                        
+                        if voice_output_available:
+                            audio_output.speak("Concluído!")
+                        
+                        execution_result = "success"
+                    else:
+                        print(f"⚠️ {len(failed_steps)} de {len(step_results)} passo(s) não deram certo:")
+                        for r in failed_steps:
+                            print(f"  • {r['step']}" + (f" - {r['error']}" if r["error"] else ""))
+                        
+                        if voice_output_available:
+                            audio_output.speak("Concluído, mas alguns passos falharam.")
+                        
+                        execution_result = "partial" if len(failed_steps) < len(step_results) else "error"
                         
                 else:
                     cancel_msg = "Tudo bem, não executei nada."
@@ -190,6 +281,11 @@ def main():
                 # Sem ações - só resposta
                 execution_result = "info_only"
                     
+        except KeyboardInterrupt:
+            # Ctrl+C fora da execução (ex.: gerando o plano): cancela só esta interação
+            print("\n🚫 Cancelado. Pode mandar o próximo comando!")
+            execution_result = "cancelled"
+        
         except Exception as e:
             error_msg = f"Ops! Houve um erro: {str(e)}"
             log.error(f"Erro durante execução: {str(e)}")
@@ -207,8 +303,13 @@ def main():
                 plan if 'plan' in locals() else {"explicacao": "Erro", "passos": []},
                 execution_result,
                 input_method,
-                response_method
+                response_method,
+                step_results
             )
+        
+        # 🧭 Fecha a linha do tempo da interação (só grava com trace_enabled)
+        interaction_span.end(result=execution_result)
+        tracer.flush()
 
 def show_config_status(config, voice_input_available=False, voice_output_available=False):
     """📊 Mostra status completo do sistema"""
@@ -223,6 +324,7 @@ def show_config_status(config, voice_input_available=False, voice_output_availab
         push_key = config.get('push_to_talk_key', 'space')
         whisper_model = config.get('whisper_model', 'tiny')
         print(f"  🎯 Push-to-talk: '{push_key.upper()}'")
+        print(f"  🤫 Mãos livres: {'ATIVO' if config.get('hands_free', False) else 'DESATIVO'} | VAD: {'ATIVO' if config.get('vad_enabled', True) else 'DESATIVO'}")
         print(f"  🧠 Modelo Whisper: '{whisper_model}'")
     
     if voice_output_available:
@@ -312,7 +414,17 @@ def show_history_report(command_history):
                 status = "✅" if cmd["result"] == "success" else "❌" if cmd["result"] == "error" else "⏸️"
                 method = "🎤" if cmd["method"] == "voice" else "✍️"
                 print(f"  {status} {method} {cmd['time']} - {cmd['input']}")
-        
+
+        # Cache de planos da IA
+        cache_stats = brain.get_plan_cache_stats()
+        if cache_stats.get("enabled"):
+            session = cache_stats["session"]
+            total = cache_stats["total"]
+            print(f"\n🗃️ CACHE DE PLANOS:")
+            print(f"  • Entradas salvas: {cache_stats['entries']}")
+            print(f"  • Sessão: {session['memory_hits'] + session['disk_hits']} acertos, {session['misses']} falhas ({cache_stats['session_hit_rate']:.1f}%)")
+            print(f"  • Acumulado: {total['memory_hits'] + total['disk_hits']} acertos, {total['misses']} falhas ({cache_stats['total_hit_rate']:.1f}%)")
+
     except Exception as e:
         print(f"❌ Erro ao gerar relatório: {str(e)}")
 